@@ -0,0 +1,11 @@
+"""
+Benchmarks of the quantization process, run from the root of the repository.
+"""
+
+from .generators import JitterGenerator
+from .suites import BenchmarkSuite
+
+__all__ = [
+    "BenchmarkSuite",
+    "JitterGenerator",
+]
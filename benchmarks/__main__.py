@@ -0,0 +1,4 @@
+from .suites import BenchmarkSuite
+
+if __name__ == "__main__":
+    BenchmarkSuite.main()
@@ -0,0 +1,151 @@
+import random
+
+import nauert
+
+
+class JitterGenerator:
+    """
+    Jitter generator.
+
+    Generates performances of ``beat_count`` beats, with about ``density``
+    attacks per beat, timed the way a human might play them: the tempo drifts
+    from beat to beat as a random walk, each attack strays from its evenly
+    spaced position by a Gaussian deviation of ``jitter`` times the space
+    between attacks, and each attack is a rest with probability
+    ``rest_probability``.
+
+    Performances depend only on ``seed`` and the arguments of each call.
+
+    ..  container:: example
+
+        >>> generator = benchmarks.JitterGenerator(seed=1)
+        >>> generator.make_pairs(beat_count=2, density=2)
+        [(314, None), (330, None), (232, 1), (1174, 12)]
+
+        >>> q_event_sequence = generator(beat_count=2, density=2)
+        >>> q_event_sequence.duration_in_ms
+        Duration(2050, 1)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_beat_duration",
+        "_drift",
+        "_jitter",
+        "_rest_probability",
+        "_seed",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        seed: int = 0,
+        beat_duration: int = 1000,
+        jitter: float = 0.1,
+        drift: float = 0.02,
+        rest_probability: float = 0.1,
+    ) -> None:
+        assert isinstance(seed, int), repr(seed)
+        assert isinstance(beat_duration, int) and 0 < beat_duration
+        assert 0 <= jitter, repr(jitter)
+        assert 0 <= drift, repr(drift)
+        assert 0 <= rest_probability < 1, repr(rest_probability)
+        self._beat_duration = beat_duration
+        self._drift = drift
+        self._jitter = jitter
+        self._rest_probability = rest_probability
+        self._seed = seed
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, beat_count: int, density: float = 2) -> nauert.QEventSequence:
+        """
+        Calls jitter generator.
+
+        Returns ``QEventSequence``.
+        """
+        pairs = self.make_pairs(beat_count, density)
+        return nauert.QEventSequence.from_millisecond_pitch_pairs(pairs)
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        return "{}(seed={})".format(type(self).__name__, self.seed)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def beat_duration(self) -> int:
+        """
+        Gets duration in milliseconds of beats before drifting.
+        """
+        return self._beat_duration
+
+    @property
+    def drift(self) -> float:
+        """
+        Gets standard deviation of tempo change from beat to beat, as ratio
+        of tempo.
+        """
+        return self._drift
+
+    @property
+    def jitter(self) -> float:
+        """
+        Gets standard deviation of attacks, as ratio of space between
+        attacks.
+        """
+        return self._jitter
+
+    @property
+    def rest_probability(self) -> float:
+        """
+        Gets probability of each attack being a rest.
+        """
+        return self._rest_probability
+
+    @property
+    def seed(self) -> int:
+        """
+        Gets seed.
+        """
+        return self._seed
+
+    ### PUBLIC METHODS ###
+
+    def make_pairs(
+        self, beat_count: int, density: float = 2
+    ) -> list[tuple[int, int | None]]:
+        """
+        Makes (millisecond duration, pitch) pairs, with none for rests;
+        pitches lie within an octave of middle C, which is ``0``.
+        """
+        assert isinstance(beat_count, int) and 0 < beat_count, repr(beat_count)
+        assert 0 < density, repr(density)
+        generator = random.Random(self.seed)
+        onsets = []
+        offset, beat_duration = 0.0, float(self.beat_duration)
+        for _ in range(beat_count):
+            beat_duration *= 1 + generator.gauss(0, self.drift)
+            beat_duration = min(
+                max(beat_duration, self.beat_duration / 2), self.beat_duration * 2
+            )
+            count = max(1, round(generator.gauss(density, density / 4)))
+            space = beat_duration / count
+            for i in range(count):
+                onset = offset + i * space + generator.gauss(0, self.jitter * space)
+                onsets.append(max(round(onset), 0))
+            offset += beat_duration
+        onsets = sorted(set(onsets))
+        onsets.append(max(round(offset), onsets[-1] + 1))
+        pairs: list[tuple[int, int | None]] = []
+        for start, stop in zip(onsets, onsets[1:]):
+            pitch = None
+            if self.rest_probability <= generator.random():
+                pitch = generator.randint(-12, 12)
+            pairs.append((stop - start, pitch))
+        return pairs
@@ -0,0 +1,447 @@
+import argparse
+import copy
+import datetime
+import fnmatch
+import functools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import typing
+
+import abjad
+
+import nauert
+
+from . import generators as _generators
+
+
+class _CapturingHeuristic(nauert.DistanceHeuristic):
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("q_target_beats",)
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, q_target_beats):
+        self.q_target_beats = q_target_beats
+        return super().__call__(q_target_beats)
+
+
+class _CapturingJobHandler(nauert.SerialJobHandler):
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("jobs",)
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, jobs):
+        # keeps copies of jobs before searching them
+        self.jobs = copy.deepcopy(list(jobs))
+        return super().__call__(jobs)
+
+
+class BenchmarkSuite:
+    """
+    Benchmark suite.
+
+    Times the parts of the quantization process on performances made by a
+    seeded ``JitterGenerator``, so that runs with equal settings time equal
+    work:
+
+        * ``quantization_job/*``: ``QuantizationJob`` on beats of increasing
+          density;
+
+        * ``search_tree/*``: ``QuantizationJob`` with unweighted and weighted
+          search tree definitions;
+
+        * ``job_handler/*``: ``SerialJobHandler`` and ``ParallelJobHandler``
+          on the same jobs;
+
+        * ``heuristic/*``: ``DistanceHeuristic`` on searched beats;
+
+        * ``notation/*``: ``MeasurewiseQTarget`` selection and notation of
+          searched beats;
+
+        * ``attack_point_optimizer/*``: ``MeasurewiseAttackPointOptimizer``
+          and ``NaiveAttackPointOptimizer`` on quantized voices.
+
+    Each benchmark is set up anew, untimed, before each of ``repeat`` timed
+    runs. Notation is timed by a ``TimingRecorder``, from the selection of
+    ``QGrids`` onwards, leaving out the search which precedes it.
+
+    ..  container:: example
+
+        >>> suite = benchmarks.BenchmarkSuite(beat_count=2, repeat=1)
+        >>> results = suite("heuristic/*")
+        >>> for name, result in results["benchmarks"].items():
+        ...     print(name, len(result["times"]))
+        ...
+        heuristic/distance 1
+
+        >>> results["metadata"]["seed"]
+        0
+
+    Run the suite from the root of the repository with
+    ``python -m benchmarks``, writing results to a JSON file, and compare
+    later results against that file with ``--compare``.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_beat_count", "_repeat", "_seed")
+
+    _densities = (1, 2, 3, 4)
+
+    _density = 2
+
+    ### INITIALIZER ###
+
+    def __init__(self, seed: int = 0, beat_count: int = 4, repeat: int = 3) -> None:
+        assert isinstance(seed, int), repr(seed)
+        assert isinstance(beat_count, int) and 0 < beat_count, repr(beat_count)
+        assert isinstance(repeat, int) and 0 < repeat, repr(repeat)
+        self._beat_count = beat_count
+        self._repeat = repeat
+        self._seed = seed
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self, pattern: str = "*") -> dict:
+        """
+        Runs benchmarks whose name matches ``pattern``.
+
+        Returns results as JSON-compatible dictionary.
+        """
+        benchmarks = {}
+        for name, make in self._make_benchmarks():
+            if not fnmatch.fnmatchcase(name, pattern):
+                continue
+            count, setup, run = make()
+            times = []
+            for _ in range(self.repeat):
+                arguments = setup()
+                start = time.perf_counter()
+                elapsed_time = run(*arguments)
+                stop = time.perf_counter()
+                if elapsed_time is None:
+                    elapsed_time = stop - start
+                times.append(elapsed_time)
+            benchmarks[name] = {
+                "count": count,
+                "mean": statistics.mean(times),
+                "median": statistics.median(times),
+                "minimum": min(times),
+                "times": times,
+            }
+        return {"benchmarks": benchmarks, "metadata": self._get_metadata()}
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        return "{}(seed={}, beat_count={}, repeat={})".format(
+            type(self).__name__, self.seed, self.beat_count, self.repeat
+        )
+
+    ### PRIVATE METHODS ###
+
+    def _get_metadata(self) -> dict:
+        try:
+            commit = subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                capture_output=True,
+                check=True,
+                cwd=os.path.dirname(os.path.abspath(__file__)),
+                text=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            "beat_count": self.beat_count,
+            "commit": commit,
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "nauert": nauert.__version__,
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "repeat": self.repeat,
+            "seed": self.seed,
+        }
+
+    def _make_attack_point_optimizer_benchmarks(self) -> list[tuple]:
+        time_signature = abjad.TimeSignature((4, 4))
+
+        @functools.cache
+        def make_voice():
+            q_event_sequence = _generators.JitterGenerator(self.seed)(
+                self.beat_count, self._density
+            )
+            attack_point_optimizer = nauert.NullAttackPointOptimizer()
+            return nauert.quantize(
+                q_event_sequence, attack_point_optimizer=attack_point_optimizer
+            )
+
+        def setup():
+            return (abjad.mutate.copy(make_voice()),)
+
+        def measurewise(voice):
+            attack_point_optimizer = nauert.MeasurewiseAttackPointOptimizer()
+            for measure in voice:
+                attack_point_optimizer(measure, time_signature)
+
+        def naive(voice):
+            nauert.NaiveAttackPointOptimizer()(voice)
+
+        return [
+            (
+                "attack_point_optimizer/measurewise",
+                lambda: (len(make_voice()), setup, measurewise),
+            ),
+            (
+                "attack_point_optimizer/naive",
+                lambda: (len(make_voice()), setup, naive),
+            ),
+        ]
+
+    def _make_benchmarks(self) -> list[tuple]:
+        return [
+            *self._make_quantization_job_benchmarks(),
+            *self._make_search_tree_benchmarks(),
+            *self._make_job_handler_benchmarks(),
+            *self._make_heuristic_benchmarks(),
+            *self._make_notation_benchmarks(),
+            *self._make_attack_point_optimizer_benchmarks(),
+        ]
+
+    def _make_heuristic_benchmarks(self) -> list[tuple]:
+        def make():
+            q_event_sequence = _generators.JitterGenerator(self.seed)(
+                self.beat_count, self._density
+            )
+            heuristic = _CapturingHeuristic()
+            q_schema = nauert.BeatwiseQSchema()
+            nauert.quantize(q_event_sequence, q_schema=q_schema, heuristic=heuristic)
+            beats = heuristic.q_target_beats
+            return len(beats), lambda: (beats,), distance
+
+        def distance(beats):
+            nauert.DistanceHeuristic()(beats)
+
+        return [("heuristic/distance", make)]
+
+    def _make_job_handler_benchmarks(self) -> list[tuple]:
+        @functools.cache
+        def make_jobs():
+            return self._make_jobs(self._density, nauert.UnweightedSearchTree())
+
+        def parallel(jobs):
+            nauert.ParallelJobHandler()(jobs)
+
+        def serial(jobs):
+            nauert.SerialJobHandler()(jobs)
+
+        return [
+            (
+                "job_handler/parallel",
+                lambda: (len(make_jobs()), lambda: (make_jobs(),), parallel),
+            ),
+            (
+                "job_handler/serial",
+                lambda: (len(make_jobs()), lambda: (make_jobs(),), serial),
+            ),
+        ]
+
+    def _make_jobs(
+        self, density: int, search_tree: nauert.SearchTree
+    ) -> list[nauert.QuantizationJob]:
+        q_event_sequence = _generators.JitterGenerator(self.seed)(
+            self.beat_count, density
+        )
+        q_schema = nauert.BeatwiseQSchema(search_tree=search_tree)
+        job_handler = _CapturingJobHandler()
+        nauert.quantize(q_event_sequence, q_schema=q_schema, job_handler=job_handler)
+        return job_handler.jobs
+
+    def _make_notation_benchmarks(self) -> list[tuple]:
+        q_schema = nauert.MeasurewiseQSchema()
+        stages = [
+            "heuristic",
+            "rebind_duplicates",
+            "shift_downbeats",
+            "regroup",
+            "notate",
+            "handle_orphans",
+        ]
+
+        def make():
+            q_event_sequence = _generators.JitterGenerator(self.seed)(
+                self.beat_count, self._density
+            )
+            count = len(q_schema(q_event_sequence.duration_in_ms).beats)
+
+            def setup():
+                q_target = q_schema(q_event_sequence.duration_in_ms)
+                return q_target, q_event_sequence
+
+            return count, setup, measurewise
+
+        def measurewise(q_target, q_event_sequence):
+            recorder = nauert.TimingRecorder()
+            q_target(
+                q_event_sequence,
+                attack_point_optimizer=nauert.NullAttackPointOptimizer(),
+                recorder=recorder,
+            )
+            durations = recorder.get_durations()
+            return sum(durations[_] for _ in stages)
+
+        return [("notation/measurewise", make)]
+
+    def _make_quantization_job_benchmarks(self) -> list[tuple]:
+        return [
+            (
+                "quantization_job/density={}".format(density),
+                functools.partial(
+                    self._make_search_benchmark,
+                    density,
+                    nauert.UnweightedSearchTree(),
+                ),
+            )
+            for density in self._densities
+        ]
+
+    def _make_search_benchmark(
+        self, density: int, search_tree: nauert.SearchTree
+    ) -> tuple:
+        jobs = self._make_jobs(density, search_tree)
+        return len(jobs), lambda: (jobs,), self._run_jobs
+
+    def _make_search_tree_benchmarks(self) -> list[tuple]:
+        search_trees = [
+            ("unweighted", nauert.UnweightedSearchTree()),
+            (
+                "unweighted_binary",
+                nauert.UnweightedSearchTree({2: {2: {2: {2: None}}}}),
+            ),
+            (
+                "weighted_deep",
+                nauert.WeightedSearchTree(
+                    {"divisors": (2, 3), "max_depth": 3, "max_divisions": 2}
+                ),
+            ),
+            (
+                "weighted_shallow",
+                nauert.WeightedSearchTree(
+                    {"divisors": (2, 3), "max_depth": 2, "max_divisions": 2}
+                ),
+            ),
+        ]
+        return [
+            (
+                "search_tree/{}".format(name),
+                functools.partial(
+                    self._make_search_benchmark, self._density, search_tree
+                ),
+            )
+            for name, search_tree in search_trees
+        ]
+
+    @staticmethod
+    def _run_jobs(jobs: typing.Sequence[nauert.QuantizationJob]) -> None:
+        for job in jobs:
+            job()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def beat_count(self) -> int:
+        """
+        Gets number of beats of each generated performance.
+        """
+        return self._beat_count
+
+    @property
+    def repeat(self) -> int:
+        """
+        Gets number of timed runs of each benchmark.
+        """
+        return self._repeat
+
+    @property
+    def seed(self) -> int:
+        """
+        Gets seed of jitter generator.
+        """
+        return self._seed
+
+    ### PUBLIC METHODS ###
+
+    @staticmethod
+    def compare(baseline: dict, results: dict) -> list[tuple[str, float, float, float]]:
+        """
+        Compares minimum times of benchmarks found in both ``baseline`` and
+        ``results``.
+
+        Returns (name, baseline time, time, ratio) tuples.
+
+        ..  container:: example
+
+            >>> baseline = {"benchmarks": {"a": {"minimum": 2.0}, "b": {"minimum": 1.0}}}
+            >>> results = {"benchmarks": {"a": {"minimum": 3.0}, "c": {"minimum": 1.0}}}
+            >>> benchmarks.BenchmarkSuite.compare(baseline, results)
+            [('a', 2.0, 3.0, 1.5)]
+
+        """
+        comparisons = []
+        for name, result in results["benchmarks"].items():
+            if name not in baseline["benchmarks"]:
+                continue
+            before = baseline["benchmarks"][name]["minimum"]
+            after = result["minimum"]
+            comparisons.append((name, before, after, after / before))
+        return comparisons
+
+    @staticmethod
+    def main(arguments: typing.Sequence[str] | None = None) -> None:
+        """
+        Runs benchmark suite from the command line.
+        """
+        parser = argparse.ArgumentParser(
+            description="Times the parts of the nauert quantization process."
+        )
+        parser.add_argument("-k", "--pattern", default="*")
+        parser.add_argument("-o", "--output")
+        parser.add_argument("--compare", metavar="BASELINE")
+        parser.add_argument("--seed", default=0, type=int)
+        parser.add_argument("--beat-count", default=4, type=int)
+        parser.add_argument("--repeat", default=3, type=int)
+        namespace = parser.parse_args(arguments)
+        suite = BenchmarkSuite(
+            seed=namespace.seed,
+            beat_count=namespace.beat_count,
+            repeat=namespace.repeat,
+        )
+        results = suite(namespace.pattern)
+        for name, result in results["benchmarks"].items():
+            print("{:40} {:10.6f}".format(name, result["minimum"]), file=sys.stderr)
+        if namespace.output is None:
+            json.dump(results, sys.stdout, indent=2)
+            print()
+        else:
+            with open(namespace.output, "w") as file_pointer:
+                json.dump(results, file_pointer, indent=2)
+        if namespace.compare is not None:
+            with open(namespace.compare) as file_pointer:
+                baseline = json.load(file_pointer)
+            for name, before, after, ratio in suite.compare(baseline, results):
+                print(
+                    "{:40} {:10.6f} {:10.6f} {:6.2f}x".format(
+                        name, before, after, ratio
+                    ),
+                    file=sys.stderr,
+                )
@@ -1,13 +1,82 @@
+import json
+import pathlib
+
 import abjad
 import pytest
 
+import benchmarks
 import nauert
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup("perf", "performance budgets")
+    group.addoption(
+        "--perf",
+        action="store_true",
+        help="check time and memory budgets of perf tests",
+    )
+    group.addoption(
+        "--perf-tolerance",
+        default=0.5,
+        type=float,
+        help="fail perf tests exceeding baseline time or memory by this ratio",
+    )
+    group.addoption(
+        "--perf-update",
+        action="store_true",
+        help="write measured numbers of perf tests to the baseline file",
+    )
+
+
 @pytest.fixture(autouse=True)
 def inject_abjad_into_doctest_namespace(doctest_namespace):
     """
-    Inject Abjad and Nauert into doctest namespace.
+    Inject Abjad, Nauert and benchmarks into doctest namespace.
     """
     doctest_namespace["abjad"] = abjad
+    doctest_namespace["benchmarks"] = benchmarks
     doctest_namespace["nauert"] = nauert
+
+
+@pytest.fixture
+def perf_baseline(request):
+    """
+    Checks measured numbers against tests/perf_baseline.json.
+
+    Deterministic work counters must equal their baseline. Only with --perf,
+    or when selecting perf tests with -m perf, seconds and megabytes must not
+    exceed their baseline by more than --perf-tolerance: they depend on the
+    machine. With --perf-update, writes measured numbers to the baseline
+    instead.
+    """
+    path = pathlib.Path(__file__).parent / "tests" / "perf_baseline.json"
+    budgets = request.config.getoption("--perf")
+    budgets = budgets or request.config.getoption("-m").strip() == "perf"
+    tolerance = request.config.getoption("--perf-tolerance")
+    update = request.config.getoption("--perf-update")
+
+    def check(name, counters, seconds, megabytes=None):
+        baselines = json.loads(path.read_text()) if path.exists() else {}
+        if update:
+            baselines[name] = {"counters": counters, "seconds": round(seconds, 3)}
+            if megabytes is not None:
+                baselines[name]["megabytes"] = round(megabytes, 3)
+            text = json.dumps(baselines, indent=4, sort_keys=True)
+            path.write_text(text + "\n")
+            return
+        if name not in baselines:
+            message = "no baseline for {!r}: run pytest with --perf-update"
+            pytest.fail(message.format(name))
+        baseline = baselines[name]
+        assert counters == baseline["counters"]
+        if not budgets:
+            return
+        limit = baseline["seconds"] * (1 + tolerance)
+        message = "{}: {:.3f} s exceeds {:.3f} s".format(name, seconds, limit)
+        assert seconds <= limit, message
+        if megabytes is not None:
+            limit = baseline["megabytes"] * (1 + tolerance)
+            message = "{}: {:.3f} MB exceeds {:.3f} MB".format(name, megabytes, limit)
+            assert megabytes <= limit, message
+
+    return check
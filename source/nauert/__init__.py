@@ -9,55 +9,85 @@ from .attackpointoptimizers import (
     NaiveAttackPointOptimizer,
     NullAttackPointOptimizer,
 )
+from .checkpoints import QCheckpoint
+from .eventlogs import QEventLog
 from .gracehandlers import (
     CollapsingGraceHandler,
     ConcatenatingGraceHandler,
     DiscardingGraceHandler,
     GraceHandler,
 )
-from .heuristics import DistanceHeuristic, Heuristic
+from .heuristics import DistanceHeuristic, Heuristic, ViterbiHeuristic
 from .jobhandlers import (
+    AsyncExecutorJobHandler,
+    AsyncJobHandler,
     JobHandler,
     ParallelJobHandler,
     ParallelJobHandlerWorker,
     SerialJobHandler,
+    SocketJobHandler,
+    SocketJobHandlerWorker,
+    ThreadPoolJobHandler,
 )
+from .midifiles import MIDIFile
 from .qeventproxy import QEventProxy
 from .qevents import PitchedQEvent, QEvent, SilentQEvent, TerminalQEvent
-from .qeventsequence import QEventSequence
+from .qeventsequence import ColumnarQEventSequence, QEventSequence
 from .qgrid import QGrid, QGridContainer, QGridLeaf
 from .qschemaitems import BeatwiseQSchemaItem, MeasurewiseQSchemaItem, QSchemaItem
 from .qschemas import BeatwiseQSchema, MeasurewiseQSchema, QSchema
 from .qtargetitems import QTargetBeat, QTargetMeasure
-from .qtargets import BeatwiseQTarget, MeasurewiseQTarget, QTarget
-from .quantizationjob import QuantizationJob
-from .quantizer import quantize
+from .qtargets import (
+    BeatwiseQTarget,
+    MeasurewiseQTarget,
+    QTarget,
+    QuantizationSegmentJob,
+)
+from .quantizationjob import QuantizationJob, SearchStatistics
+from .quantizer import quantize, quantize_async, quantize_iter
+from .recorders import (
+    ExplainRecorder,
+    MemoryRecorder,
+    NullRecorder,
+    Recorder,
+    TimingRecorder,
+)
 from .searchtrees import SearchTree, UnweightedSearchTree, WeightedSearchTree
+from .streamingquantizer import StreamingQuantizer
 
 __all__ = [
     "__version__",
     "__version_info__",
+    "AsyncExecutorJobHandler",
+    "AsyncJobHandler",
     "AttackPointOptimizer",
     "BeatwiseQSchema",
     "BeatwiseQSchemaItem",
     "BeatwiseQTarget",
     "CollapsingGraceHandler",
+    "ColumnarQEventSequence",
     "ConcatenatingGraceHandler",
     "DiscardingGraceHandler",
     "DistanceHeuristic",
+    "ExplainRecorder",
     "GraceHandler",
     "Heuristic",
     "JobHandler",
+    "MIDIFile",
     "MeasurewiseAttackPointOptimizer",
     "MeasurewiseQSchema",
     "MeasurewiseQSchemaItem",
     "MeasurewiseQTarget",
+    "MemoryRecorder",
     "NaiveAttackPointOptimizer",
     "NullAttackPointOptimizer",
+    "NullRecorder",
     "ParallelJobHandler",
     "ParallelJobHandlerWorker",
     "PitchedQEvent",
+    "QCheckpoint",
     "QEvent",
+    "QEventLog",
     "QEventProxy",
     "QEventSequence",
     "QGrid",
@@ -69,11 +99,22 @@ __all__ = [
     "QTargetBeat",
     "QTargetMeasure",
     "QuantizationJob",
+    "QuantizationSegmentJob",
+    "Recorder",
+    "SearchStatistics",
     "SearchTree",
     "SerialJobHandler",
     "SilentQEvent",
+    "SocketJobHandler",
+    "SocketJobHandlerWorker",
+    "StreamingQuantizer",
     "TerminalQEvent",
+    "ThreadPoolJobHandler",
+    "TimingRecorder",
     "UnweightedSearchTree",
+    "ViterbiHeuristic",
     "WeightedSearchTree",
     "quantize",
+    "quantize_async",
+    "quantize_iter",
 ]
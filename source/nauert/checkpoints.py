@@ -0,0 +1,432 @@
+import array
+import bisect
+import fractions
+import functools
+import mmap
+import os
+import pickle
+import struct
+import sys
+import typing
+
+import abjad
+
+from . import qeventproxy as _qeventproxy
+from . import qeventsequence as _qeventsequence
+from . import qgrid as _qgrid
+
+
+class QCheckpoint:
+    r"""
+    Q-checkpoint.
+
+    Memory-maps a q-event sequence and q-grids written in a compact, versioned
+    binary format, and reads them item by item.
+
+    ..  container:: example
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "session.qck")
+        >>> durations = [1000, -500, 250, 250]
+        >>> sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> q_grid = nauert.QGrid()
+        >>> _ = q_grid.subdivide_leaf(q_grid.leaves[0], (1, 1))
+        >>> proxies = [nauert.QEventProxy(_, abjad.Offset(_.offset, 1000)) for _ in sequence[:2]]
+        >>> q_grid.fit_q_events(proxies)
+        >>> nauert.QCheckpoint.dump(path, sequence, [q_grid])
+        >>> with nauert.QCheckpoint(path) as checkpoint:
+        ...     checkpoint
+        ...     checkpoint.q_event_sequence()[2]
+        ...     q_grid = checkpoint.q_grid(0)
+        ...     q_grid.rtm_format
+        ...     q_grid.next_downbeat.q_event_proxies
+        ...
+        QCheckpoint(q_event_count=5, q_grid_count=1)
+        PitchedQEvent(offset=Offset((1500, 1)), pitches=(NamedPitch("c'"),), index=None, attachments=())
+        '(1 (1 1))'
+        [QEventProxy(q_event=SilentQEvent(offset=Offset((1000, 1)), index=None, attachments=()), offset=Offset((1, 1)))]
+
+    A checkpoint is a header, then little-endian columns, then one pickled
+    table of the distinct pitch names, attachments and q-grid rtm strings the
+    columns refer to:
+
+    ==================  =======  =================================================
+    column              type     items
+    ==================  =======  =================================================
+    numerators          int64    offset numerator of each q-event
+    denominators        int64    offset denominator of each q-event
+    indices             int64    index of each q-event, ``-1`` for none
+    proxy numerators    int64    offset numerator of each q-event proxy
+    proxy denominators  int64    offset denominator of each q-event proxy
+    pitch starts        uint32   first pitch of each q-event; silences have none
+    pitches             uint32   pitch name of each pitch
+    attachments         uint32   attachments of each q-event
+    rtms                uint32   rtm string of each q-grid
+    leaf starts         uint32   first leaf of each q-grid
+    proxy starts        uint32   first q-event proxy of each q-grid
+    proxy leaves        uint32   q-grid leaf of each q-event proxy
+    proxy q-events      uint32   q-event of each q-event proxy
+    leaf flags          uint8    ``1`` for each leaf that is not divisible
+    ==================  =======  =================================================
+
+    The table is unpickled: only read trusted checkpoints. Q-event sequences
+    and q-grids read from a checkpoint refer to its memory map, and must not
+    be used once the checkpoint is closed.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_counts", "_file", "_mmap", "_path", "_positions", "_table")
+
+    _columns = (
+        ("numerators", "q"),
+        ("denominators", "q"),
+        ("indices", "q"),
+        ("proxy_numerators", "q"),
+        ("proxy_denominators", "q"),
+        ("pitch_starts", "I"),
+        ("pitches", "I"),
+        ("attachments", "I"),
+        ("rtms", "I"),
+        ("leaf_starts", "I"),
+        ("proxy_starts", "I"),
+        ("proxy_leaves", "I"),
+        ("proxy_q_events", "I"),
+        ("leaf_flags", "B"),
+    )
+
+    _header = struct.Struct("<4sH2xQQQQQQ")
+
+    _magic = b"NQCK"
+
+    _no_q_event = 0xFFFFFFFF
+
+    _version = 1
+
+    ### INITIALIZER ###
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._path = os.fspath(path)
+        self._file = open(self._path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, *counts, table_size = self._header.unpack_from(self._mmap)
+        assert magic == self._magic, repr(self._path)
+        assert version == self._version, repr(version)
+        self._counts = self._get_column_counts(*counts)
+        self._positions, position = {}, self._header.size
+        for name, typecode in self._columns:
+            item = struct.Struct("<" + typecode)
+            self._positions[name] = (position, item)
+            position += self._counts[name] * item.size
+        assert position + table_size == len(self._mmap), repr(self._path)
+        self._table = pickle.loads(self._mmap[position:])
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "QCheckpoint":
+        """
+        Enters q-checkpoint.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes q-checkpoint.
+        """
+        self.close()
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        return "{}(q_event_count={}, q_grid_count={})".format(
+            type(self).__name__, self.q_event_count, self.q_grid_count
+        )
+
+    ### PRIVATE METHODS ###
+
+    def _get_column(self, name: str) -> typing.Sequence[int]:
+        # reads column name all at once
+        position, item = self._positions[name]
+        column = array.array(item.format[1:])
+        column.frombytes(
+            self._mmap[position : position + self._counts[name] * item.size]
+        )
+        if sys.byteorder == "big":
+            column.byteswap()
+        return column
+
+    @staticmethod
+    def _get_column_counts(
+        q_event_count, pitch_count, q_grid_count, leaf_count, proxy_count
+    ) -> dict[str, int]:
+        counts = dict.fromkeys(["numerators", "denominators", "indices"], q_event_count)
+        counts["pitch_starts"] = q_event_count
+        counts["attachments"] = q_event_count - 1
+        counts["pitches"] = pitch_count
+        counts["rtms"] = q_grid_count
+        counts["leaf_starts"] = counts["proxy_starts"] = q_grid_count + 1
+        counts["leaf_flags"] = leaf_count
+        for name in (
+            "proxy_numerators",
+            "proxy_denominators",
+            "proxy_leaves",
+            "proxy_q_events",
+        ):
+            counts[name] = proxy_count
+        return counts
+
+    def _get_q_event_sequence(
+        self, columns: typing.Callable[[str], typing.Sequence[int]]
+    ) -> _qeventsequence.ColumnarQEventSequence:
+        pitch_names, attachment_table, _ = self._table
+        numerators, denominators = columns("numerators"), columns("denominators")
+        indices, pitch_starts = columns("indices"), columns("pitch_starts")
+        pitches, attachments = columns("pitches"), columns("attachments")
+
+        def get_offset(i):
+            numerator, denominator = numerators[i], denominators[i]
+            if denominator == 1:
+                return numerator
+            return fractions.Fraction(numerator, denominator)
+
+        def get_pitches(i):
+            start, stop = pitch_starts[i], pitch_starts[i + 1]
+            if start == stop:
+                return None
+            return tuple([pitch_names[pitches[_]] for _ in range(start, stop)])
+
+        count = self._counts["numerators"]
+        sequence = _qeventsequence.ColumnarQEventSequence._from_columns(
+            _qeventsequence._View(get_offset, count),
+            _qeventsequence._View(get_pitches, count - 1),
+            _qeventsequence._View(
+                lambda i: attachment_table[attachments[i]], count - 1
+            ),
+            validate=False,
+        )
+        sequence._indices = _qeventsequence._View(
+            lambda i: None if indices[i] == -1 else indices[i], count
+        )
+        return sequence
+
+    def _get_q_grid(
+        self,
+        index: int,
+        columns: typing.Callable[[str], typing.Sequence[int]],
+        q_event_sequence: _qeventsequence.QEventSequence,
+    ) -> _qgrid.QGrid:
+        rtm = self._table[2][columns("rtms")[index]]
+        tokens = rtm.replace("(", " ( ").replace(")", " ) ").split()
+        root_node, _ = self._parse_rtm(tokens, 0)
+        q_grid = _qgrid.QGrid(root_node)
+        leaves = q_grid.leaves
+        leaf_start, leaf_flags = columns("leaf_starts")[index], columns("leaf_flags")
+        for i, leaf in enumerate(leaves):
+            if leaf_flags[leaf_start + i] & 1:
+                leaf.is_divisible = False
+        proxy_starts = columns("proxy_starts")
+        proxy_leaves, proxy_q_events = columns("proxy_leaves"), columns(
+            "proxy_q_events"
+        )
+        numerators = columns("proxy_numerators")
+        denominators = columns("proxy_denominators")
+        for i in range(proxy_starts[index], proxy_starts[index + 1]):
+            if proxy_q_events[i] == self._no_q_event:
+                proxy = _qeventproxy.QEventProxy()
+            else:
+                proxy = _qeventproxy.QEventProxy(
+                    q_event_sequence[proxy_q_events[i]],
+                    abjad.Offset(numerators[i], denominators[i]),
+                )
+            leaves[proxy_leaves[i]].q_event_proxies.append(proxy)
+        return q_grid
+
+    @staticmethod
+    def _parse_rtm(
+        tokens: list[str], i: int
+    ) -> tuple[_qgrid.QGridLeaf | _qgrid.QGridContainer, int]:
+        # parses the q-grid node whose rtm format starts at token i
+        if tokens[i] != "(":
+            return _qgrid.QGridLeaf(abjad.Duration(int(tokens[i]))), i + 1
+        numerator = int(tokens[i + 1])
+        assert tokens[i + 2] == "(", repr(tokens)
+        children, i = [], i + 3
+        while tokens[i] != ")":
+            child, i = QCheckpoint._parse_rtm(tokens, i)
+            children.append(child)
+        assert tokens[i + 1] == ")", repr(tokens)
+        return _qgrid.QGridContainer((numerator, 1), children=children), i + 2
+
+    def _read(self, name: str, index: int) -> int:
+        position, item = self._positions[name]
+        return item.unpack_from(self._mmap, position + index * item.size)[0]
+
+    def _read_column(self, name: str) -> typing.Sequence[int]:
+        # reads column name item by item
+        return _qeventsequence._View(
+            functools.partial(self._read, name), self._counts[name]
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path of q-checkpoint.
+        """
+        return self._path
+
+    @property
+    def q_event_count(self) -> int:
+        """
+        Gets number of q-events of q-checkpoint, terminal q-event included.
+        """
+        return self._counts["numerators"]
+
+    @property
+    def q_grid_count(self) -> int:
+        """
+        Gets number of q-grids of q-checkpoint.
+        """
+        return self._counts["rtms"]
+
+    ### PUBLIC METHODS ###
+
+    def close(self) -> None:
+        """
+        Closes q-checkpoint.
+        """
+        self._mmap.close()
+        self._file.close()
+
+    @staticmethod
+    def dump(
+        path: str | os.PathLike,
+        q_event_sequence: _qeventsequence.QEventSequence,
+        q_grids: typing.Sequence[_qgrid.QGrid] = (),
+    ) -> None:
+        """
+        Writes ``q_event_sequence`` and ``q_grids``, whose q-event proxies
+        refer to q-events of ``q_event_sequence``, to ``path`` as a
+        q-checkpoint.
+        """
+        assert isinstance(q_event_sequence, _qeventsequence.QEventSequence)
+        q_events = list(q_event_sequence)
+        columns: dict[str, array.array] = {
+            name: array.array(typecode) for name, typecode in QCheckpoint._columns
+        }
+        pitch_names: dict[str, int] = {}
+        attachment_table: list = []
+        attachment_indices: dict[typing.Any, int] = {}
+        rtms: dict[str, int] = {}
+        for i, q_event in enumerate(q_events):
+            columns["numerators"].append(q_event.offset.numerator)
+            columns["denominators"].append(q_event.offset.denominator)
+            columns["indices"].append(-1 if q_event.index is None else q_event.index)
+            columns["pitch_starts"].append(len(columns["pitches"]))
+            if i == len(q_events) - 1:
+                break
+            for pitch in getattr(q_event, "pitches", ()):
+                name = pitch.name
+                columns["pitches"].append(
+                    pitch_names.setdefault(name, len(pitch_names))
+                )
+            attachments = q_event.attachments
+            try:
+                index = attachment_indices.setdefault(
+                    attachments, len(attachment_table)
+                )
+            except TypeError:
+                index = len(attachment_table)
+            if index == len(attachment_table):
+                attachment_table.append(attachments)
+            columns["attachments"].append(index)
+        offsets = [_.offset for _ in q_events]
+        columns["leaf_starts"].append(0)
+        columns["proxy_starts"].append(0)
+        for q_grid in q_grids:
+            assert isinstance(q_grid, _qgrid.QGrid), repr(q_grid)
+            columns["rtms"].append(rtms.setdefault(q_grid.rtm_format, len(rtms)))
+            for i, leaf in enumerate(q_grid.leaves):
+                columns["leaf_flags"].append(0 if leaf.is_divisible else 1)
+                for proxy in leaf.q_event_proxies:
+                    columns["proxy_leaves"].append(i)
+                    columns["proxy_numerators"].append(proxy.offset.numerator)
+                    columns["proxy_denominators"].append(proxy.offset.denominator)
+                    if proxy.q_event is None:
+                        columns["proxy_q_events"].append(QCheckpoint._no_q_event)
+                        continue
+                    j = bisect.bisect_left(offsets, proxy.q_event.offset)
+                    while j < len(q_events) and q_events[j] != proxy.q_event:
+                        j += 1
+                    assert j < len(q_events), repr(proxy)
+                    columns["proxy_q_events"].append(j)
+            columns["leaf_starts"].append(len(columns["leaf_flags"]))
+            columns["proxy_starts"].append(len(columns["proxy_leaves"]))
+        table = pickle.dumps(
+            (tuple(pitch_names), tuple(attachment_table), tuple(rtms)),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        header = QCheckpoint._header.pack(
+            QCheckpoint._magic,
+            QCheckpoint._version,
+            len(q_events),
+            len(columns["pitches"]),
+            len(q_grids),
+            len(columns["leaf_flags"]),
+            len(columns["proxy_leaves"]),
+            len(table),
+        )
+        with open(path, "wb") as file:
+            file.write(header)
+            for name, _ in QCheckpoint._columns:
+                if sys.byteorder == "big":
+                    columns[name].byteswap()
+                file.write(columns[name].tobytes())
+            file.write(table)
+
+    @staticmethod
+    def load(
+        path: str | os.PathLike,
+    ) -> tuple[_qeventsequence.ColumnarQEventSequence, list[_qgrid.QGrid]]:
+        """
+        Reads the q-event sequence and q-grids of q-checkpoint at ``path`` all
+        at once.
+        """
+        with QCheckpoint(path) as checkpoint:
+            columns = functools.lru_cache(checkpoint._get_column)
+            view = checkpoint._get_q_event_sequence(columns)
+            assert view._attachments is not None and view._indices is not None
+            sequence = _qeventsequence.ColumnarQEventSequence._from_columns(
+                tuple(view._offsets),
+                tuple(view._pitches),
+                tuple(view._attachments),
+                validate=False,
+            )
+            indices = tuple(view._indices)
+            if any(_ is not None for _ in indices):
+                sequence._indices = indices
+            q_grids = [
+                checkpoint._get_q_grid(_, columns, sequence)
+                for _ in range(checkpoint.q_grid_count)
+            ]
+        return sequence, q_grids
+
+    def q_event_sequence(self) -> _qeventsequence.ColumnarQEventSequence:
+        """
+        Gets columnar q-event sequence of q-checkpoint, reading each q-event
+        only when it is made.
+        """
+        return self._get_q_event_sequence(self._read_column)
+
+    def q_grid(self, index: int) -> _qgrid.QGrid:
+        """
+        Gets q-grid ``index`` of q-checkpoint, reading only its own leaves and
+        q-event proxies.
+        """
+        if index < 0:
+            index += self.q_grid_count
+        if not 0 <= index < self.q_grid_count:
+            raise IndexError(index)
+        return self._get_q_grid(index, self._read_column, self.q_event_sequence())
@@ -0,0 +1,216 @@
+import array
+import mmap
+import os
+import struct
+import typing
+
+from . import qeventsequence as _qeventsequence
+
+
+class QEventLog:
+    r"""
+    Q-event log.
+
+    Memory-maps a binary event log, and reads q-event sequences from it
+    without loading the log.
+
+    An event log is a file of fixed-width, little-endian records of 11 bytes,
+    sorted by onset:
+
+    =====  =======  =====================================================
+    bytes  type     field
+    =====  =======  =====================================================
+    0-7    int64    onset in milliseconds
+    8-9    int16    pitch number, ``0`` being middle C
+    10     uint8    flags: ``1`` for a silence, ``2`` for the end of the log
+    =====  =======  =====================================================
+
+    The pitch of a silence, or of the end of the log, is ignored. The end of
+    the log, if any, is its last record; without it, the log ends at the
+    onset of its last record. Records of the same onset make one chord, a
+    silence if they are all silences; a log starting after ``0`` starts with
+    a silence.
+
+    ..  container:: example
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "session.log")
+        >>> records = [(0, 0, 0), (1000, 2, 0), (1500, 0, 1), (2000, 4, 0)]
+        >>> records.extend([(2000, 7, 0), (4000, 0, 2)])
+        >>> nauert.QEventLog.write(path, records)
+        >>> with nauert.QEventLog(path) as log:
+        ...     len(log)
+        ...     sequence = log.q_event_sequence()
+        ...     for q_event in sequence:
+        ...         q_event
+        ...
+        6
+        PitchedQEvent(offset=Offset((0, 1)), pitches=(NamedPitch("c'"),), index=None, attachments=())
+        PitchedQEvent(offset=Offset((1000, 1)), pitches=(NamedPitch("d'"),), index=None, attachments=())
+        SilentQEvent(offset=Offset((1500, 1)), index=None, attachments=())
+        PitchedQEvent(offset=Offset((2000, 1)), pitches=(NamedPitch("e'"), NamedPitch("g'")), index=None, attachments=())
+        TerminalQEvent(offset=Offset((4000, 1)), index=None, attachments=())
+
+    ..  container:: example
+
+        Windows over time ranges start at ``0``. The q-event sounding at
+        the start of a window is continued from the start of the window:
+
+        >>> with nauert.QEventLog(path) as log:
+        ...     for q_event in log.q_event_sequence(1200, 3000):
+        ...         q_event
+        ...
+        PitchedQEvent(offset=Offset((0, 1)), pitches=(NamedPitch("d'"),), index=None, attachments=())
+        SilentQEvent(offset=Offset((300, 1)), index=None, attachments=())
+        PitchedQEvent(offset=Offset((800, 1)), pitches=(NamedPitch("e'"), NamedPitch("g'")), index=None, attachments=())
+        TerminalQEvent(offset=Offset((1800, 1)), index=None, attachments=())
+
+    Q-event sequences read from a log refer to its memory map, and must not
+    be used once the log is closed. Records are trusted to be sorted.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_file", "_groups", "_mmap", "_path", "_record_count")
+
+    _record = struct.Struct("<qhB")
+
+    ### INITIALIZER ###
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._path = os.fspath(path)
+        self._file = open(self._path, "rb")
+        self._groups: array.array | None = None
+        size = os.fstat(self._file.fileno()).st_size
+        if not size or size % self._record.size:
+            self._file.close()
+            message = f"size must be a positive multiple of {self._record.size}"
+            raise ValueError(f"{message}: {self._path!r} has {size} bytes.")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._record_count = size // self._record.size
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "QEventLog":
+        """
+        Enters q-event log.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes q-event log.
+        """
+        self.close()
+
+    def __len__(self) -> int:
+        """
+        Gets number of records of q-event log.
+        """
+        return self._record_count
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        return "{}({!r})".format(type(self).__name__, self.path)
+
+    ### PRIVATE METHODS ###
+
+    def _get_groups(self) -> array.array:
+        # first record of each onset before the end of the log, followed by
+        # the number of records before the end
+        if self._groups is None:
+            end = self._read(self._record_count - 1)[0]
+            groups, previous = array.array("q"), None
+            records = self._record.iter_unpack(self._mmap)
+            for index, (onset, _, _) in enumerate(records):
+                if end <= onset:
+                    break
+                if onset != previous:
+                    groups.append(index)
+                    previous = onset
+            del records
+            groups.append(index)
+            self._groups = groups
+        return self._groups
+
+    def _read(self, index: int) -> tuple[int, int, int]:
+        return self._record.unpack_from(self._mmap, index * self._record.size)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path of q-event log.
+        """
+        return self._path
+
+    ### PUBLIC METHODS ###
+
+    def close(self) -> None:
+        """
+        Closes q-event log.
+        """
+        self._mmap.close()
+        self._file.close()
+
+    def q_event_sequence(
+        self, start_in_ms: int | None = None, stop_in_ms: int | None = None
+    ) -> _qeventsequence.ColumnarQEventSequence:
+        """
+        Gets columnar q-event sequence of the records of q-event log from
+        ``start_in_ms`` to ``stop_in_ms``, offset to start at ``0``.
+
+        Scans the onsets of the log once, then reads records only when their
+        q-events are made; windows are views of the whole log by
+        ``QEventSequence.time_window()``.
+        """
+        groups = self._get_groups()
+        lead = 1 if self._read(0)[0] else 0
+        count = lead + len(groups) - 1
+        end = self._read(self._record_count - 1)[0]
+
+        def get_offset(i):
+            if i == count:
+                return end
+            if i < lead:
+                return 0
+            return self._read(groups[i - lead])[0]
+
+        def get_pitches(i):
+            if i < lead:
+                return None
+            i -= lead
+            pitches = set()
+            for index in range(groups[i], groups[i + 1]):
+                _, pitch, flags = self._read(index)
+                if not flags & 1:
+                    pitches.add(pitch)
+            if not pitches:
+                return None
+            pitches = sorted(pitches)
+            return pitches[0] if len(pitches) == 1 else tuple(pitches)
+
+        offsets = _qeventsequence._View(get_offset, count + 1)
+        pitches = _qeventsequence._View(get_pitches, count)
+        sequence = _qeventsequence.ColumnarQEventSequence._from_columns(
+            offsets, pitches, validate=False
+        )
+        if start_in_ms is None and stop_in_ms is None:
+            return sequence
+        start = 0 if start_in_ms is None else start_in_ms
+        return sequence.time_window(start, stop_in_ms)
+
+    @staticmethod
+    def write(
+        path: str | os.PathLike, records: typing.Iterable[tuple[int, int, int]]
+    ) -> None:
+        """
+        Writes (onset, pitch, flags) ``records`` to ``path`` as an event log.
+        """
+        record = QEventLog._record
+        with open(path, "wb") as file:
+            for onset, pitch, flags in records:
+                file.write(record.pack(onset, pitch, flags))
@@ -1,4 +1,9 @@
 import abc
+import fractions
+import numbers
+import typing
+
+import abjad
 
 from . import qgrid as _qgrid
 from . import qtargetitems as _qtargetitems
@@ -19,6 +24,10 @@ class Heuristic(abc.ABC):
 
     __slots__ = ()
 
+    # whether each beat is selected alone, so that beats may be selected a
+    # few at a time
+    _is_beatwise = False
+
     ### INITIALIZER ###
 
     def __init__(self):
@@ -96,6 +105,8 @@ class DistanceHeuristic(Heuristic):
 
     __slots__ = ()
 
+    _is_beatwise = True
+
     ### PRIVATE METHODS ###
 
     def _process(
@@ -104,10 +115,239 @@ class DistanceHeuristic(Heuristic):
         for q_target_beat in q_target_beats:
             q_grids = q_target_beat.q_grids
             if q_grids:
-                sorted_q_grids = sorted(
-                    q_grids, key=lambda x: (x.distance, len(x.leaves))
-                )
-                q_target_beat._q_grid = sorted_q_grids[0]
+                keys = [_._get_distance_and_leaf_count() for _ in q_grids]
+                index = min(range(len(keys)), key=keys.__getitem__)
+                q_target_beat._q_grid = q_grids[index]
             else:
                 q_target_beat._q_grid = _qgrid.QGrid()
         return q_target_beats
+
+
+class ViterbiHeuristic(Heuristic):
+    r"""
+    Viterbi heuristic.
+
+    Chooses the ``QGrid`` of every ``QTargetBeat`` jointly rather than beat by
+    beat.
+
+    Each candidate ``QGrid`` carries a per-beat cost, made of its distance
+    plus ``leaf_weight`` times its number of leaves. Each pair of candidates
+    chosen for adjacent beats carries a transition cost:
+
+        * ``collision_weight`` for every ``QEventProxy`` attached to the
+          first ``QGrid``'s next downbeat which will be shifted onto an
+          already-attacked first leaf of the second ``QGrid``, producing grace
+          notes;
+
+        * ``tie_weight`` when nothing attacks the first leaf of a subdivided
+          second ``QGrid``, so that the preceding note is tied over into a
+          fragment of the beat;
+
+        * ``tuplet_weight`` when both ``QGrids`` are tuplets of different
+          ratios.
+
+    Only the ``candidate_count`` best candidates of each beat, ranked as by
+    ``DistanceHeuristic``, are considered. The globally cheapest sequence of
+    ``QGrids`` is found by dynamic programming in time proportional to the
+    number of beats times the square of ``candidate_count``.
+
+    ..  container:: example
+
+        >>> durations = [1000] * 8
+        >>> pitches = range(8)
+        >>> pairs = tuple(zip(durations, pitches, strict=True))
+        >>> q_event_sequence = nauert.QEventSequence.from_millisecond_pitch_pairs(pairs)
+        >>> heuristic = nauert.ViterbiHeuristic()
+        >>> voice = nauert.quantize(q_event_sequence, heuristic=heuristic)
+        >>> staff = abjad.Staff([voice])
+        >>> score = abjad.Score([staff])
+        >>> abjad.show(score) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> string = abjad.lilypond(voice)
+            >>> print(string)
+            \new Voice
+            {
+                {
+                    \tempo 4=60
+                    \time 4/4
+                    c'4
+                    cs'4
+                    d'4
+                    ef'4
+                }
+                {
+                    e'4
+                    f'4
+                    fs'4
+                    g'4
+                }
+            }
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_candidate_count",
+        "_collision_weight",
+        "_leaf_weight",
+        "_tie_weight",
+        "_tuplet_weight",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        candidate_count: int = 8,
+        collision_weight: int | float | fractions.Fraction = fractions.Fraction(1, 10),
+        leaf_weight: int | float | fractions.Fraction = fractions.Fraction(1, 1000),
+        tie_weight: int | float | fractions.Fraction = fractions.Fraction(1, 40),
+        tuplet_weight: int | float | fractions.Fraction = fractions.Fraction(1, 20),
+    ):
+        assert isinstance(candidate_count, int), repr(candidate_count)
+        assert 0 < candidate_count, repr(candidate_count)
+        for weight in (collision_weight, leaf_weight, tie_weight, tuplet_weight):
+            assert isinstance(weight, numbers.Real), repr(weight)
+            assert 0 <= weight, repr(weight)
+        self._candidate_count = candidate_count
+        self._collision_weight = collision_weight
+        self._leaf_weight = leaf_weight
+        self._tie_weight = tie_weight
+        self._tuplet_weight = tuplet_weight
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        string = f"{type(self).__name__}(candidate_count={self.candidate_count!r},"
+        string += f" collision_weight={self.collision_weight!r},"
+        string += f" leaf_weight={self.leaf_weight!r},"
+        string += f" tie_weight={self.tie_weight!r},"
+        string += f" tuplet_weight={self.tuplet_weight!r})"
+        return string
+
+    ### PRIVATE METHODS ###
+
+    def _get_candidates(
+        self, q_target_beat: _qtargetitems.QTargetBeat
+    ) -> list[tuple[_qgrid.QGrid, typing.Any, int, bool, bool, int]]:
+        q_grids = q_target_beat.q_grids
+        if not q_grids:
+            q_grids = (_qgrid.QGrid(),)
+        ranked: list[tuple[typing.Any, int, _qgrid.QGrid]] = []
+        for q_grid in q_grids:
+            distance, leaf_count = q_grid._get_distance_and_leaf_count()
+            ranked.append((distance or 0, leaf_count, q_grid))
+        ranked.sort(key=lambda x: (x[0], x[1]))
+        candidates = []
+        for distance_, leaf_count, q_grid in ranked[: self.candidate_count]:
+            cost = distance_ + self.leaf_weight * leaf_count
+            is_attacked = bool(q_grid.leaves[0].q_event_proxies)
+            root_node = q_grid.root_node
+            is_subdivided = isinstance(root_node, _qgrid.QGridContainer)
+            downbeat_count = len(q_grid.next_downbeat.q_event_proxies)
+            tuplet_ratio = 1
+            if isinstance(root_node, _qgrid.QGridContainer):
+                tuplet_ratio = sum(_.pair[0] for _ in root_node.children)
+                if not tuplet_ratio & (tuplet_ratio - 1):
+                    tuplet_ratio = 1
+            candidate = (
+                q_grid,
+                cost,
+                downbeat_count,
+                is_attacked,
+                is_subdivided,
+                tuplet_ratio,
+            )
+            candidates.append(candidate)
+        return candidates
+
+    def _get_transition_cost(self, one: tuple, two: tuple) -> typing.Any:
+        _, _, downbeat_count, _, _, one_tuplet_ratio = one
+        _, _, _, is_attacked, is_subdivided, two_tuplet_ratio = two
+        cost: typing.Any = 0
+        if downbeat_count:
+            if is_attacked:
+                cost += self.collision_weight * downbeat_count
+        elif is_subdivided and not is_attacked:
+            cost += self.tie_weight
+        if 1 < one_tuplet_ratio and 1 < two_tuplet_ratio:
+            if one_tuplet_ratio != two_tuplet_ratio:
+                cost += self.tuplet_weight
+        return cost
+
+    def _process(
+        self, q_target_beats: tuple[_qtargetitems.QTargetBeat, ...]
+    ) -> tuple[_qtargetitems.QTargetBeat, ...]:
+        if not q_target_beats:
+            return q_target_beats
+        all_candidates = [self._get_candidates(_) for _ in q_target_beats]
+        costs = [candidate[1] for candidate in all_candidates[0]]
+        back_pointers: list[list[int]] = []
+        for previous_candidates, candidates in abjad.sequence.nwise(all_candidates):
+            new_costs, pointers = [], []
+            for candidate in candidates:
+                pairs = [
+                    (cost + self._get_transition_cost(previous, candidate), i)
+                    for i, (cost, previous) in enumerate(
+                        zip(costs, previous_candidates)
+                    )
+                ]
+                cost, i = min(pairs, key=lambda x: x[0])
+                new_costs.append(cost + candidate[1])
+                pointers.append(i)
+            costs = new_costs
+            back_pointers.append(pointers)
+        index = min(range(len(costs)), key=lambda i: costs[i])
+        indices = [index]
+        for pointers in reversed(back_pointers):
+            index = pointers[index]
+            indices.append(index)
+        indices.reverse()
+        for q_target_beat, candidates, index in zip(
+            q_target_beats, all_candidates, indices
+        ):
+            q_target_beat._q_grid = candidates[index][0]
+        return q_target_beats
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def candidate_count(self) -> int:
+        """
+        Gets number of candidate ``QGrids`` considered per beat.
+        """
+        return self._candidate_count
+
+    @property
+    def collision_weight(self) -> int | float | fractions.Fraction:
+        """
+        Gets cost per ``QEventProxy`` shifted onto an attacked downbeat.
+        """
+        return self._collision_weight
+
+    @property
+    def leaf_weight(self) -> int | float | fractions.Fraction:
+        """
+        Gets cost per leaf of a ``QGrid``.
+        """
+        return self._leaf_weight
+
+    @property
+    def tie_weight(self) -> int | float | fractions.Fraction:
+        """
+        Gets cost of tying over into a fragment of a subdivided beat.
+        """
+        return self._tie_weight
+
+    @property
+    def tuplet_weight(self) -> int | float | fractions.Fraction:
+        """
+        Gets cost of adjacent tuplets of different ratios.
+        """
+        return self._tuplet_weight
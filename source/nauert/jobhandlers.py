@@ -1,9 +1,24 @@
 import abc
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import hashlib
+import hmac
+import ipaddress
 import multiprocessing
 import pickle
+import select
+import socket
+import socketserver
+import struct
+import sys
+import threading
+import time
 import typing
 
 from . import quantizationjob as _quantizationjob
+from . import searchtrees as _searchtrees
 
 
 class JobHandler(abc.ABC):
@@ -33,6 +48,124 @@ class JobHandler(abc.ABC):
         raise NotImplementedError
 
 
+class AsyncJobHandler(abc.ABC):
+    """
+    Abstract asynchronous job-handler.
+
+    ``AsyncJobHandlers`` control how ``QuantizationJob`` instances are
+    processed by the ``quantize_async`` function. Calling an
+    ``AsyncJobHandler`` returns an awaitable, which resolves to the processed
+    jobs.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ()
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        pass
+
+    ### SPECIAL METHODS ###
+
+    @abc.abstractmethod
+    async def __call__(self, jobs):
+        """
+        Calls asynchronous job handler.
+        """
+        raise NotImplementedError
+
+
+class AsyncExecutorJobHandler(AsyncJobHandler):
+    """
+    Asynchronous executor job-handler.
+
+    Runs ``QuantizationJob`` instances on ``executor``, or on the default
+    executor of the running event loop when ``executor`` is none, with at
+    most ``max_concurrency`` jobs submitted at once.
+
+    Cancelling the awaiting task cancels every job not yet submitted. Jobs
+    already running on the executor run to completion, and their results are
+    discarded.
+
+    ..  container:: example
+
+        >>> nauert.AsyncExecutorJobHandler()
+        AsyncExecutorJobHandler(executor=None, max_concurrency=4)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_executor", "_max_concurrency")
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        executor: concurrent.futures.Executor | None = None,
+        max_concurrency: int = 4,
+    ) -> None:
+        if executor is not None:
+            assert isinstance(executor, concurrent.futures.Executor), repr(executor)
+        assert isinstance(max_concurrency, int), repr(max_concurrency)
+        assert 0 < max_concurrency, repr(max_concurrency)
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+
+    ### SPECIAL METHODS ###
+
+    async def __call__(
+        self, jobs: typing.Sequence[_quantizationjob.QuantizationJob]
+    ) -> typing.Sequence[_quantizationjob.QuantizationJob]:
+        """
+        Calls asynchronous executor job handler.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(job):
+            async with semaphore:
+                return await loop.run_in_executor(self.executor, self._call_job, job)
+
+        async with asyncio.TaskGroup() as task_group:
+            tasks = [task_group.create_task(run(job)) for job in jobs]
+        return [task.result() for task in tasks]
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        string = f"{type(self).__name__}(executor={self.executor!r},"
+        string += f" max_concurrency={self.max_concurrency!r})"
+        return string
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _call_job(job):
+        # returns job, so that jobs run in other processes come back processed
+        job()
+        return job
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def executor(self) -> concurrent.futures.Executor | None:
+        """
+        Gets executor of asynchronous executor job handler.
+        """
+        return self._executor
+
+    @property
+    def max_concurrency(self) -> int:
+        """
+        Gets maximum number of jobs submitted to executor at once.
+        """
+        return self._max_concurrency
+
+
 class ParallelJobHandlerWorker(multiprocessing.Process):
     """
     Parallel job-handler worker.
@@ -70,11 +203,16 @@ class ParallelJobHandlerWorker(multiprocessing.Process):
                 self.job_queue.task_done()
                 break
             # print '{}: {!r}'.format(process_name, job)
-            job = pickle.loads(job)
+            index, job = pickle.loads(job)
+            start_time = time.perf_counter()
             job()
+            elapsed_time = time.perf_counter() - start_time
             self.job_queue.task_done()
             assert hasattr(self.result_queue, "put")
-            self.result_queue.put(pickle.dumps(job, protocol=0))
+            result = (index, job, elapsed_time)
+            self.result_queue.put(
+                pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+            )
         return
 
 
@@ -84,11 +222,43 @@ class ParallelJobHandler(JobHandler):
 
     Processes ``QuantizationJob`` instances in parallel, based on the number of
     CPUs available.
+
+    Jobs are put on a single shared queue longest-first, according to
+    ``estimate_cost()``, and each worker takes the next job from that queue
+    whenever it finishes one. This is greedy longest-first scheduling:
+    expensive jobs start early instead of arriving last and leaving other
+    workers idle. Workers have no queues of their own and take no jobs from
+    one another.
+
+    Predicted and actual costs of the jobs processed by the last call are
+    recorded on ``cost_records``, so that the estimate may be calibrated.
+
+    ..  container:: example
+
+        >>> definition = {2: {2: None}, 3: None, 5: None}
+        >>> search_tree = nauert.UnweightedSearchTree(definition)
+        >>> proxies = [
+        ...     nauert.QEventProxy(nauert.SilentQEvent(abjad.Offset(_)), abjad.Offset(_))
+        ...     for _ in (0, 0.25, 0.5)
+        ... ]
+        >>> job_a = nauert.QuantizationJob(1, search_tree, proxies[:1])
+        >>> job_b = nauert.QuantizationJob(2, search_tree, proxies)
+        >>> job_handler = nauert.ParallelJobHandler()
+        >>> job_handler.estimate_cost(job_a)
+        8
+        >>> job_handler.estimate_cost(job_b)
+        16
+
     """
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = ("_cost_records",)
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._cost_records: list[tuple[typing.Any, int, float]] = []
 
     ### SPECIAL METHODS ###
 
@@ -96,7 +266,12 @@ class ParallelJobHandler(JobHandler):
         """
         Calls parallel job handler.
         """
-        finished_jobs = []
+        self._cost_records = []
+        predicted_costs = [self.estimate_cost(_) for _ in jobs]
+        indices = sorted(
+            range(len(jobs)), key=lambda i: predicted_costs[i], reverse=True
+        )
+        finished_jobs = [None] * len(jobs)
         job_queue = multiprocessing.JoinableQueue()
         result_queue = multiprocessing.Queue()
         workers = [
@@ -105,10 +280,15 @@ class ParallelJobHandler(JobHandler):
         ]
         for worker in workers:
             worker.start()
-        for job in jobs:
-            job_queue.put(pickle.dumps(job, protocol=0))
+        for index in indices:
+            pair = (index, jobs[index])
+            job_queue.put(pickle.dumps(pair, protocol=pickle.HIGHEST_PROTOCOL))
         for i in range(len(jobs)):
-            finished_jobs.append(pickle.loads(result_queue.get()))
+            index, job, elapsed_time = pickle.loads(result_queue.get())
+            finished_jobs[index] = job
+            job_id = getattr(job, "job_id", None)
+            record = (job_id, predicted_costs[index], elapsed_time)
+            self._cost_records.append(record)
         for worker in workers:
             job_queue.put(None)
         job_queue.join()
@@ -118,6 +298,48 @@ class ParallelJobHandler(JobHandler):
             worker.join()
         return finished_jobs
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _get_search_tree_size(search_tree) -> int:
+        if isinstance(search_tree, _searchtrees.WeightedSearchTree):
+            compositions = search_tree.all_compositions
+            return len(compositions) * search_tree.definition["max_depth"]
+        if isinstance(search_tree, _searchtrees.UnweightedSearchTree):
+            size, nodes = 0, [search_tree.definition]
+            while nodes:
+                node = nodes.pop()
+                size += len(node)
+                nodes.extend(_ for _ in node.values() if _ is not None)
+            return size
+        return 1
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def cost_records(self) -> tuple[tuple[typing.Any, int, float], ...]:
+        """
+        Gets job id, predicted cost and actual cost in seconds of every job
+        processed by the last call to job handler.
+        """
+        return tuple(self._cost_records)
+
+    ### PUBLIC METHODS ###
+
+    def estimate_cost(self, job) -> int:
+        """
+        Estimates cost of ``job``.
+
+        Estimate is proportional to the number of ``QEventProxies`` of
+        ``job`` and to the number of nodes of the definition of its search
+        tree. Objects other than ``QuantizationJobs`` are estimated to cost
+        ``0``.
+        """
+        if not isinstance(job, _quantizationjob.QuantizationJob):
+            return 0
+        size = self._get_search_tree_size(job.search_tree)
+        return (1 + len(job.q_event_proxies)) * size
+
 
 class SerialJobHandler(JobHandler):
     """
@@ -139,3 +361,453 @@ class SerialJobHandler(JobHandler):
         for job in jobs:
             job()
         return jobs
+
+
+class SocketJobHandler(JobHandler):
+    """
+    Socket job-handler.
+
+    Dispatches ``QuantizationJob`` instances over TCP to a pool of
+    ``SocketJobHandlerWorker`` servers, listening at ``addresses``, and
+    collects the processed jobs, ordered by job ID.
+
+    Each connected worker processes one job at a time, and sends a heartbeat
+    every few moments while doing so. A job is lost when its worker
+    disconnects, or sends nothing for ``heartbeat_timeout`` seconds; lost
+    jobs are retried on the remaining workers, at most ``max_retries`` times
+    each.
+
+    Jobs and results are sent as pickles: only connect to trusted workers.
+    With a shared ``secret``, every message carries an HMAC-SHA256 digest of
+    its pickle, and messages whose digest does not match are refused unread;
+    workers accepting connections from other hosts require one.
+
+    ..  container:: example
+
+        >>> import threading
+        >>> worker = nauert.SocketJobHandlerWorker()
+        >>> thread = threading.Thread(target=worker.serve_forever)
+        >>> thread.start()
+        >>> job_handler = nauert.SocketJobHandler([worker.address])
+        >>> durations = [1000] * 8
+        >>> q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> voice = nauert.quantize(q_event_sequence, job_handler=job_handler)
+        >>> worker.shutdown()
+        >>> worker.server_close()
+        >>> thread.join()
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_addresses", "_heartbeat_timeout", "_max_retries", "_secret")
+
+    _header = struct.Struct("!I")
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        addresses: typing.Sequence[tuple[str, int]],
+        heartbeat_timeout: float = 10.0,
+        max_retries: int = 2,
+        secret: bytes | None = None,
+    ) -> None:
+        addresses = tuple((host, port) for host, port in addresses)
+        assert len(addresses), repr(addresses)
+        assert 0 < heartbeat_timeout, repr(heartbeat_timeout)
+        assert isinstance(max_retries, int), repr(max_retries)
+        assert 0 <= max_retries, repr(max_retries)
+        self._addresses = addresses
+        self._heartbeat_timeout = heartbeat_timeout
+        self._max_retries = max_retries
+        if secret is not None and not isinstance(secret, bytes):
+            raise TypeError(f"secret must be bytes: {secret!r}.")
+        self._secret = secret
+
+    ### SPECIAL METHODS ###
+
+    def __call__(
+        self, jobs: typing.Sequence[_quantizationjob.QuantizationJob]
+    ) -> typing.Sequence[_quantizationjob.QuantizationJob]:
+        """
+        Calls socket job handler.
+        """
+        pending = collections.deque(enumerate(jobs))
+        retries: collections.Counter = collections.Counter()
+        finished_jobs: dict[int, _quantizationjob.QuantizationJob] = {}
+        # maps each connection to its running job and time of last message
+        connections: dict[socket.socket, list] = {}
+        for address in self.addresses:
+            try:
+                connection = socket.create_connection(address, self.heartbeat_timeout)
+            except OSError:
+                continue
+            connections[connection] = [None, None]
+
+        def drop(connection):
+            connection.close()
+            pair, _ = connections.pop(connection)
+            if pair is None:
+                return
+            index = pair[0]
+            retries[index] += 1
+            if self.max_retries < retries[index]:
+                message = f"job {pair[1].job_id!r} lost {retries[index]} times."
+                raise RuntimeError(message)
+            pending.appendleft(pair)
+
+        try:
+            while len(finished_jobs) < len(jobs):
+                if not connections:
+                    raise ConnectionError("no socket job handler workers left.")
+                for connection, state in list(connections.items()):
+                    if state[0] is None and pending:
+                        pair = pending.popleft()
+                        state[:] = [pair, time.monotonic()]
+                        try:
+                            self._send_message(connection, pair[1], self._secret)
+                        except OSError:
+                            drop(connection)
+                busy = [_ for _, state in connections.items() if state[0]]
+                ready, _, _ = select.select(busy, [], [], self.heartbeat_timeout / 4)
+                for connection in ready:
+                    state = connections[connection]
+                    try:
+                        kind, argument = self._receive_message(connection, self._secret)
+                    except (EOFError, OSError):
+                        drop(connection)
+                        continue
+                    state[1] = time.monotonic()
+                    if kind == "error":
+                        job = state[0][1]
+                        message = f"job {job.job_id!r} failed on worker: {argument}"
+                        raise RuntimeError(message)
+                    if kind == "result":
+                        finished_jobs[state[0][0]] = argument
+                        state[0] = None
+                now = time.monotonic()
+                for connection, state in list(connections.items()):
+                    if state[0] and self.heartbeat_timeout < now - state[1]:
+                        drop(connection)
+        finally:
+            for connection in connections:
+                connection.close()
+        return sorted(finished_jobs.values(), key=lambda _: _.job_id)
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        string = f"{type(self).__name__}(addresses={self.addresses!r},"
+        string += f" heartbeat_timeout={self.heartbeat_timeout!r},"
+        string += f" max_retries={self.max_retries!r})"
+        return string
+
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _receive_message(
+        class_, connection: socket.socket, secret: bytes | None = None
+    ) -> typing.Any:
+        # checks the digest of the pickle before unpickling it
+        header = class_._receive_bytes(connection, class_._header.size)
+        (size,) = class_._header.unpack(header)
+        if secret is None:
+            return pickle.loads(class_._receive_bytes(connection, size))
+        digest = class_._receive_bytes(connection, hashlib.sha256().digest_size)
+        data = class_._receive_bytes(connection, size)
+        expected = hmac.new(secret, data, hashlib.sha256).digest()
+        if not hmac.compare_digest(digest, expected):
+            raise ConnectionError("message digest does not match secret.")
+        return pickle.loads(data)
+
+    @staticmethod
+    def _receive_bytes(connection: socket.socket, size: int) -> bytes:
+        chunks, remaining = [], size
+        while remaining:
+            chunk = connection.recv(remaining)
+            if not chunk:
+                raise EOFError("connection closed.")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    @classmethod
+    def _send_message(
+        class_,
+        connection: socket.socket,
+        message: typing.Any,
+        secret: bytes | None = None,
+    ) -> None:
+        data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+        if secret is not None:
+            data = hmac.new(secret, data, hashlib.sha256).digest() + data
+            size = len(data) - hashlib.sha256().digest_size
+        else:
+            size = len(data)
+        connection.sendall(class_._header.pack(size) + data)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def addresses(self) -> tuple[tuple[str, int], ...]:
+        """
+        Gets (host, port) addresses of socket job handler workers.
+        """
+        return self._addresses
+
+    @property
+    def heartbeat_timeout(self) -> float:
+        """
+        Gets seconds of silence after which a running job is lost.
+        """
+        return self._heartbeat_timeout
+
+    @property
+    def max_retries(self) -> int:
+        """
+        Gets maximum number of times a lost job is retried.
+        """
+        return self._max_retries
+
+
+class SocketJobHandlerWorker(socketserver.ThreadingTCPServer):
+    """
+    Socket job-handler worker.
+
+    TCP server which runs ``QuantizationJobs`` sent by ``SocketJobHandler``,
+    one at a time per connection, sending a heartbeat every
+    ``heartbeat_interval`` seconds while each job runs.
+
+    Binds to ``address``, which defaults to a free port on localhost. Start a
+    worker from the command line with::
+
+        nauert-worker --host 127.0.0.1 --port 5000
+
+    Unpickles what it is sent, so that it only binds to loopback addresses by
+    default. Binding to other addresses requires ``allow_remote`` and a shared
+    ``secret``, which authenticates every message with an HMAC-SHA256 digest;
+    clients must use a ``SocketJobHandler`` with the same secret::
+
+        nauert-worker --host 0.0.0.0 --port 5000 --allow-remote \\
+            --secret-file secret.key
+
+    Used by ``SocketJobHandler``.
+    """
+
+    ### CLASS VARIABLES ###
+
+    allow_reuse_address = True
+
+    daemon_threads = True
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        address: tuple[str, int] = ("127.0.0.1", 0),
+        heartbeat_interval: float = 1.0,
+        secret: bytes | None = None,
+        allow_remote: bool = False,
+    ) -> None:
+        assert 0 < heartbeat_interval, repr(heartbeat_interval)
+        if secret is not None and not isinstance(secret, bytes):
+            raise TypeError(f"secret must be bytes: {secret!r}.")
+        self.heartbeat_interval = heartbeat_interval
+        self.secret = secret
+        socketserver.ThreadingTCPServer.__init__(
+            self, address, socketserver.BaseRequestHandler
+        )
+        host, _ = self.address
+        if not ipaddress.ip_address(host).is_loopback:
+            if not allow_remote or not secret:
+                self.server_close()
+                message = f"refusing to bind to non-loopback address {host!r}"
+                message += " without allow_remote and a secret."
+                raise ValueError(message)
+
+    ### PRIVATE METHODS ###
+
+    def _send_heartbeats(self, connection, lock, event) -> None:
+        while not event.wait(self.heartbeat_interval):
+            try:
+                with lock:
+                    message = ("heartbeat", None)
+                    SocketJobHandler._send_message(connection, message, self.secret)
+            except OSError:
+                return
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """
+        Gets (host, port) address of socket job handler worker.
+        """
+        host, port = self.server_address[:2]
+        assert isinstance(host, str), repr(host)
+        return host, port
+
+    ### PUBLIC METHODS ###
+
+    def finish_request(self, request, client_address) -> None:
+        """
+        Runs jobs received on ``request`` until client disconnects.
+        """
+        lock = threading.Lock()
+        while True:
+            try:
+                job = SocketJobHandler._receive_message(request, self.secret)
+            except (EOFError, OSError):
+                return
+            event = threading.Event()
+            arguments = (request, lock, event)
+            thread = threading.Thread(target=self._send_heartbeats, args=arguments)
+            thread.start()
+            try:
+                job()
+                message = ("result", job)
+            except Exception as exception:
+                message = ("error", repr(exception))
+            event.set()
+            thread.join()
+            try:
+                with lock:
+                    SocketJobHandler._send_message(request, message, self.secret)
+            except OSError:
+                return
+
+    @staticmethod
+    def main(arguments: typing.Sequence[str] | None = None) -> None:
+        """
+        Runs socket job handler worker from the command line.
+        """
+        parser = argparse.ArgumentParser(
+            description="Runs quantization jobs sent by nauert.SocketJobHandler."
+        )
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", default=0, type=int)
+        parser.add_argument("--heartbeat-interval", default=1.0, type=float)
+        parser.add_argument(
+            "--allow-remote",
+            action="store_true",
+            help="allow binding to non-loopback hosts; requires --secret-file",
+        )
+        parser.add_argument(
+            "--secret-file",
+            help="file holding the secret authenticating every message",
+        )
+        namespace = parser.parse_args(arguments)
+        address = (namespace.host, namespace.port)
+        secret = None
+        if namespace.secret_file is not None:
+            with open(namespace.secret_file, "rb") as file:
+                secret = file.read().strip()
+        try:
+            worker = SocketJobHandlerWorker(
+                address,
+                namespace.heartbeat_interval,
+                secret=secret,
+                allow_remote=namespace.allow_remote,
+            )
+        except ValueError as exception:
+            parser.error(str(exception))
+        with worker:
+            print("{}:{}".format(*worker.address), flush=True)
+            try:
+                worker.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+class ThreadPoolJobHandler(JobHandler):
+    """
+    Thread-pool job-handler.
+
+    Processes ``QuantizationJob`` instances on a pool of ``max_workers``
+    threads, without the pickling overhead of ``ParallelJobHandler``.
+
+    Threads only run jobs in parallel on free-threaded builds of Python. When
+    the global interpreter lock is enabled, jobs are processed serially, as
+    by ``SerialJobHandler``.
+
+    Running jobs concurrently is safe because jobs share no mutable state:
+
+        * search trees, including the default instance held by ``QSchema``
+          classes, only read their definition when called;
+
+        * every ``QGrid`` produced by a search tree is a deep copy, with its
+          own ``QGridLeaf`` proxy lists, proxies and ``QEvents``;
+
+        * each job makes its own first ``QGrid`` when called, and owns the
+          ``QEventProxies`` it fits onto that ``QGrid``: ``QTargetBeat`` makes
+          new proxies for every job it makes, and no two jobs share them.
+
+    Jobs must therefore be distinct objects, and search-tree definitions must
+    not be changed while jobs run.
+
+    ..  container:: example
+
+        >>> nauert.ThreadPoolJobHandler()
+        ThreadPoolJobHandler(max_workers=None)
+
+        >>> nauert.ThreadPoolJobHandler(max_workers=4)
+        ThreadPoolJobHandler(max_workers=4)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_max_workers",)
+
+    ### INITIALIZER ###
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        if max_workers is not None:
+            assert isinstance(max_workers, int), repr(max_workers)
+            assert 0 < max_workers, repr(max_workers)
+        self._max_workers = max_workers
+
+    ### SPECIAL METHODS ###
+
+    def __call__(
+        self, jobs: typing.Sequence[_quantizationjob.QuantizationJob]
+    ) -> typing.Sequence[_quantizationjob.QuantizationJob]:
+        """
+        Calls thread-pool job handler.
+        """
+        if self._is_gil_enabled() or len(jobs) < 2:
+            for job in jobs:
+                job()
+            return jobs
+        with concurrent.futures.ThreadPoolExecutor(self.max_workers) as executor:
+            futures = [executor.submit(job) for job in jobs]
+            for future in futures:
+                future.result()
+        return jobs
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        return f"{type(self).__name__}(max_workers={self.max_workers!r})"
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _is_gil_enabled() -> bool:
+        is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+        if is_gil_enabled is None:
+            return True
+        return is_gil_enabled()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def max_workers(self) -> int | None:
+        """
+        Gets maximum number of threads, or none for the default of
+        ``concurrent.futures.ThreadPoolExecutor``.
+        """
+        return self._max_workers
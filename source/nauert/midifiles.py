@@ -0,0 +1,353 @@
+import array
+import collections
+import heapq
+import operator
+import os
+import struct
+import typing
+
+from . import qeventsequence as _qeventsequence
+
+
+class MIDIFile:
+    r"""
+    MIDI file.
+
+    Reads q-event sequences from Standard MIDI Files, in one streaming pass
+    over their tracks, without any third-party dependency.
+
+    ..  container:: example
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "chords.mid")
+        >>> track = bytes.fromhex(
+        ...     "00 90 3C 64  60 80 3C 00  00 90 3E 64  00 40 64  60 80 3E 00"
+        ...     "00 80 40 00  60 90 43 64  60 80 43 00  00 FF 2F 00"
+        ... )
+        >>> with open(path, "wb") as file:
+        ...     _ = file.write(bytes.fromhex("4D546864 00000006 0000 0001 0060"))
+        ...     _ = file.write(b"MTrk" + len(track).to_bytes(4, "big") + track)
+        ...
+        >>> with nauert.MIDIFile(path) as midi_file:
+        ...     midi_file
+        ...     sequence = midi_file.q_event_sequence()
+        ...     for q_event in sequence:
+        ...         q_event
+        ...
+        MIDIFile(format=0, track_count=1, division=96)
+        PitchedQEvent(offset=Offset((0, 1)), pitches=(NamedPitch("c'"),), index=None, attachments=())
+        PitchedQEvent(offset=Offset((500, 1)), pitches=(NamedPitch("d'"), NamedPitch("e'")), index=None, attachments=())
+        SilentQEvent(offset=Offset((1000, 1)), index=None, attachments=())
+        PitchedQEvent(offset=Offset((1500, 1)), pitches=(NamedPitch("g'"),), index=None, attachments=())
+        TerminalQEvent(offset=Offset((2000, 1)), index=None, attachments=())
+
+    Ticks change to milliseconds, rounded to the nearest millisecond, by the
+    tempo map of the file: tempo events of the first track, or of the track
+    read in files of format 2. Notes starting at the same millisecond make
+    one chord; a silence starts once no note sounds.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_division", "_file", "_format", "_path", "_tracks")
+
+    _header = struct.Struct(">HHH")
+
+    ### INITIALIZER ###
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._path = os.fspath(path)
+        self._file = open(self._path, "rb")
+        try:
+            self._read_header()
+        except BaseException:
+            self._file.close()
+            raise
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "MIDIFile":
+        """
+        Enters MIDI file.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """
+        Closes MIDI file.
+        """
+        self.close()
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        return "{}(format={}, track_count={}, division={})".format(
+            type(self).__name__, self.format, self.track_count, self.division
+        )
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _append(offsets, pitches, offset, started, sounding) -> None:
+        # appends the q-event starting at offset, if any
+        if started:
+            if not pitches and offset:
+                offsets.append(0)
+                pitches.append(None)
+            started = sorted(set(started))
+            offsets.append(offset)
+            pitches.append(started[0] if len(started) == 1 else tuple(started))
+        elif not sounding and pitches and pitches[-1] is not None:
+            offsets.append(offset)
+            pitches.append(None)
+
+    def _make_tempo_map(self, track: int) -> list[tuple[int, int, int]]:
+        # (tick, time in microseconds times ticks per quarter note, tempo in
+        # microseconds per quarter note) at each tempo change
+        if self._division & 0x8000:
+            # SMPTE division: a fixed number of ticks per second
+            return [(0, 0, 1000000)]
+        tempo_map = [(0, 0, 500000)]
+        for tick, status, type_, data in _TrackReader(self._file, *self._tracks[track]):
+            if status != 0xFF or type_ != 0x51:
+                continue
+            previous_tick, time, tempo = tempo_map[-1]
+            time += (tick - previous_tick) * tempo
+            tempo = int.from_bytes(data, "big")
+            if tick == previous_tick:
+                tempo_map[-1] = (tick, time, tempo)
+            else:
+                tempo_map.append((tick, time, tempo))
+        return tempo_map
+
+    def _read_chunk_header(self) -> tuple[typing.Any, int]:
+        data = self._file.read(8)
+        if len(data) < 8:
+            return None, 0
+        return data[:4], int.from_bytes(data[4:], "big")
+
+    def _read_header(self) -> None:
+        # reads the header chunk, and finds the track chunks
+        size = os.fstat(self._file.fileno()).st_size
+        type_, length = self._read_chunk_header()
+        if type_ != b"MThd" or length < 6:
+            raise ValueError(f"not a MIDI file: {self._path!r}.")
+        data = self._file.read(length)
+        if len(data) < length:
+            raise ValueError(f"truncated header: {self._path!r}.")
+        self._format, track_count, self._division = self._header.unpack_from(data)
+        if self._format not in (0, 1, 2):
+            raise ValueError(f"unknown format: {self._format!r}.")
+        # find the track chunks, skipping over their data
+        self._tracks: list[tuple[int, int]] = []
+        while len(self._tracks) < track_count:
+            type_, length = self._read_chunk_header()
+            if type_ is None:
+                break
+            if size < self._file.tell() + length:
+                raise ValueError(f"truncated chunk: {self._path!r}.")
+            if type_ == b"MTrk":
+                self._tracks.append((self._file.tell(), length))
+            self._file.seek(length, os.SEEK_CUR)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def division(self) -> int:
+        """
+        Gets division of MIDI file: ticks per quarter note, or an SMPTE
+        division when its high bit is set.
+        """
+        return self._division
+
+    @property
+    def format(self) -> int:
+        """
+        Gets format of MIDI file.
+        """
+        return self._format
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path of MIDI file.
+        """
+        return self._path
+
+    @property
+    def track_count(self) -> int:
+        """
+        Gets number of tracks of MIDI file.
+        """
+        return len(self._tracks)
+
+    ### PUBLIC METHODS ###
+
+    def close(self) -> None:
+        """
+        Closes MIDI file.
+        """
+        self._file.close()
+
+    def q_event_sequence(
+        self, track: int | None = None, channels: typing.Iterable[int] | None = None
+    ) -> _qeventsequence.ColumnarQEventSequence:
+        r"""
+        Gets columnar q-event sequence of the notes of ``track`` of MIDI file,
+        or of all its tracks merged, on ``channels`` numbered from ``0``, or
+        on all channels.
+
+        Reads tracks incrementally, in blocks, keeping only the notes sounding
+        and the q-event sequence made so far.
+
+        ..  container:: example
+
+            Reads one track of a file of format 1 on one channel:
+
+            >>> import os, tempfile
+            >>> path = os.path.join(tempfile.mkdtemp(), "tracks.mid")
+            >>> tracks = [
+            ...     bytes.fromhex("00 FF 51 03 0F4240  00 FF 2F 00"),
+            ...     bytes.fromhex("00 90 3C 64  00 91 48 64  60 80 3C 00  00 FF 2F 00"),
+            ... ]
+            >>> with open(path, "wb") as file:
+            ...     _ = file.write(bytes.fromhex("4D546864 00000006 0001 0002 0060"))
+            ...     for track in tracks:
+            ...         _ = file.write(b"MTrk" + len(track).to_bytes(4, "big") + track)
+            ...
+            >>> with nauert.MIDIFile(path) as midi_file:
+            ...     sequence = midi_file.q_event_sequence(track=1, channels=[0])
+            ...     for q_event in sequence:
+            ...         q_event
+            ...
+            PitchedQEvent(offset=Offset((0, 1)), pitches=(NamedPitch("c'"),), index=None, attachments=())
+            TerminalQEvent(offset=Offset((1000, 1)), index=None, attachments=())
+
+        """
+        if track is None:
+            if self.format == 2:
+                raise ValueError("read tracks of format 2 one by one.")
+            tracks, tempo_track = self._tracks, 0
+        else:
+            tracks = [self._tracks[track]]
+            tempo_track = track if self.format == 2 else 0
+        if not tracks:
+            raise ValueError(f"no tracks in {self.path!r}.")
+        tempo_map = self._make_tempo_map(tempo_track)
+        if self._division & 0x8000:
+            scale = 1000 * -((self._division >> 8) - 256) * (self._division & 0xFF)
+        else:
+            scale = 1000 * self._division
+        channel_set = None if channels is None else set(channels)
+        readers = [_TrackReader(self._file, *_) for _ in tracks]
+        events = heapq.merge(*readers, key=operator.itemgetter(0))
+        offsets = array.array("q")
+        pitches: list[typing.Any] = []
+        sounding: collections.Counter = collections.Counter()
+        started: list[int] = []
+        offset, tempo_index, end = 0, 0, 0
+        for tick, status, key, velocity in events:
+            kind, channel = status & 0xF0, status & 0x0F
+            if kind not in (0x80, 0x90):
+                continue
+            if channel_set is not None and channel not in channel_set:
+                continue
+            while (
+                tempo_index + 1 < len(tempo_map)
+                and tempo_map[tempo_index + 1][0] <= tick
+            ):
+                tempo_index += 1
+            tempo_tick, time, tempo = tempo_map[tempo_index]
+            time += (tick - tempo_tick) * tempo
+            time = (2 * time + scale) // (2 * scale)
+            if time != offset:
+                self._append(offsets, pitches, offset, started, sounding)
+                offset, started = time, []
+            if kind == 0x90 and velocity:
+                sounding[channel, key] += 1
+                started.append(key - 60)
+            elif sounding[channel, key]:
+                sounding[channel, key] -= 1
+                if not sounding[channel, key]:
+                    del sounding[channel, key]
+            end = time
+        self._append(offsets, pitches, offset, started, sounding)
+        if not pitches:
+            raise ValueError(f"no notes in {self.path!r}.")
+        if pitches[-1] is None:
+            pitches.pop()
+        else:
+            offsets.append(end)
+        return _qeventsequence.ColumnarQEventSequence._from_columns(
+            offsets, pitches, validate=False
+        )
+
+
+class _TrackReader:
+    # iterates the (tick, status, data 1, data 2) note and meta events of a
+    # track chunk, reading the chunk in blocks; data 2 of meta events is their
+    # data
+
+    __slots__ = ("_block", "_file", "_index", "_position", "_stop")
+
+    _block_size = 65536
+
+    def __init__(self, file, start, length):
+        self._block, self._file, self._index = b"", file, 0
+        self._position, self._stop = start, start + length
+
+    def __iter__(self):
+        tick, status = 0, 0
+        while self._index < len(self._block) or self._position < self._stop:
+            tick += self._read_variable_length()
+            byte = self._read_byte()
+            if byte & 0x80:
+                if byte < 0xF0:
+                    status = byte
+                data = self._read_byte() if byte < 0xF0 else None
+            else:
+                # running status
+                if not status:
+                    raise ValueError("running status without status.")
+                data = byte
+            if byte == 0xFF:
+                type_ = self._read_byte()
+                length = self._read_variable_length()
+                if type_ == 0x2F:
+                    return
+                yield tick, 0xFF, type_, self._read(length)
+            elif byte in (0xF0, 0xF7):
+                self._read(self._read_variable_length())
+            elif status & 0xF0 in (0xC0, 0xD0):
+                continue
+            else:
+                yield tick, status, data, self._read_byte()
+
+    def _read(self, count):
+        return bytes([self._read_byte() for _ in range(count)])
+
+    def _read_byte(self):
+        if self._index == len(self._block):
+            if self._stop <= self._position:
+                raise ValueError("truncated track.")
+            self._file.seek(self._position)
+            size = min(self._block_size, self._stop - self._position)
+            self._block = self._file.read(size)
+            if not self._block:
+                raise ValueError("truncated track.")
+            self._index = 0
+            self._position += len(self._block)
+        byte = self._block[self._index]
+        self._index += 1
+        return byte
+
+    def _read_variable_length(self):
+        # variable-length quantities take at most four bytes
+        value = 0
+        for _ in range(4):
+            byte = self._read_byte()
+            value = (value << 7) | (byte & 0x7F)
+            if not byte & 0x80:
+                return value
+        raise ValueError("variable-length quantity longer than four bytes.")
@@ -84,6 +84,19 @@ class QEventProxy:
         string = f"{class_name}(q_event={self.q_event!r}, offset={self.offset!r})"
         return string
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _from_trusted(
+        class_, q_event: _qevents.QEvent, offset: abjad.Offset
+    ) -> "QEventProxy":
+        # makes q-event proxy of q-event and offset in 0-1 already known to be
+        # valid, without checking them again
+        self = class_.__new__(class_)
+        self._q_event = q_event
+        self._offset = offset
+        return self
+
     ### PUBLIC PROPERTIES ###
 
     @property
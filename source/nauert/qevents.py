@@ -19,7 +19,7 @@ class QEvent(abc.ABC):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_attachments", "_index", "_offset")
+    __slots__ = ("__weakref__", "_attachments", "_index", "_offset")
 
     ### INITIALIZER ###
 
@@ -164,6 +164,25 @@ class PitchedQEvent(QEvent):
         string += f" attachments={self.attachments!r})"
         return string
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _from_trusted(
+        class_,
+        offset: abjad.Offset,
+        pitches: tuple[abjad.NamedPitch, ...],
+        attachments: tuple = (),
+        index: int | None = None,
+    ) -> "PitchedQEvent":
+        # makes pitched q-event of arguments already known to be valid and
+        # already converted, sharing pitches between q-events
+        self = class_.__new__(class_)
+        self._offset = offset
+        self._index = index
+        self._pitches = pitches
+        self._attachments = attachments
+        return self
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -1,8 +1,13 @@
-import collections
+import array
+import bisect
+import collections.abc
 import copy
+import fractions
 import itertools
 import numbers
+import operator
 import typing
+import weakref
 
 import abjad
 
@@ -39,26 +44,33 @@ class QEventSequence:
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_sequence",)
+    __slots__ = ("_rounding_error", "_sequence")
 
     ### INITIALIZER ###
 
     def __init__(self, sequence):
         q_event_classes = (_qevents.PitchedQEvent, _qevents.SilentQEvent)
         if sequence is None:
-            self._sequence = ()
+            self._initialize(())
             return
-        else:
-            assert 1 < len(sequence)
-            assert all(
-                isinstance(q_event, q_event_classes) for q_event in sequence[:-1]
+        if len(sequence) < 2:
+            raise ValueError(f"need at least two q-events: {sequence!r}.")
+        for q_event in itertools.islice(sequence, len(sequence) - 1):
+            if not isinstance(q_event, q_event_classes):
+                raise TypeError(f"must be pitched or silent q-event: {q_event!r}.")
+        if not isinstance(sequence[-1], _qevents.TerminalQEvent):
+            raise TypeError(f"must be terminal q-event: {sequence[-1]!r}.")
+        if sequence[0].offset < 0:
+            raise ValueError(f"offset must not be negative: {sequence[0]!r}.")
+        if not all(
+            map(
+                operator.le,
+                (_.offset for _ in sequence),
+                (_.offset for _ in itertools.islice(sequence, 1, None)),
             )
-            assert isinstance(sequence[-1], _qevents.TerminalQEvent)
-            offsets = [x.offset for x in sequence]
-            offset_sequence = list(offsets)
-            assert abjad.sequence.is_increasing(offset_sequence, strict=False)
-            assert 0 <= sequence[0].offset
-            self._sequence = tuple(sequence)
+        ):
+            raise ValueError("q-event offsets must not decrease.")
+        self._initialize(tuple(sequence))
 
     ### SPECIAL METHODS ###
 
@@ -116,6 +128,93 @@ class QEventSequence:
         """
         return len(self._sequence)
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _from_trusted(class_, q_events: typing.Iterable) -> "QEventSequence":
+        # makes q-event sequence of q-events already known to be valid,
+        # without checking them again
+        self = class_.__new__(class_)
+        self._initialize(tuple(q_events))
+        return self
+
+    def _get_columns(self) -> tuple[typing.Callable[[int], typing.Any], ...]:
+        # gets offset, pitches, attachments and index of q-event i
+        q_events = self._sequence
+
+        def get_pitches(i):
+            q_event = q_events[i]
+            if isinstance(q_event, _qevents.PitchedQEvent):
+                return q_event.pitches
+            return None
+
+        return (
+            lambda i: q_events[i].offset,
+            get_pitches,
+            lambda i: q_events[i].attachments,
+            lambda i: q_events[i].index,
+        )
+
+    def _make_window(
+        self, first: int, last: int, start, stop
+    ) -> "ColumnarQEventSequence":
+        # views q-events first to last, offset by start, followed by a
+        # terminal q-event at stop
+        get_offset, get_pitches, get_attachments, get_index = self._get_columns()
+        count = last - first
+
+        def get_window_offset(i):
+            if i == count:
+                return stop - start
+            return max(get_offset(first + i) - start, 0)
+
+        sequence = ColumnarQEventSequence._from_columns(
+            _View(get_window_offset, count + 1),
+            _View(lambda i: get_pitches(first + i), count),
+            _View(lambda i: get_attachments(first + i), count),
+            validate=False,
+        )
+        sequence._indices = _View(
+            lambda i: None if i == count else get_index(first + i), count + 1
+        )
+        return sequence
+
+    def _get_resolution(self) -> int | None:
+        # float offsets of q-event sequences are snapped to 1 / 1000
+        # milliseconds on ingestion, unless asked otherwise
+        return 1000
+
+    def _initialize(self, q_events: tuple) -> None:
+        self._rounding_error = fractions.Fraction(0)
+        self._sequence = q_events
+
+    @staticmethod
+    def _snap_offsets(
+        offsets: typing.Sequence, resolution: int | None
+    ) -> tuple[typing.Sequence, fractions.Fraction]:
+        # snaps offsets which are not rational to the nearest multiple of
+        # 1 / resolution milliseconds; returns the largest change made. Float
+        # arrays stay as they are, to be snapped as their q-events are made
+        error = fractions.Fraction(0)
+        if resolution is None:
+            return offsets, error
+        if not isinstance(resolution, int) or not 0 < resolution:
+            raise ValueError(f"resolution must be positive integer: {resolution!r}.")
+        if isinstance(offsets, array.array):
+            if offsets.typecode in "fd":
+                scaled = [_ * resolution for _ in offsets]
+                changes = map(abs, map(operator.sub, scaled, map(round, scaled)))
+                error = fractions.Fraction(max(changes, default=0)) / resolution
+            return offsets, error
+        snapped = list(offsets)
+        for i, offset in enumerate(snapped):
+            if type(offset) is int or isinstance(offset, numbers.Rational):
+                continue
+            exact = fractions.Fraction(offset)
+            snapped[i] = fractions.Fraction(round(exact * resolution), resolution)
+            error = max(error, abs(snapped[i] - exact))
+        return snapped, error
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -131,6 +230,23 @@ class QEventSequence:
         """
         return abjad.Duration(self[-1].offset)
 
+    @property
+    def rounding_error_in_ms(self) -> abjad.Duration:
+        r"""
+        Gets largest change made to a millisecond offset of ``QEventSequence``
+        when snapping float offsets on ingestion:
+
+        >>> durations = [0.1] * 10
+        >>> sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> sequence.duration_in_ms
+        Duration(1, 1)
+
+        >>> sequence.rounding_error_in_ms < abjad.Duration(1, 10**15)
+        True
+
+        """
+        return abjad.Duration(self._rounding_error)
+
     @property
     def sequence(self) -> tuple:
         r"""
@@ -158,9 +274,14 @@ class QEventSequence:
         class_,
         milliseconds: typing.Sequence[int | float],
         fuse_silences: bool = False,
+        resolution: int | None = 1000,
     ) -> "QEventSequence":
         r"""
-        Changes sequence of millisecond ``durations`` to ``QEventSequence``:
+        Changes sequence of millisecond ``durations`` to ``QEventSequence``.
+
+        Snaps offsets summing float durations to the nearest multiple of
+        ``1 / resolution`` milliseconds, keeping their fractions small;
+        ``resolution`` set to none keeps them exact:
 
         >>> durations = [-250, 500, -1000, 1250, -1000]
         >>> sequence = nauert.QEventSequence.from_millisecond_durations(durations)
@@ -183,18 +304,23 @@ class QEventSequence:
         else:
             durations = milliseconds
         sums = abjad.math.cumulative_sums([abs(_) for _ in durations])
+        sums, error = class_._snap_offsets(sums, resolution)
         offsets = [abjad.Offset(_) for _ in sums]
+        middle_c = (abjad.NamedPitch(0),)
         q_events: list[_qevents.QEvent] = []
         for offset, duration in zip(offsets, durations):
             q_event: _qevents.QEvent
             if duration < 0:
                 q_event = _qevents.SilentQEvent(offset)
             else:
-                q_event = _qevents.PitchedQEvent(offset, [0])
+                q_event = _qevents.PitchedQEvent._from_trusted(offset, middle_c)
             q_events.append(q_event)
         q_event = _qevents.TerminalQEvent(offsets[-1])
         q_events.append(q_event)
-        return class_(q_events)
+        # offsets summing absolute durations increase
+        sequence = class_._from_trusted(q_events)
+        sequence._rounding_error = error
+        return sequence
 
     @classmethod
     def from_millisecond_offsets(
@@ -217,7 +343,9 @@ class QEventSequence:
         TerminalQEvent(...)
 
         """
-        assert all(isinstance(_, abjad.Offset) for _ in offsets), repr(offsets)
+        for offset in offsets:
+            if not isinstance(offset, abjad.Offset):
+                raise TypeError(f"must be offset: {offset!r}.")
         q_events: list[_qevents.QEvent] = []
         q_events.extend([_qevents.PitchedQEvent(_, [0]) for _ in offsets[:-1]])
         q_events.append(_qevents.TerminalQEvent(offsets[-1]))
@@ -225,11 +353,12 @@ class QEventSequence:
 
     @classmethod
     def from_millisecond_pitch_attachment_tuples(
-        class_, tuples: typing.Iterable[tuple]
+        class_, tuples: typing.Iterable[tuple], resolution: int | None = 1000
     ) -> "QEventSequence":
         r"""
         Changes (millisecond-duration, pitch, attachment) ``tuples`` into
-        ``QEventSequence``:
+        ``QEventSequence``, snapping offsets summing float durations to the
+        nearest multiple of ``1 / resolution`` milliseconds:
 
         >>> durations = [250, 500, 1000, 1250, 1000]
         >>> pitches = [(0,), None, (2, 3), None, (1,)]
@@ -248,20 +377,29 @@ class QEventSequence:
         TerminalQEvent(...)
 
         """
-        assert isinstance(tuples, collections.abc.Iterable)
-        assert all(isinstance(_, collections.abc.Iterable) for _ in tuples)
-        assert all(len(_) == 3 for _ in tuples)
-        assert all(0 < duration for duration, _, _ in tuples)
+        if not isinstance(tuples, collections.abc.Iterable):
+            raise TypeError(f"must be iterable: {tuples!r}.")
         pitch_prototype = (numbers.Number, type(None), collections.abc.Sequence)
-        for _, pitches, attachments in tuples:
+        # checks each tuple in one pass
+        for tuple_ in tuples:
+            if not isinstance(tuple_, collections.abc.Sequence):
+                raise TypeError(f"must be sequence: {tuple_!r}.")
+            if len(tuple_) != 3:
+                raise ValueError(f"must have three items: {tuple_!r}.")
+            duration, pitches, attachments = tuple_
+            if not 0 < duration:
+                raise ValueError(f"duration must be positive: {tuple_!r}.")
             if attachments is None:
                 raise Exception(attachments)
-            assert isinstance(pitches, pitch_prototype)
+            if not isinstance(pitches, pitch_prototype):
+                raise TypeError(f"pitches must be number or sequence: {tuple_!r}.")
             if isinstance(pitches, collections.abc.Sequence):
-                assert 0 < len(pitches)
-                assert all(isinstance(_, numbers.Number) for _ in pitches)
-            if pitches is None:
-                assert not attachments, repr(attachments)
+                if not len(pitches):
+                    raise ValueError(f"pitches must not be empty: {tuple_!r}.")
+                if not all(isinstance(_, numbers.Number) for _ in pitches):
+                    raise TypeError(f"pitches must be numbers: {tuple_!r}.")
+            if pitches is None and attachments:
+                raise ValueError(f"silences take no attachments: {tuple_!r}.")
         # fuse silences
         g = itertools.groupby(tuples, lambda _: _[1] is not None)
         groups = []
@@ -273,23 +411,40 @@ class QEventSequence:
                 groups.append((duration, None, ()))
         # find offsets
         offsets = abjad.math.cumulative_sums([abs(_[0]) for _ in groups])
+        offsets, error = class_._snap_offsets(offsets, resolution)
         offsets = [abjad.Offset(_) for _ in offsets]
-        # build QEvents
-        q_events = [
-            _qevents.QEvent.from_offset_pitches_attachments(
-                offset, pitches, attachments
+        # build QEvents, converting each distinct pitch once
+        named_pitches: dict = {}
+        q_events: list[_qevents.QEvent] = []
+        for offset, (_, pitches, attachments) in zip(offsets, groups):
+            if pitches is None:
+                q_events.append(_qevents.SilentQEvent(offset, attachments))
+                continue
+            if isinstance(pitches, numbers.Number):
+                pitches = (pitches,)
+            for pitch in pitches:
+                if pitch not in named_pitches:
+                    named_pitches[pitch] = abjad.NamedPitch(pitch)
+            q_event = _qevents.PitchedQEvent._from_trusted(
+                offset,
+                tuple([named_pitches[_] for _ in pitches]),
+                tuple(attachments),
             )
-            for offset, (_, pitches, attachments) in zip(offsets, groups)
-        ]
+            q_events.append(q_event)
         q_events.append(_qevents.TerminalQEvent(offsets[-1]))
-        return class_(q_events)
+        # offsets summing positive durations increase
+        sequence = class_._from_trusted(q_events)
+        sequence._rounding_error = error
+        return sequence
 
     @classmethod
     def from_millisecond_pitch_pairs(
-        class_, pairs: typing.Iterable[tuple]
+        class_, pairs: typing.Iterable[tuple], resolution: int | None = 1000
     ) -> "QEventSequence":
         r"""
-        Changes (millisecond-duration, pitch) ``pairs`` into ``QEventSequence``:
+        Changes (millisecond-duration, pitch) ``pairs`` into ``QEventSequence``,
+        snapping offsets summing float durations to the nearest multiple of
+        ``1 / resolution`` milliseconds:
 
         >>> durations = [250, 500, 1000, 1250, 1000]
         >>> pitches = [(0,), None, (2, 3), None, (1,)]
@@ -306,18 +461,18 @@ class QEventSequence:
         TerminalQEvent(...)
 
         """
-        assert isinstance(pairs, collections.abc.Iterable)
-        assert all(isinstance(_, collections.abc.Iterable) for _ in pairs)
-        assert all(len(_) == 2 for _ in pairs)
-        assert all(0 < duration for duration, _ in pairs)
-        pitch_prototype = (numbers.Number, type(None), collections.abc.Sequence)
-        for _, pitches in pairs:
-            assert isinstance(pitches, pitch_prototype)
-            if isinstance(pitches, collections.abc.Sequence):
-                assert 0 < len(pitches)
-                assert all(isinstance(_, numbers.Number) for _ in pitches)
+        if not isinstance(pairs, collections.abc.Iterable):
+            raise TypeError(f"must be iterable: {pairs!r}.")
+        # durations and pitches are checked once, with the tuples
+        tuples = []
+        for pair in pairs:
+            if not isinstance(pair, collections.abc.Sequence):
+                raise TypeError(f"must be sequence: {pair!r}.")
+            if len(pair) != 2:
+                raise ValueError(f"must have two items: {pair!r}.")
+            tuples.append((pair[0], pair[1], ()))
         return class_.from_millisecond_pitch_attachment_tuples(
-            [(duration, pitches, ()) for duration, pitches in pairs]
+            tuples, resolution=resolution
         )
 
     @classmethod
@@ -346,12 +501,16 @@ class QEventSequence:
             TerminalQEvent(...)
 
         """
-        assert all(isinstance(_, abjad.Duration) for _ in durations), repr(durations)
-        assert isinstance(tempo, abjad.MetronomeMark)
+        for duration in durations:
+            if not isinstance(duration, abjad.Duration):
+                raise TypeError(f"must be duration: {duration!r}.")
+        if not isinstance(tempo, abjad.MetronomeMark):
+            raise TypeError(f"must be metronome mark: {tempo!r}.")
         durations = [x for x in abjad.sequence.sum_by_sign(durations, sign=[-1]) if x]
         durations = [tempo.duration_to_milliseconds(_) for _ in durations]
         offsets = abjad.math.cumulative_sums([abs(_) for _ in durations])
         offsets = [abjad.Offset(_) for _ in offsets]
+        middle_c = (abjad.NamedPitch(0),)
         q_events = []
         for offset, duration in zip(offsets, durations):
             offset = abjad.Offset(offset)
@@ -362,11 +521,12 @@ class QEventSequence:
                 q_event = _qevents.SilentQEvent(offset)
             # otherwise use middle C
             else:
-                q_event = _qevents.PitchedQEvent(offset, [0])
+                q_event = _qevents.PitchedQEvent._from_trusted(offset, middle_c)
             q_events.append(q_event)
         # insert terminating silence _qevents.QEvent
         q_events.append(_qevents.TerminalQEvent(offsets[-1]))
-        return class_(q_events)
+        # offsets summing absolute durations increase
+        return class_._from_trusted(q_events)
 
     @classmethod
     def from_tempo_scaled_leaves(class_, leaves, tempo=None) -> "QEventSequence":
@@ -389,11 +549,13 @@ class QEventSequence:
         effective, non-imprecise tempo. The millisecond-duration of each leaf
         will be determined by its effective tempo.
         """
-        assert len(leaves)
+        if not len(leaves):
+            raise ValueError(f"leaves must not be empty: {leaves!r}.")
         match tempo:
             case None:
                 prototype = abjad.MetronomeMark
-                assert abjad.get.effective(leaves[0], prototype) is not None
+                if abjad.get.effective(leaves[0], prototype) is None:
+                    raise ValueError(f"leaves must have tempo: {leaves[0]!r}.")
             case abjad.MetronomeMark():
                 tempo = copy.deepcopy(tempo)
             case tuple():
@@ -442,3 +604,469 @@ class QEventSequence:
             pitches.append(pitch)
         # convert durations and pitches to QEvents and return
         return class_.from_millisecond_pitch_pairs(tuple(zip(durations, pitches)))
+
+    def index_window(
+        self, start: int, stop: int | None = None
+    ) -> "ColumnarQEventSequence":
+        r"""
+        Views q-events ``start`` to ``stop`` of ``QEventSequence``, offset to
+        start at ``0``, and ending with a terminal q-event at the offset of
+        q-event ``stop``:
+
+        >>> durations = (1000, -500, 1250, -500, 750)
+        >>> sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> for q_event in sequence.index_window(1, 3):
+        ...     q_event
+        ...
+        SilentQEvent(offset=Offset((0, 1)), index=None, attachments=())
+        PitchedQEvent(offset=Offset((500, 1)), pitches=(NamedPitch("c'"),), index=None, attachments=())
+        TerminalQEvent(offset=Offset((1750, 1)), index=None, attachments=())
+
+        Shares the q-events or columns of ``QEventSequence``, making each
+        q-event of the view only when it is got.
+        """
+        last = len(self) - 1
+        stop = last if stop is None else stop
+        start, stop, _ = slice(start, stop).indices(last + 1)
+        if not start < stop <= last:
+            raise ValueError(f"window must not be empty: {(start, stop)!r}.")
+        get_offset = self._get_columns()[0]
+        start_offset, stop_offset = get_offset(start), get_offset(stop)
+        if not start_offset < stop_offset:
+            raise ValueError(f"window must take time: {(start, stop)!r}.")
+        return self._make_window(start, stop, start_offset, stop_offset)
+
+    def time_window(
+        self, start_in_ms: int | float, stop_in_ms: int | float | None = None
+    ) -> "ColumnarQEventSequence":
+        r"""
+        Views q-events of ``QEventSequence`` from ``start_in_ms`` to
+        ``stop_in_ms``, offset to start at ``0``; the q-event sounding at
+        ``start_in_ms`` continues from the start of the view:
+
+        >>> durations = (1000, -500, 1250, -500, 750)
+        >>> sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> for q_event in sequence.time_window(1200, 3000):
+        ...     q_event
+        ...
+        SilentQEvent(offset=Offset((0, 1)), index=None, attachments=())
+        PitchedQEvent(offset=Offset((300, 1)), pitches=(NamedPitch("c'"),), index=None, attachments=())
+        SilentQEvent(offset=Offset((1550, 1)), index=None, attachments=())
+        TerminalQEvent(offset=Offset((1800, 1)), index=None, attachments=())
+
+        Finds the q-events by binary search, and shares the q-events or
+        columns of ``QEventSequence``. Float bounds are snapped like float
+        offsets.
+        """
+        get_offset = self._get_columns()[0]
+        count = len(self) - 1
+        offsets = _View(get_offset, count + 1)
+        end = offsets[count]
+        # snap float bounds like float offsets, so that the view has offsets
+        # of the same resolution as QEventSequence
+        resolution = self._get_resolution()
+        start = self._snap_offsets([start_in_ms], resolution)[0][0]
+        stop = end
+        if stop_in_ms is not None:
+            stop = min(self._snap_offsets([stop_in_ms], resolution)[0][0], end)
+        if not 0 <= start < stop:
+            message = f"window must not be empty: {(start_in_ms, stop_in_ms)!r}."
+            raise ValueError(message)
+        # the first q-event sounding at start, if any
+        first = bisect.bisect_right(offsets, start, hi=count) - 1
+        if first < 0:
+            first = 0
+        else:
+            first = bisect.bisect_left(offsets, offsets[first], hi=first)
+        last = bisect.bisect_left(offsets, stop, lo=first, hi=count)
+        if not first < last:
+            message = f"window must hold a q-event: {(start_in_ms, stop_in_ms)!r}."
+            raise ValueError(message)
+        return self._make_window(first, last, start, stop)
+
+
+class ColumnarQEventSequence(QEventSequence):
+    r"""
+    Columnar q-event sequence.
+
+    Stores the offsets, pitches and attachments of its q-events as columns,
+    and makes each q-event only when it is accessed. Offsets may be given as
+    an ``array.array`` of milliseconds, which is stored as is.
+
+    Each q-event is made once for as long as it is referenced elsewhere, so
+    that getting the same item twice gets the same q-event. Quantizing makes
+    every q-event, as q-events are parcelled out to beats: columns save
+    memory while the sequence is stored, windowed or pickled, not while it
+    is quantized.
+
+    ..  container:: example
+
+        >>> import array
+        >>> offsets = array.array("d", [0, 250, 750, 1750, 3000])
+        >>> pitches = [0, None, (2, 3), 1]
+        >>> method = nauert.ColumnarQEventSequence.from_millisecond_offsets
+        >>> sequence = method(offsets, pitches)
+        >>> len(sequence)
+        5
+        >>> for q_event in sequence:
+        ...     q_event
+        ...
+        PitchedQEvent(...)
+        SilentQEvent(...)
+        PitchedQEvent(...)
+        PitchedQEvent(...)
+        TerminalQEvent(...)
+
+        >>> sequence[2].pitches
+        (NamedPitch("d'"), NamedPitch("ef'"))
+
+        >>> sequence[2] is sequence[2]
+        True
+
+        Quantizes like a q-event sequence of the same q-events:
+
+        >>> q_event_sequence = nauert.QEventSequence(sequence.sequence)
+        >>> string = abjad.lilypond(nauert.quantize(sequence))
+        >>> string == abjad.lilypond(nauert.quantize(q_event_sequence))
+        True
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_attachments",
+        "_indices",
+        "_offsets",
+        "_pitches",
+        "_q_events",
+        "_resolution",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(self, sequence):
+        q_event_sequence = QEventSequence(sequence)
+        self._initialize(q_event_sequence.sequence)
+
+    ### SPECIAL METHODS ###
+
+    def __contains__(self, argument) -> bool:
+        """
+        Is true when columnar q-event sequence contains ``argument``. Otherwise
+        false.
+        """
+        return argument in iter(self)
+
+    def __getstate__(self) -> tuple[None, dict]:
+        """
+        Gets state of columnar q-event sequence, leaving out q-events made.
+        """
+        state = {}
+        for name in self._get_slot_names():
+            if name != "_q_events" and hasattr(self, name):
+                state[name] = getattr(self, name)
+        return None, state
+
+    @typing.overload
+    def __getitem__(self, argument: int) -> _qevents.QEvent:
+        pass
+
+    @typing.overload
+    def __getitem__(self, argument: slice) -> tuple[_qevents.QEvent, ...]:
+        pass
+
+    def __getitem__(
+        self, argument: int | slice
+    ) -> _qevents.QEvent | tuple[_qevents.QEvent, ...]:
+        """
+        Gets item or slice identified by `argument`.
+
+        Makes the q-events requested.
+        """
+        if isinstance(argument, slice):
+            indices = range(len(self._offsets))[argument]
+            return tuple([self._get_q_event(_) for _ in indices])
+        if argument < 0:
+            argument += len(self._offsets)
+        if not 0 <= argument < len(self._offsets):
+            raise IndexError(argument)
+        return self._get_q_event(argument)
+
+    def __iter__(self) -> typing.Iterator[_qevents.QEvent]:
+        """
+        Iterates columnar q-event sequence, making each q-event in turn.
+        """
+        for i in range(len(self._offsets)):
+            yield self._get_q_event(i)
+
+    def __len__(self) -> int:
+        """
+        Gets length of columnar q-event sequence.
+        """
+        return len(self._offsets)
+
+    def __setstate__(self, state: tuple[None, dict]) -> None:
+        """
+        Sets state of columnar q-event sequence.
+        """
+        for name, value in state[1].items():
+            setattr(self, name, value)
+        self._q_events: weakref.WeakValueDictionary[int, _qevents.QEvent]
+        self._q_events = weakref.WeakValueDictionary()
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _freeze(column: typing.Iterable) -> typing.Sequence:
+        # copy mutable columns; keep immutable sequences, such as tuples and
+        # read-only views, as they are
+        if isinstance(column, array.array):
+            return array.array(column.typecode, column)
+        if isinstance(column, collections.abc.MutableSequence) or not isinstance(
+            column, collections.abc.Sequence
+        ):
+            return tuple(column)
+        return column
+
+    @classmethod
+    def _from_columns(
+        class_, offsets, pitches, attachments=None, validate=True, resolution=None
+    ) -> "ColumnarQEventSequence":
+        # offsets end with the offset of the terminal q-event; pitches and
+        # attachments hold one entry per other q-event
+        offsets, error = class_._snap_offsets(offsets, resolution)
+        if len(offsets) < 2:
+            raise ValueError(f"need at least two offsets: {offsets!r}.")
+        if len(pitches) != len(offsets) - 1:
+            raise ValueError(f"need one pitch entry per onset: {pitches!r}.")
+        if attachments is not None and len(attachments) != len(pitches):
+            raise ValueError(f"need one attachment entry per onset: {attachments!r}.")
+        if validate:
+            if offsets[0] < 0:
+                raise ValueError(f"offset must not be negative: {offsets[0]!r}.")
+            if not all(map(operator.le, offsets, itertools.islice(offsets, 1, None))):
+                raise ValueError("offsets must not decrease.")
+        self = class_.__new__(class_)
+        self._offsets = class_._freeze(offsets)
+        self._pitches = class_._freeze(pitches)
+        self._attachments = None if attachments is None else class_._freeze(attachments)
+        self._indices = None
+        self._q_events = weakref.WeakValueDictionary()
+        self._resolution = resolution
+        self._rounding_error = error
+        return self
+
+    def _get_columns(self) -> tuple[typing.Callable[[int], typing.Any], ...]:
+        attachments, indices = self._attachments, self._indices
+        return (
+            self._get_offset,
+            self._pitches.__getitem__,
+            (lambda i: ()) if attachments is None else attachments.__getitem__,
+            (lambda i: None) if indices is None else indices.__getitem__,
+        )
+
+    def _get_offset(self, i: int) -> typing.Any:
+        offset = self._offsets[i]
+        if type(offset) is float and self._resolution is not None:
+            offset = fractions.Fraction(
+                round(offset * self._resolution), self._resolution
+            )
+        return offset
+
+    def _get_q_event(self, i: int) -> _qevents.QEvent:
+        # makes q-event i, unless it is still referenced elsewhere
+        q_event = self._q_events.get(i)
+        if q_event is not None:
+            return q_event
+        q_event = self._make_q_event(i)
+        self._q_events[i] = q_event
+        return q_event
+
+    def _get_resolution(self) -> int | None:
+        return self._resolution
+
+    @classmethod
+    def _get_slot_names(class_) -> list[str]:
+        names: list[str] = []
+        for class__ in class_.__mro__:
+            names.extend(getattr(class__, "__slots__", ()))
+        return [_ for _ in names if _ != "__weakref__"]
+
+    def _initialize(self, q_events: tuple) -> None:
+        self._q_events = weakref.WeakValueDictionary()
+        for i, q_event in enumerate(q_events):
+            self._q_events[i] = q_event
+        self._offsets: typing.Sequence = tuple([_.offset for _ in q_events])
+        self._pitches: typing.Sequence = tuple(
+            [
+                _.pitches if isinstance(_, _qevents.PitchedQEvent) else None
+                for _ in q_events[:-1]
+            ]
+        )
+        self._attachments: typing.Sequence | None = tuple(
+            [_.attachments for _ in q_events[:-1]]
+        )
+        self._resolution: int | None = None
+        self._rounding_error = fractions.Fraction(0)
+        indices = tuple([_.index for _ in q_events])
+        self._indices: typing.Sequence | None = None
+        if any(_ is not None for _ in indices):
+            self._indices = indices
+
+    def _make_q_event(self, i: int) -> _qevents.QEvent:
+        offset = abjad.Offset(self._get_offset(i))
+        index = None if self._indices is None else self._indices[i]
+        if i == len(self._offsets) - 1:
+            return _qevents.TerminalQEvent(offset)
+        pitches = self._pitches[i]
+        attachments = () if self._attachments is None else self._attachments[i]
+        if pitches is None:
+            return _qevents.SilentQEvent(offset, attachments, index=index)
+        if isinstance(pitches, numbers.Number):
+            pitches = [pitches]
+        return _qevents.PitchedQEvent(offset, pitches, attachments, index=index)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def sequence(self) -> tuple:
+        """
+        Gets sequence of q-events, making every q-event.
+        """
+        return tuple(self)
+
+    ### PUBLIC METHODS ###
+
+    @classmethod
+    def from_millisecond_durations(
+        class_,
+        milliseconds: typing.Sequence[int | float],
+        fuse_silences: bool = False,
+        resolution: int | None = 1000,
+    ) -> "ColumnarQEventSequence":
+        r"""
+        Changes sequence of millisecond ``durations`` to
+        ``ColumnarQEventSequence``; negative durations are silences. Snaps
+        offsets summing float durations to the nearest multiple of
+        ``1 / resolution`` milliseconds:
+
+        >>> durations = [-250, 500, -1000, 1250, -1000]
+        >>> method = nauert.ColumnarQEventSequence.from_millisecond_durations
+        >>> sequence = method(durations)
+        >>> sequence.duration_in_ms
+        Duration(4000, 1)
+
+        """
+        durations: typing.Sequence[int | float]
+        if fuse_silences:
+            durations = [
+                _ for _ in abjad.sequence.sum_by_sign(milliseconds, sign=[-1]) if _
+            ]
+        else:
+            durations = milliseconds
+        offsets = list(itertools.accumulate(map(abs, durations), initial=0))
+        pitches = [None if _ < 0 else 0 for _ in durations]
+        return class_._from_columns(offsets, pitches, resolution=resolution)
+
+    @classmethod
+    def from_millisecond_offsets(
+        class_,
+        offsets: typing.Sequence[int | float | abjad.Offset],
+        pitches: typing.Sequence | None = None,
+        attachments: typing.Sequence[tuple] | None = None,
+        resolution: int | None = 1000,
+    ) -> "ColumnarQEventSequence":
+        r"""
+        Changes millisecond ``offsets``, ending with the offset of the terminal
+        q-event, to ``ColumnarQEventSequence``.
+
+        ``pitches`` gives one pitch number, sequence of pitch numbers, or
+        ``None`` for silence, for each offset but the last; middle C by
+        default. ``attachments`` gives one tuple of attachments for each
+        offset but the last. Float offsets snap to the nearest multiple of
+        ``1 / resolution`` milliseconds.
+
+        >>> offsets = [0, 250, 750, 1750, 3000, 4000]
+        >>> method = nauert.ColumnarQEventSequence.from_millisecond_offsets
+        >>> sequence = method(offsets)
+        >>> sequence[-1]
+        TerminalQEvent(offset=Offset((4000, 1)), index=None, attachments=())
+
+        """
+        if pitches is None:
+            pitches = [0] * (len(offsets) - 1)
+        return class_._from_columns(
+            offsets, pitches, attachments, resolution=resolution
+        )
+
+    @classmethod
+    def from_millisecond_pitch_attachment_tuples(
+        class_, tuples: typing.Iterable[tuple], resolution: int | None = 1000
+    ) -> "ColumnarQEventSequence":
+        r"""
+        Changes (millisecond-duration, pitch, attachment) ``tuples`` into
+        ``ColumnarQEventSequence``, fusing consecutive silences, and snapping
+        offsets summing float durations to the nearest multiple of
+        ``1 / resolution`` milliseconds:
+
+        >>> durations = [250, 500, 1000, 1250, 1000]
+        >>> pitches = [(0,), None, None, (2, 3), (1,)]
+        >>> attachments = [("foo",), (), (), (), ("foobar", "foo")]
+        >>> tuples = tuple(zip(durations, pitches, attachments))
+        >>> method = nauert.ColumnarQEventSequence.from_millisecond_pitch_attachment_tuples
+        >>> sequence = method(tuples)
+        >>> for q_event in sequence:
+        ...     q_event.offset, q_event.attachments
+        ...
+        (Offset((0, 1)), ('foo',))
+        (Offset((250, 1)), ())
+        (Offset((1750, 1)), ())
+        (Offset((3000, 1)), ('foobar', 'foo'))
+        (Offset((4000, 1)), ())
+
+        """
+        durations: list[int | float] = []
+        pitches: list = []
+        attachments: list[tuple] = []
+        for duration, pitches_, attachments_ in tuples:
+            if not 0 < duration:
+                raise ValueError(f"duration must be positive: {duration!r}.")
+            if pitches_ is None:
+                if attachments_:
+                    message = f"silences take no attachments: {attachments_!r}."
+                    raise ValueError(message)
+                if pitches and pitches[-1] is None:
+                    durations[-1] += duration
+                    continue
+            durations.append(duration)
+            pitches.append(pitches_)
+            attachments.append(tuple(attachments_))
+        offsets = list(itertools.accumulate(durations, initial=0))
+        return class_._from_columns(
+            offsets, pitches, attachments, resolution=resolution
+        )
+
+
+class _View(collections.abc.Sequence):
+    # read-only sequence of length items got by index; pickles as a tuple
+
+    __slots__ = ("_get", "_length")
+
+    def __init__(self, get, length):
+        self._get, self._length = get, length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple([self._get(_) for _ in range(self._length)[index]])
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        return self._get(index)
+
+    def __len__(self):
+        return self._length
+
+    def __reduce__(self):
+        return (tuple, (tuple(self),))
@@ -1,5 +1,7 @@
 import bisect
 import copy
+import fractions
+import math
 import typing
 
 import abjad
@@ -29,12 +31,15 @@ class QGridLeaf(abjad.rhythmtrees.RhythmTreeNode, uqbar.containers.UniqueTreeNod
         q_event_proxies: typing.Sequence[_qeventproxy.QEventProxy] = (),
         is_divisible: bool = True,
     ) -> None:
-        assert isinstance(preprolated_duration, abjad.Duration), repr(
-            preprolated_duration
-        )
-        assert q_event_proxies is not None, repr(q_event_proxies)
-        assert all(isinstance(x, _qeventproxy.QEventProxy) for x in q_event_proxies)
-        assert isinstance(is_divisible, bool), repr(is_divisible)
+        if not isinstance(preprolated_duration, abjad.Duration):
+            raise TypeError(f"must be duration: {preprolated_duration!r}.")
+        if q_event_proxies is None:
+            raise TypeError("q-event proxies must not be none.")
+        for q_event_proxy in q_event_proxies:
+            if not isinstance(q_event_proxy, _qeventproxy.QEventProxy):
+                raise TypeError(f"must be q-event proxy: {q_event_proxy!r}.")
+        if not isinstance(is_divisible, bool):
+            raise TypeError(f"must be boolean: {is_divisible!r}.")
         uqbar.containers.UniqueTreeNode.__init__(self)
         abjad.rhythmtrees.RhythmTreeNode.__init__(self, preprolated_duration.pair)
         self._q_event_proxies = list(q_event_proxies)
@@ -71,6 +76,24 @@ class QGridLeaf(abjad.rhythmtrees.RhythmTreeNode, uqbar.containers.UniqueTreeNod
         string += f" is_divisible={self.is_divisible!r})"
         return string
 
+    ### PRIVATE METHODS ###
+
+    @classmethod
+    def _from_trusted(
+        class_,
+        pair: tuple[int, int],
+        q_event_proxies: typing.Iterable[_qeventproxy.QEventProxy] = (),
+        is_divisible: bool = True,
+    ) -> "QGridLeaf":
+        # makes q-grid leaf of arguments already known to be valid, without
+        # checking them again
+        self = class_.__new__(class_)
+        uqbar.containers.UniqueTreeNode.__init__(self)
+        abjad.rhythmtrees.RhythmTreeNode.__init__(self, pair)
+        self._q_event_proxies = list(q_event_proxies)
+        self._is_divisible = is_divisible
+        return self
+
     ### PRIVATE PROPERTIES ###
 
     @property
@@ -285,6 +308,96 @@ class QGrid:
         string += f" next_downbeat={self.next_downbeat!r})"
         return string
 
+    ### PRIVATE METHODS ###
+
+    def _fit_q_events(
+        self, q_event_proxies: typing.Iterable[_qeventproxy.QEventProxy]
+    ) -> None:
+        # fits q-event proxies already known to be valid, without checking
+        # them again
+        leaves, offsets = self.leaves, self.offsets
+        for q_event_proxy in q_event_proxies:
+            idx = bisect.bisect_left(offsets, q_event_proxy.offset)
+            if q_event_proxy.offset == offsets[idx]:
+                leaves[idx].q_event_proxies.append(q_event_proxy)
+            else:
+                left, right = offsets[idx - 1], offsets[idx]
+                left_diff = abs(left - q_event_proxy.offset)
+                right_diff = abs(right - q_event_proxy.offset)
+                if right_diff < left_diff:
+                    leaves[idx].q_event_proxies.append(q_event_proxy)
+                else:
+                    leaves[idx - 1].q_event_proxies.append(q_event_proxy)
+
+    def _get_distance_and_leaf_count(
+        self,
+    ) -> tuple[fractions.Fraction | None, int]:
+        # walks the tree once, computing leaf offsets from preprolated
+        # durations as integer numerator-denominator pairs rather than
+        # querying the start offset of each leaf
+        leaves, offsets = [], []
+        nodes = [(self._root_node, 0, 1, 1, 1)]
+        while nodes:
+            node, numerator, denominator, duration_n, duration_d = nodes.pop()
+            if isinstance(node, QGridLeaf):
+                leaves.append(node)
+                offsets.append((numerator, denominator))
+                continue
+            pairs = [child.pair for child in node.children]
+            total_n, total_d = 0, 1
+            for child_n, child_d in pairs:
+                total_n, total_d = (
+                    total_n * child_d + child_n * total_d,
+                    total_d * child_d,
+                )
+            items = []
+            for child, (child_n, child_d) in zip(node.children, pairs):
+                child_n *= duration_n * total_d
+                child_d *= duration_d * total_n
+                items.append((child, numerator, denominator, child_n, child_d))
+                numerator = numerator * child_d + child_n * denominator
+                denominator *= child_d
+                gcd = math.gcd(numerator, denominator)
+                numerator, denominator = numerator // gcd, denominator // gcd
+            nodes.extend(reversed(items))
+        leaves.append(self._next_downbeat)
+        offsets.append((1, 1))
+        count, distance_n, distance_d = 0, 0, 1
+        for leaf, (numerator, denominator) in zip(leaves, offsets):
+            for q_event_proxy in leaf._q_event_proxies:
+                proxy_n = q_event_proxy._offset.numerator
+                proxy_d = q_event_proxy._offset.denominator
+                term_n = abs(proxy_n * denominator - numerator * proxy_d)
+                term_d = proxy_d * denominator
+                distance_n = distance_n * term_d + term_n * distance_d
+                distance_d *= term_d
+                gcd = math.gcd(distance_n, distance_d)
+                distance_n, distance_d = distance_n // gcd, distance_d // gcd
+                count += 1
+        if count:
+            distance = fractions.Fraction(distance_n, distance_d * count)
+            return distance, len(leaves)
+        return None, len(leaves)
+
+    def _rebind_q_event_proxies(
+        self, q_event_proxies: typing.Sequence[_qeventproxy.QEventProxy]
+    ) -> "QGrid":
+        # copies this QGrid, replacing each attached proxy with the proxy in
+        # q_event_proxies with the same offset; proxies sharing an offset are
+        # matched in order
+        proxies_by_offset: dict[abjad.Offset, list] = {}
+        for q_event_proxy in q_event_proxies:
+            proxies_by_offset.setdefault(q_event_proxy.offset, []).append(q_event_proxy)
+        memo = {}
+        for leaf in self.leaves:
+            for q_event_proxy in leaf.q_event_proxies:
+                proxies = proxies_by_offset[q_event_proxy.offset]
+                memo[id(q_event_proxy)] = proxies.pop(0)
+        assert not any(proxies_by_offset.values())
+        root_node = copy.deepcopy(self._root_node, memo)
+        next_downbeat = copy.deepcopy(self._next_downbeat, memo)
+        return type(self)(root_node, next_downbeat)
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -346,15 +459,10 @@ class QGrid:
             Duration(1, 8)
 
         """
-        count = 0
-        absolute_distance = abjad.Duration(0)
-        for leaf, offset in zip(self.leaves, self.offsets):
-            for q_event_proxy in leaf.q_event_proxies:
-                absolute_distance += abs(q_event_proxy.offset - offset)
-                count += 1
-        if count:
-            return absolute_distance / count
-        return None
+        distance, _ = self._get_distance_and_leaf_count()
+        if distance is None:
+            return None
+        return abjad.Duration(distance)
 
     @property
     def leaves(self) -> tuple[QGridLeaf, ...]:
@@ -411,20 +519,10 @@ class QGrid:
         Fits each ``QEventProxy`` in ``q_event_proxies`` onto the contained
         ``QGridLeaf`` whose offset is nearest.
         """
-        assert all(isinstance(x, _qeventproxy.QEventProxy) for x in q_event_proxies)
-        leaves, offsets = self.leaves, self.offsets
         for q_event_proxy in q_event_proxies:
-            idx = bisect.bisect_left(offsets, q_event_proxy.offset)
-            if q_event_proxy.offset == offsets[idx]:
-                leaves[idx].q_event_proxies.append(q_event_proxy)
-            else:
-                left, right = offsets[idx - 1], offsets[idx]
-                left_diff = abs(left - q_event_proxy.offset)
-                right_diff = abs(right - q_event_proxy.offset)
-                if right_diff < left_diff:
-                    leaves[idx].q_event_proxies.append(q_event_proxy)
-                else:
-                    leaves[idx - 1].q_event_proxies.append(q_event_proxy)
+            if not isinstance(q_event_proxy, _qeventproxy.QEventProxy):
+                raise TypeError(f"must be q-event proxy: {q_event_proxy!r}.")
+        self._fit_q_events(q_event_proxies)
 
     def regroup_leaves_with_unencessary_divisions(self) -> None:
         """
@@ -440,9 +538,8 @@ class QGrid:
                 if len(leaves) > 1 and all(
                     [_leaf.q_event_proxies == [] for _leaf in leaves[1:]]
                 ):
-                    new_leaf = QGridLeaf(
-                        preprolated_duration=abjad.Duration(parent.pair),
-                        q_event_proxies=leaves[0].q_event_proxies,
+                    new_leaf = QGridLeaf._from_trusted(
+                        abjad.Duration(parent.pair).pair, leaves[0].q_event_proxies
                     )
                     index = parent.parent.index(parent)
                     parent.parent[index] = [new_leaf]
@@ -470,16 +567,10 @@ class QGrid:
 
         Returns the ``QEventProxies`` attached to ``leaf``.
         """
-        children = []
-        for subdivision in subdivisions:
-            if isinstance(subdivision, int):
-                subdivision = abjad.Duration(subdivision)
-                child = QGridLeaf(preprolated_duration=subdivision)
-                children.append(child)
         container = QGridContainer(
             leaf.pair,
             children=[
-                QGridLeaf(preprolated_duration=abjad.Duration(subdivision))
+                QGridLeaf._from_trusted(abjad.Duration(subdivision).pair)
                 for subdivision in subdivisions
             ],
         )
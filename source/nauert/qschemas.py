@@ -30,7 +30,7 @@ class QSchema(abc.ABC):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_items", "_lookups")
+    __slots__ = ("_items", "_lookups", "_timeline")
 
     _keyword_argument_names: tuple[str, ...] = ()
 
@@ -67,6 +67,7 @@ class QSchema(abc.ABC):
             assert 0 <= min(items)
         self._items = dict(items)
         self._lookups = self._create_lookups()
+        self._timeline = self._compile_timeline()
 
     ### SPECIAL METHODS ###
 
@@ -76,15 +77,22 @@ class QSchema(abc.ABC):
         """
         assert isinstance(duration, abjad.Duration), repr(duration)
         target_items = []
-        idx, current_offset = 0, abjad.Offset(0)
-        duration = abjad.Duration(duration)
-        while current_offset < duration:
-            lookup = self[idx]
-            lookup["offset_in_ms"] = current_offset
-            target_item = self.target_item_class(**lookup)
+        positions, offsets, durations, lookups = self._timeline
+        # makes each run of target items sharing settings from one target
+        # item, copied to the offsets following it
+        for i, offset in enumerate(offsets):
+            if duration <= offset:
+                break
+            count = -(-(duration - offset) // durations[i])
+            if i + 1 < len(positions):
+                count = min(count, positions[i + 1] - positions[i])
+            target_item = self.target_item_class(
+                offset_in_ms=abjad.Offset(offset), **lookups[i]
+            )
             target_items.append(target_item)
-            current_offset += target_item.duration_in_ms
-            idx += 1
+            for j in range(1, count):
+                offset_in_ms = abjad.Offset(offset + j * durations[i])
+                target_items.append(target_item._copy_at(offset_in_ms))
         return self.target_class(target_items)
 
     def __getitem__(self, argument: int) -> dict:
@@ -92,23 +100,35 @@ class QSchema(abc.ABC):
         Gets item or slice identified by `argument`.
         """
         assert isinstance(argument, int) and 0 <= argument
-        result = {}
-        for field in self._lookups:
-            lookup = self._lookups[field].get(argument)
-            if lookup is not None:
-                result[field] = lookup
-            else:
-                keys = sorted(self._lookups[field].keys())
-                idx = bisect.bisect(keys, argument)
-                if len(keys) == idx:
-                    key = keys[-1]
-                elif argument < keys[idx]:
-                    key = keys[idx - 1]
-                result[field] = self._lookups[field][key]
-        return result
+        positions, _, _, lookups = self._timeline
+        return dict(lookups[bisect.bisect(positions, argument) - 1])
 
     ### PRIVATE METHODS ###
 
+    def _compile_timeline(self) -> tuple[tuple, tuple, tuple, tuple]:
+        # gets positions at which any setting changes, with the offset in
+        # milliseconds of the target item at each position, the duration in
+        # milliseconds of each target item up to the next position, and the
+        # settings in effect there
+        positions = sorted(set().union(*self._lookups.values()))
+        offsets: list[abjad.Offset] = []
+        durations: list[abjad.Duration] = []
+        lookups: list[dict] = []
+        lookup: dict = {}
+        for i, position in enumerate(positions):
+            for field, values in self._lookups.items():
+                if position in values:
+                    lookup[field] = values[position]
+            if i == 0:
+                offsets.append(abjad.Offset(0))
+            else:
+                count = position - positions[i - 1]
+                offsets.append(abjad.Offset(offsets[-1] + count * durations[-1]))
+            target_item = self.target_item_class(**lookup)
+            durations.append(target_item.duration_in_ms)
+            lookups.append(dict(lookup))
+        return tuple(positions), tuple(offsets), tuple(durations), tuple(lookups)
+
     def _create_lookups(self) -> dict[str, dict]:
         names = self._keyword_argument_names
         lookups = {}
@@ -165,6 +185,53 @@ class QSchema(abc.ABC):
         """
         return self._tempo
 
+    ### PUBLIC METHODS ###
+
+    def get_item_index(self, offset_in_ms: abjad.typings.Duration) -> int:
+        """
+        Gets index of the target item sounding at ``offset_in_ms`` in targets
+        made by q-schema.
+
+        ..  container:: example
+
+            >>> tempo = abjad.MetronomeMark(abjad.Duration(1, 4), 120)
+            >>> q_schema = nauert.BeatwiseQSchema({2: {"tempo": tempo}})
+            >>> q_schema.get_item_index(abjad.Offset(1999))
+            1
+
+            >>> q_schema.get_item_index(abjad.Offset(2750))
+            3
+
+        Bisects the timeline of q-schema.
+        """
+        offset_in_ms = abjad.Offset(offset_in_ms)
+        assert 0 <= offset_in_ms, repr(offset_in_ms)
+        positions, offsets, durations, _ = self._timeline
+        i = bisect.bisect(offsets, offset_in_ms) - 1
+        return positions[i] + (offset_in_ms - offsets[i]) // durations[i]
+
+    def get_item_offset_in_ms(self, index: int) -> abjad.Offset:
+        """
+        Gets offset in milliseconds of the target item at ``index`` in targets
+        made by q-schema.
+
+        ..  container:: example
+
+            >>> tempo = abjad.MetronomeMark(abjad.Duration(1, 4), 120)
+            >>> q_schema = nauert.BeatwiseQSchema({2: {"tempo": tempo}})
+            >>> q_schema.get_item_offset_in_ms(1)
+            Offset((1000, 1))
+
+            >>> q_schema.get_item_offset_in_ms(3)
+            Offset((2500, 1))
+
+        Bisects the timeline of q-schema.
+        """
+        assert isinstance(index, int) and 0 <= index, repr(index)
+        positions, offsets, durations, _ = self._timeline
+        i = bisect.bisect(positions, index) - 1
+        return abjad.Offset(offsets[i] + (index - positions[i]) * durations[i])
+
 
 class BeatwiseQSchema(QSchema):
     r"""
@@ -305,7 +372,14 @@ class BeatwiseQSchema(QSchema):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_beatspan", "_items", "_lookups", "_search_tree", "_tempo")
+    __slots__ = (
+        "_beatspan",
+        "_items",
+        "_lookups",
+        "_search_tree",
+        "_tempo",
+        "_timeline",
+    )
 
     _keyword_argument_names = ("beatspan", "search_tree", "tempo")
 
@@ -531,6 +605,7 @@ class MeasurewiseQSchema(QSchema):
         "_search_tree",
         "_tempo",
         "_time_signature",
+        "_timeline",
         "_use_full_measure",
     )
 
@@ -52,6 +52,7 @@ class QTargetBeat(QTargetItem):
 
     __slots__ = (
         "_beatspan",
+        "_duration_in_ms",
         "_grouping",
         "_offset_in_ms",
         "_q_events",
@@ -80,6 +81,7 @@ class QTargetBeat(QTargetItem):
         q_events: list[_qevents.QEvent] = []
         q_grids: tuple[_qgrid.QGrid, ...] = ()
         self._beatspan = beatspan
+        self._duration_in_ms = tempo.duration_to_milliseconds(beatspan)
         self._offset_in_ms = offset_in_ms
         self._q_events = q_events
         self._q_grid: _qgrid.QGrid | None = None
@@ -98,15 +100,21 @@ class QTargetBeat(QTargetItem):
         if not self.q_events:
             return None
         assert all(isinstance(x, _qevents.QEvent) for x in self.q_events)
+        # maps q-event offsets into the range 0-1 of the beat in one pass of
+        # integer arithmetic, making one offset per q-event proxy
+        start_n, start_d = self._offset_in_ms.pair
+        duration_n, duration_d = self._duration_in_ms.pair
         q_event_proxies = []
         for q_event in self.q_events:
-            q_event_proxy = _qeventproxy.QEventProxy(
-                q_event,
-                self.offset_in_ms,
-                self.offset_in_ms + self.duration_in_ms,
-            )
+            numerator, denominator = q_event.offset.pair
+            numerator = (numerator * start_d - start_n * denominator) * duration_d
+            denominator *= start_d * duration_n
+            assert 0 <= numerator <= denominator, repr(q_event)
+            offset = abjad.Offset(numerator, denominator)
+            q_event_proxy = _qeventproxy.QEventProxy._from_trusted(q_event, offset)
             q_event_proxies.append(q_event_proxy)
-        return _quantizationjob.QuantizationJob(
+        # q-event proxies made here need no checking again
+        return _quantizationjob.QuantizationJob._from_trusted(
             job_id, self.search_tree, q_event_proxies
         )
 
@@ -119,6 +127,23 @@ class QTargetBeat(QTargetItem):
         string += f" search_tree={self.search_tree!r}, tempo={self.tempo!r})"
         return string
 
+    ### PRIVATE METHODS ###
+
+    def _copy_at(self, offset_in_ms: abjad.Offset) -> "QTargetBeat":
+        # makes q-target beat with the settings of this q-target beat, but no
+        # q-events, starting at offset_in_ms; skips checking the settings
+        # again and computing duration again
+        beat = type(self).__new__(type(self))
+        beat._beatspan = self._beatspan
+        beat._duration_in_ms = self._duration_in_ms
+        beat._offset_in_ms = offset_in_ms
+        beat._q_events = []
+        beat._q_grid = None
+        beat._q_grids = ()
+        beat._search_tree = self._search_tree
+        beat._tempo = self._tempo
+        return beat
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -165,7 +190,7 @@ class QTargetBeat(QTargetItem):
         Duration(3750, 7)
 
         """
-        return self.tempo.duration_to_milliseconds(self.beatspan)
+        return self._duration_in_ms
 
     @property
     def offset_in_ms(self) -> abjad.Offset:
@@ -357,17 +382,17 @@ class QTargetMeasure(QTargetItem):
             beats.append(beat)
         else:
             beatspan = abjad.Duration(1, _time_signature.denominator)
-            current_offset_in_ms = offset_in_ms
-            beatspan_duration_in_ms = tempo.duration_to_milliseconds(beatspan)
-            for i in range(_time_signature.numerator):
-                beat = QTargetBeat(
-                    beatspan=beatspan,
-                    offset_in_ms=current_offset_in_ms,
-                    search_tree=search_tree,
-                    tempo=tempo,
+            beat = QTargetBeat(
+                beatspan=beatspan,
+                offset_in_ms=offset_in_ms,
+                search_tree=search_tree,
+                tempo=tempo,
+            )
+            beats.append(beat)
+            for i in range(1, _time_signature.numerator):
+                beats.append(
+                    beat._copy_at(abjad.Offset(offset_in_ms + i * beat.duration_in_ms))
                 )
-                beats.append(beat)
-                current_offset_in_ms += beatspan_duration_in_ms
         self._beats = tuple(beats)
         self._offset_in_ms = offset_in_ms
         self._search_tree = search_tree
@@ -386,6 +411,28 @@ class QTargetMeasure(QTargetItem):
         string += f" use_full_measure={self.use_full_measure!r})"
         return string
 
+    ### PRIVATE METHODS ###
+
+    def _copy_at(self, offset_in_ms: abjad.Offset) -> "QTargetMeasure":
+        # makes q-target measure with the settings of this q-target measure,
+        # but no q-events, starting at offset_in_ms; skips checking the
+        # settings again
+        measure = type(self).__new__(type(self))
+        measure._beats = tuple(
+            [
+                _._copy_at(
+                    abjad.Offset(offset_in_ms + _.offset_in_ms - self._offset_in_ms)
+                )
+                for _ in self._beats
+            ]
+        )
+        measure._offset_in_ms = offset_in_ms
+        measure._search_tree = self._search_tree
+        measure._tempo = self._tempo
+        measure._time_signature = self._time_signature
+        measure._use_full_measure = self._use_full_measure
+        return measure
+
     ### PUBLIC PROPERTIES ###
 
     @property
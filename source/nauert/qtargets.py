@@ -1,6 +1,10 @@
 import abc
+import asyncio
 import bisect
 import copy
+import functools
+import itertools
+import time
 import typing
 
 import abjad
@@ -13,6 +17,8 @@ from . import qeventproxy as _qeventproxy
 from . import qevents as _qevents
 from . import qeventsequence as _qeventsequence
 from . import qtargetitems as _qtargetitems
+from . import quantizationjob as _quantizationjob
+from . import recorders as _recorders
 
 
 class QTarget(abc.ABC):
@@ -56,20 +62,148 @@ class QTarget(abc.ABC):
             _attackpointoptimizers.AttackPointOptimizer | None
         ) = None,
         attach_tempos: bool = True,
+        recorder: _recorders.Recorder | None = None,
     ):
         """
         Calls q-target.
         """
         assert isinstance(q_event_sequence, _qeventsequence.QEventSequence)
+        grace_handler, heuristic, attack_point_optimizer, recorder = self._get_handlers(
+            grace_handler, heuristic, attack_point_optimizer, recorder
+        )
+        if job_handler is None:
+            job_handler = _jobhandlers.SerialJobHandler()
+        assert isinstance(job_handler, _jobhandlers.JobHandler)
+        jobs, duplicate_jobs = self._make_jobs(q_event_sequence, recorder)
+        start = time.perf_counter()
+        with recorder.stage("handle_jobs", len(jobs)):
+            jobs = job_handler(jobs)
+        if recorder.records_beats:
+            self._record_jobs(jobs, duplicate_jobs, recorder, start)
+        return self._notate_jobs(
+            jobs,
+            duplicate_jobs,
+            attach_tempos=attach_tempos,
+            attack_point_optimizer=attack_point_optimizer,
+            grace_handler=grace_handler,
+            heuristic=heuristic,
+            recorder=recorder,
+        )
+
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _assign_next_q_events(
+        q_events: typing.Iterator[_qevents.QEvent],
+        q_event: _qevents.QEvent | None,
+        beats: typing.Sequence[_qtargetitems.QTargetBeat],
+        start: int,
+        stop: int,
+    ) -> _qevents.QEvent | None:
+        # appends q_event and the next q-events of q_events to beats start to
+        # stop, each to the last beat starting at or before it; returns the
+        # first q-event of a later beat, if any
+        for index in range(start, stop):
+            next_offset = None
+            if index + 1 < len(beats):
+                next_offset = beats[index + 1].offset_in_ms
+            while q_event is not None and (
+                next_offset is None or q_event.offset < next_offset
+            ):
+                beats[index].q_events.append(q_event)
+                q_event = next(q_events, None)
+        return q_event
+
+    @staticmethod
+    def _assign_q_events(
+        q_event_sequence: _qeventsequence.QEventSequence,
+        beats: typing.Sequence[_qtargetitems.QTargetBeat],
+    ) -> None:
+        # appends each q-event to the last beat starting at or before it;
+        # walks q-events and beats together, both sorted by offset, comparing
+        # offsets as integer pairs
+        pairs = [beat.offset_in_ms.pair for beat in beats]
+        index, count = -1, len(beats)
+        for q_event in q_event_sequence:
+            numerator, denominator = q_event.offset.pair
+            while index + 1 < count:
+                beat_n, beat_d = pairs[index + 1]
+                if numerator * beat_d < beat_n * denominator:
+                    break
+                index += 1
+            beats[index].q_events.append(q_event)
+
+    def _call_segmentwise(
+        self,
+        q_event_sequence: _qeventsequence.QEventSequence,
+        segment_duration_in_ms: int,
+        grace_handler: _gracehandlers.GraceHandler | None = None,
+        heuristic: _heuristics.Heuristic | None = None,
+        job_handler: _jobhandlers.JobHandler | None = None,
+        attack_point_optimizer: (
+            _attackpointoptimizers.AttackPointOptimizer | None
+        ) = None,
+        attach_tempos: bool = True,
+        recorder: _recorders.Recorder | None = None,
+    ) -> abjad.Voice:
+        assert isinstance(q_event_sequence, _qeventsequence.QEventSequence)
+        assert 0 < segment_duration_in_ms, repr(segment_duration_in_ms)
+        grace_handler, heuristic, attack_point_optimizer, recorder = self._get_handlers(
+            grace_handler, heuristic, attack_point_optimizer, recorder
+        )
+        if job_handler is None:
+            job_handler = _jobhandlers.SerialJobHandler()
+        assert isinstance(job_handler, _jobhandlers.JobHandler)
+        with recorder.stage("make_segments", len(q_event_sequence)):
+            jobs = self._make_segment_jobs(
+                q_event_sequence,
+                segment_duration_in_ms,
+                grace_handler=grace_handler,
+                heuristic=heuristic,
+                attack_point_optimizer=attack_point_optimizer,
+                attach_tempos=attach_tempos,
+            )
+        with recorder.stage("handle_jobs", len(jobs)):
+            jobs = job_handler(jobs)
+        with recorder.stage("stitch", len(jobs)):
+            return self._stitch(jobs)
+
+    @staticmethod
+    def _drop_q_grids(items: typing.Sequence[_qtargetitems.QTargetItem]) -> None:
+        # forgets the q-events and q-grids of the beats of notated items
+        for item in items:
+            for beat in QTarget._get_beats(item):
+                beat._q_events = []
+                beat._q_grid = None
+                beat._q_grids = ()
+
+    @staticmethod
+    def _get_beats(
+        item: _qtargetitems.QTargetItem,
+    ) -> typing.Sequence[_qtargetitems.QTargetBeat]:
+        if isinstance(item, _qtargetitems.QTargetMeasure):
+            return item.beats
+        assert isinstance(item, _qtargetitems.QTargetBeat)
+        return (item,)
+
+    def _get_handlers(
+        self,
+        grace_handler: _gracehandlers.GraceHandler | None,
+        heuristic: _heuristics.Heuristic | None,
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer | None,
+        recorder: _recorders.Recorder | None,
+    ) -> tuple[
+        _gracehandlers.GraceHandler,
+        _heuristics.Heuristic,
+        _attackpointoptimizers.AttackPointOptimizer,
+        _recorders.Recorder,
+    ]:
         if grace_handler is None:
             grace_handler = _gracehandlers.ConcatenatingGraceHandler()
         assert isinstance(grace_handler, _gracehandlers.GraceHandler)
         if heuristic is None:
             heuristic = _heuristics.DistanceHeuristic()
         assert isinstance(heuristic, _heuristics.Heuristic)
-        if job_handler is None:
-            job_handler = _jobhandlers.SerialJobHandler()
-        assert isinstance(job_handler, _jobhandlers.JobHandler)
         if attack_point_optimizer is None:
             attack_point_optimizer = _attackpointoptimizers.NaiveAttackPointOptimizer()
         assert isinstance(
@@ -83,58 +217,301 @@ class QTarget(abc.ABC):
                 self.__class__.__name__, attack_point_optimizer.__class__.__name__
             )
             raise TypeError(message)
+        if recorder is None:
+            recorder = _recorders.NullRecorder()
+        assert isinstance(recorder, _recorders.Recorder), repr(recorder)
+        return grace_handler, heuristic, attack_point_optimizer, recorder
+
+    @staticmethod
+    def _group_equivalent_jobs(
+        jobs: typing.Sequence[_quantizationjob.QuantizationJob],
+    ) -> tuple[
+        list[_quantizationjob.QuantizationJob],
+        dict[int, list[_quantizationjob.QuantizationJob]],
+    ]:
+        # jobs with equal search trees and equal proxy offsets generate
+        # equivalent QGrids; keep the first job of each group and map its
+        # job ID to the remaining jobs of the group
+        unique_jobs = []
+        duplicate_jobs: dict[int, list[_quantizationjob.QuantizationJob]] = {}
+        groups: dict[tuple, list[_quantizationjob.QuantizationJob]] = {}
+        for job in jobs:
+            key = tuple(_.offset for _ in job.q_event_proxies)
+            candidates = groups.setdefault(key, [])
+            for candidate in candidates:
+                if candidate.search_tree == job.search_tree:
+                    duplicate_jobs.setdefault(candidate.job_id, []).append(job)
+                    break
+            else:
+                candidates.append(job)
+                unique_jobs.append(job)
+        return unique_jobs, duplicate_jobs
+
+    @abc.abstractmethod
+    def _is_releasable(self, voice: abjad.Voice, start: int) -> bool:
+        raise NotImplementedError
+
+    def _iterate_notation(
+        self,
+        grace_handler: _gracehandlers.GraceHandler,
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+        selection: typing.Iterable[list[_qeventproxy.QEventProxy]],
+        recorder: _recorders.Recorder,
+        attach_tempos: bool = True,
+    ) -> typing.Iterator[abjad.Component]:
+        # notate item by item, once selection has selected the q-grids of the
+        # item, releasing the components of a voice as soon as no later item
+        # can change them; selection gives the orphaned q-event proxies of
+        # each item
+        voice = abjad.Voice()
+        items: list[_qtargetitems.QTargetItem] = []
+        previous_item = None
+        index = 0
+        orphaned_q_event_proxies: list[_qeventproxy.QEventProxy] = []
+        for item, orphaned_q_event_proxies in zip(self.items, selection, strict=True):
+            with recorder.stage("notate", 1):
+                start = len(voice)
+                start_time = time.perf_counter()
+                voice.extend(self._notate_item(item, previous_item, attach_tempos))
+                if recorder.records_beats:
+                    stop_time = time.perf_counter()
+                    index = self._record_notation(
+                        item, index, recorder, start_time, stop_time
+                    )
+                self._notate_leaves(grace_handler=grace_handler, voice=voice[start:])
+                components = []
+                if start and self._is_releasable(voice, start):
+                    components = self._release_notation(
+                        voice, start, items, attack_point_optimizer
+                    )
+                    self._drop_q_grids(items)
+                    items = []
+            yield from components
+            items.append(item)
+            previous_item = item
+        with recorder.stage("notate", 0):
+            # the last items are final
+            components = self._release_notation(
+                voice, len(voice), items, attack_point_optimizer
+            )
+            self._drop_q_grids(items)
+        with recorder.stage("handle_orphans", len(orphaned_q_event_proxies)):
+            handle_orphaned_q_events = getattr(
+                grace_handler, "handle_orphaned_q_event_proxies", None
+            )
+            if callable(handle_orphaned_q_events) and orphaned_q_event_proxies:
+                last_leaf = abjad.select.leaf(components, -1)
+                handle_orphaned_q_events(last_leaf, orphaned_q_event_proxies)
+        yield from components
+
+    def _iterate_selection(
+        self,
+        q_event_sequence: _qeventsequence.QEventSequence,
+        job_handler: _jobhandlers.JobHandler,
+        heuristic: _heuristics.Heuristic,
+        recorder: _recorders.Recorder,
+    ) -> typing.Iterator[list[_qeventproxy.QEventProxy]]:
+        # parcel out QEvents, search and select QGrids item by item, only as
+        # each item is about to be notated; gives the orphaned q-event
+        # proxies of each item
+        beats = self.beats
+        q_events = iter(q_event_sequence)
+        q_event = next(q_events, None)
+        start = 0
+        for item in self.items:
+            stop = start + len(self._get_beats(item))
+            with recorder.stage("assign_q_events", stop - start):
+                q_event = self._assign_next_q_events(
+                    q_events, q_event, beats, start, stop
+                )
+            jobs, duplicate_jobs = self._make_beat_jobs(recorder, start, stop)
+            time_start = time.perf_counter()
+            with recorder.stage("handle_jobs", len(jobs)):
+                if jobs:
+                    jobs = job_handler(jobs)
+            if recorder.records_beats:
+                self._record_jobs(jobs, duplicate_jobs, recorder, time_start)
+            yield self._select_q_grids(
+                jobs, duplicate_jobs, heuristic, recorder, start=start, stop=stop
+            )
+            start = stop
+
+    def _make_beat_jobs(
+        self, recorder: _recorders.Recorder, start: int, stop: int
+    ) -> tuple[
+        list[_quantizationjob.QuantizationJob],
+        dict[int, list[_quantizationjob.QuantizationJob]],
+    ]:
+        # generate QuantizationJobs for beats start to stop, keeping only one
+        # job per group of equivalent jobs for the JobHandler to process
+        beats = self.beats
+        with recorder.stage("make_jobs", stop - start):
+            if recorder.records_beats:
+                all_jobs = []
+                for i in range(start, stop):
+                    beat = beats[i]
+                    time_start = time.perf_counter()
+                    all_jobs.append(beat(i))
+                    time_stop = time.perf_counter()
+                    recorder.record_beat(
+                        "make_jobs", i, time_start, time_stop, len(beat.q_events)
+                    )
+            else:
+                all_jobs = [beats[i](i) for i in range(start, stop)]
+            jobs = [job for job in all_jobs if job]
+            return self._group_equivalent_jobs(jobs)
+
+    def _make_jobs(
+        self,
+        q_event_sequence: _qeventsequence.QEventSequence,
+        recorder: _recorders.Recorder,
+    ) -> tuple[
+        list[_quantizationjob.QuantizationJob],
+        dict[int, list[_quantizationjob.QuantizationJob]],
+    ]:
         # parcel QEvents out to each beat
         beats = self.beats
-        offsets = sorted([beat.offset_in_ms for beat in beats])
-        for q_event in q_event_sequence:
-            index = bisect.bisect(offsets, q_event.offset) - 1
-            beat = beats[index]
-            beat.q_events.append(q_event)
-        # generate QuantizationJobs and process with the JobHandler
-        jobs = [beat(i) for i, beat in enumerate(beats)]
-        jobs = [job for job in jobs if job]
-        jobs = job_handler(jobs)
-        for job in jobs:
-            assert job is not None
-            beats[job.job_id]._q_grids = job.q_grids
-        # select the best QGrid for each beat, according to the Heuristic
-        beats = heuristic(beats)
-        # shift QEvents attached to each QGrid's "next downbeat"
-        # over to the next QGrid's first leaf - the real downbeat
-        orphaned_q_events_proxies = self._shift_downbeat_q_events_to_next_q_grid()
-        # TODO: handle a final QGrid with QEvents attached to its next_downbeat
-        # TODO: remove a final QGrid with no QEvents
-        self._regroup_q_grid_with_unnecessary_divisions()
-        # convert the QGrid representation into notation,
-        # handling grace-note behavior with the GraceHandler
-        notation = self._notate(
-            attach_tempos=attach_tempos,
-            attack_point_optimizer=attack_point_optimizer,
+        with recorder.stage("assign_q_events", len(q_event_sequence)):
+            self._assign_q_events(q_event_sequence, beats)
+        return self._make_beat_jobs(recorder, 0, len(beats))
+
+    def _make_segment_jobs(
+        self,
+        q_event_sequence: _qeventsequence.QEventSequence,
+        segment_duration_in_ms: int,
+        grace_handler: _gracehandlers.GraceHandler,
+        heuristic: _heuristics.Heuristic,
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+        attach_tempos: bool = True,
+    ) -> list["QuantizationSegmentJob"]:
+        # split items into segments of at least segment_duration_in_ms, at
+        # item boundaries which no QEvent crosses: a QEvent must start on the
+        # boundary, or a SilentQEvent must sound across it, and the beat
+        # before the boundary must have no QEvent in its second half, which
+        # some QGrid would fit onto the boundary
+        q_events = list(q_event_sequence)
+        offsets = [_.offset for _ in q_events]
+        items = self.items
+        jobs: list[QuantizationSegmentJob] = []
+        start, q_event_start = 0, 0
+        for i in range(1, len(items)):
+            offset = items[i].offset_in_ms
+            if offset - items[start].offset_in_ms < segment_duration_in_ms:
+                continue
+            index = bisect.bisect_left(offsets, offset)
+            if isinstance(q_events[index], _qevents.TerminalQEvent):
+                break
+            if index == q_event_start:
+                continue
+            if offsets[index] != offset and not isinstance(
+                q_events[index - 1], _qevents.SilentQEvent
+            ):
+                continue
+            previous_item = items[i - 1]
+            if isinstance(previous_item, _qtargetitems.QTargetMeasure):
+                beat = previous_item.beats[-1]
+            else:
+                assert isinstance(previous_item, _qtargetitems.QTargetBeat)
+                beat = previous_item
+            middle = beat.offset_in_ms + beat.duration_in_ms / 2
+            if middle < offsets[index - 1]:
+                continue
+            segment = q_events[q_event_start:index]
+            segment.append(_qevents.TerminalQEvent(abjad.Offset(offset)))
+            job = QuantizationSegmentJob(
+                len(jobs),
+                type(self)(items[start:i]),
+                _qeventsequence.QEventSequence._from_trusted(segment),
+                grace_handler=grace_handler,
+                heuristic=heuristic,
+                attack_point_optimizer=attack_point_optimizer,
+                attach_tempos=attach_tempos,
+            )
+            jobs.append(job)
+            start, q_event_start = i, index
+            if offsets[index] != offset:
+                # a rest starting on the boundary continues the rest
+                q_events[index:index] = [_qevents.SilentQEvent(abjad.Offset(offset))]
+                offsets[index:index] = [offset]
+        job = QuantizationSegmentJob(
+            len(jobs),
+            type(self)(items[start:]),
+            _qeventsequence.QEventSequence._from_trusted(q_events[q_event_start:]),
             grace_handler=grace_handler,
+            heuristic=heuristic,
+            attack_point_optimizer=attack_point_optimizer,
+            attach_tempos=attach_tempos,
         )
-        handle_orphaned_q_events = getattr(
-            grace_handler, "handle_orphaned_q_event_proxies", None
-        )
-        if callable(handle_orphaned_q_events) and orphaned_q_events_proxies:
-            last_leaf = abjad.get.leaf(notation, -1)
-            handle_orphaned_q_events(last_leaf, orphaned_q_events_proxies)
-        return notation
-
-    ### PRIVATE METHODS ###
+        jobs.append(job)
+        return jobs
 
-    @abc.abstractmethod
     def _notate(
         self,
         grace_handler: _gracehandlers.GraceHandler,
         attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+        recorder: _recorders.Recorder,
         attach_tempos: bool = True,
     ) -> abjad.Voice:
+        voice = abjad.Voice()
+        previous_item = None
+        index = 0
+        for item in self.items:
+            start = time.perf_counter()
+            voice.extend(self._notate_item(item, previous_item, attach_tempos))
+            if recorder.records_beats:
+                stop = time.perf_counter()
+                index = self._record_notation(item, index, recorder, start, stop)
+            previous_item = item
+        # apply logical ties, pitches, grace containers
+        self._notate_leaves(grace_handler=grace_handler, voice=voice)
+        # partition logical ties
+        self._optimize(voice, self.items, attack_point_optimizer)
+        return voice
+
+    @abc.abstractmethod
+    def _notate_item(
+        self,
+        item: _qtargetitems.QTargetItem,
+        previous_item: _qtargetitems.QTargetItem | None,
+        attach_tempos: bool = True,
+    ) -> typing.Sequence[abjad.Component]:
         raise NotImplementedError
 
+    def _notate_jobs(
+        self,
+        jobs: typing.Sequence[_quantizationjob.QuantizationJob],
+        duplicate_jobs: dict[int, list[_quantizationjob.QuantizationJob]],
+        grace_handler: _gracehandlers.GraceHandler,
+        heuristic: _heuristics.Heuristic,
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+        recorder: _recorders.Recorder,
+        attach_tempos: bool = True,
+    ) -> abjad.Voice:
+        orphaned_q_events_proxies = self._select_q_grids(
+            jobs, duplicate_jobs, heuristic, recorder
+        )
+        # convert the QGrid representation into notation,
+        # handling grace-note behavior with the GraceHandler
+        with recorder.stage("notate", len(self.beats)):
+            notation = self._notate(
+                attach_tempos=attach_tempos,
+                attack_point_optimizer=attack_point_optimizer,
+                grace_handler=grace_handler,
+                recorder=recorder,
+            )
+        with recorder.stage("handle_orphans", len(orphaned_q_events_proxies)):
+            handle_orphaned_q_events = getattr(
+                grace_handler, "handle_orphaned_q_event_proxies", None
+            )
+            if callable(handle_orphaned_q_events) and orphaned_q_events_proxies:
+                last_leaf = abjad.get.leaf(notation, -1)
+                handle_orphaned_q_events(last_leaf, orphaned_q_events_proxies)
+        return notation
+
     def _notate_leaves(
         self,
         grace_handler: _gracehandlers.GraceHandler,
-        voice: abjad.Voice | None = None,
+        voice: abjad.Voice | typing.Sequence[abjad.Component] | None = None,
     ):
         for leaf in abjad.iterate.leaves(voice):
             if leaf._has_indicator(dict):
@@ -187,12 +564,137 @@ class QTarget(abc.ABC):
                 abjad.detach(abjad.TimeSignature, new_leaf)
                 abjad.attach(time_signature, new_leaf)
 
-    def _regroup_q_grid_with_unnecessary_divisions(self):
-        for beat in self.beats:
+    @abc.abstractmethod
+    def _optimize(
+        self,
+        voice: abjad.Voice,
+        items: typing.Sequence[_qtargetitems.QTargetItem],
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+    ) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def _record_jobs(
+        jobs: typing.Sequence[_quantizationjob.QuantizationJob],
+        duplicate_jobs: dict[int, list[_quantizationjob.QuantizationJob]],
+        recorder: _recorders.Recorder,
+        start: float,
+    ) -> None:
+        # jobs may run in other processes, whose clocks differ: time each
+        # searched beat by the elapsed time of its search, from the start of
+        # the stage; the beats of duplicate jobs were not searched
+        for job in jobs:
+            recorder.record_job(job)
+            elapsed_time = 0.0
+            if job.statistics is not None:
+                elapsed_time = job.statistics.elapsed_time
+            count = len(job.q_event_proxies)
+            stop = start + elapsed_time
+            recorder.record_beat("handle_jobs", job.job_id, start, stop, count)
+            for duplicate_job in duplicate_jobs.get(job.job_id, ()):
+                count = len(duplicate_job.q_event_proxies)
+                job_id = duplicate_job.job_id
+                recorder.record_beat("handle_jobs", job_id, start, start, count)
+
+    @staticmethod
+    def _record_notation(
+        item: _qtargetitems.QTargetItem,
+        index: int,
+        recorder: _recorders.Recorder,
+        start: float,
+        stop: float,
+    ) -> int:
+        # the beats of a measure share the timing of their measure; returns
+        # the index of the first beat of the next item
+        for beat in QTarget._get_beats(item):
+            recorder.record_beat("notate", index, start, stop, len(beat.q_events))
+            index += 1
+        return index
+
+    @staticmethod
+    def _regroup_q_grid_with_unnecessary_divisions(
+        beats: typing.Sequence[_qtargetitems.QTargetBeat],
+    ) -> None:
+        for beat in beats:
+            assert beat.q_grid is not None
             beat.q_grid.regroup_leaves_with_unencessary_divisions()
 
-    def _shift_downbeat_q_events_to_next_q_grid(self) -> list[_qeventproxy.QEventProxy]:
-        beats = self.beats
+    @abc.abstractmethod
+    def _release_notation(
+        self,
+        voice: abjad.Voice,
+        count: int,
+        items: typing.Sequence[_qtargetitems.QTargetItem],
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+    ) -> list[abjad.Component]:
+        raise NotImplementedError
+
+    def _select_q_grids(
+        self,
+        jobs: typing.Sequence[_quantizationjob.QuantizationJob],
+        duplicate_jobs: dict[int, list[_quantizationjob.QuantizationJob]],
+        heuristic: _heuristics.Heuristic,
+        recorder: _recorders.Recorder,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> list[_qeventproxy.QEventProxy]:
+        # selects QGrids for beats start to stop, whose jobs are jobs and
+        # duplicate_jobs; returns the orphaned q-event proxies of beat stop
+        # less one
+        all_beats = self.beats
+        if stop is None:
+            stop = len(all_beats)
+        beats = all_beats[start:stop]
+        for job in jobs:
+            assert job is not None
+            beats[job.job_id - start]._q_grids = job.q_grids
+            for duplicate_job in duplicate_jobs.get(job.job_id, ()):
+                beats[duplicate_job.job_id - start]._q_grids = job.q_grids
+                duplicate_job._statistics = job.statistics
+        # select the best QGrid for each beat, according to the Heuristic
+        time_start = time.perf_counter()
+        with recorder.stage("heuristic", len(beats)):
+            beats = heuristic(beats)
+        if recorder.records_beats:
+            time_stop = time.perf_counter()
+            for i, beat in enumerate(beats, start):
+                recorder.record_beat(
+                    "heuristic", i, time_start, time_stop, len(beat.q_grids)
+                )
+        # give each duplicate beat its own copy of its selected QGrid,
+        # rebound to its own QEvents
+        duplicate_count = sum(len(_) for _ in duplicate_jobs.values())
+        with recorder.stage("rebind_duplicates", duplicate_count):
+            for duplicate_job in itertools.chain(*duplicate_jobs.values()):
+                beat = beats[duplicate_job.job_id - start]
+                assert beat.q_grid is not None
+                proxies = duplicate_job.q_event_proxies
+                beat._q_grid = beat.q_grid._rebind_q_event_proxies(proxies)
+        if recorder.records_beats:
+            search_jobs = {}
+            for job in jobs:
+                search_jobs[job.job_id] = job
+                for duplicate_job in duplicate_jobs.get(job.job_id, ()):
+                    search_jobs[duplicate_job.job_id] = job
+            for i, beat in enumerate(beats, start):
+                recorder.record_selection(i, beat, search_jobs.get(i))
+        # shift QEvents attached to each QGrid's "next downbeat"
+        # over to the next QGrid's first leaf - the real downbeat, from the
+        # beat before start on
+        with recorder.stage("shift_downbeats", len(beats)):
+            orphaned_q_events_proxies = self._shift_downbeat_q_events_to_next_q_grid(
+                all_beats[max(start - 1, 0) : stop]
+            )
+        # TODO: handle a final QGrid with QEvents attached to its next_downbeat
+        # TODO: remove a final QGrid with no QEvents
+        with recorder.stage("regroup", len(beats)):
+            self._regroup_q_grid_with_unnecessary_divisions(beats)
+        return orphaned_q_events_proxies
+
+    @staticmethod
+    def _shift_downbeat_q_events_to_next_q_grid(
+        beats: typing.Sequence[_qtargetitems.QTargetBeat],
+    ) -> list[_qeventproxy.QEventProxy]:
         assert beats[-1].q_grid is not None
         for one, two in abjad.sequence.nwise(beats):
             one_q_events = one.q_grid.next_downbeat.q_event_proxies
@@ -205,6 +707,31 @@ class QTarget(abc.ABC):
             if not isinstance(proxy.q_event, _qevents.TerminalQEvent)
         ]
 
+    @staticmethod
+    def _stitch(jobs: typing.Sequence["QuantizationSegmentJob"]) -> abjad.Voice:
+        # the first item of each segment is notated like the first item of
+        # a whole voice: detach its tempo and time signature when the last
+        # item of the previous segment has them already
+        voice = abjad.Voice()
+        previous_item = None
+        for job in jobs:
+            notation = job.notation
+            assert notation is not None
+            item = job.q_target.items[0]
+            if previous_item is not None:
+                leaf = abjad.select.leaf(notation, 0, grace=False)
+                if item.tempo == previous_item.tempo:
+                    abjad.detach(abjad.MetronomeMark, leaf)
+                if isinstance(item, _qtargetitems.QTargetMeasure):
+                    assert isinstance(previous_item, _qtargetitems.QTargetMeasure)
+                    if item.time_signature == previous_item.time_signature:
+                        abjad.detach(abjad.TimeSignature, leaf)
+            components = notation[:]
+            del notation[:]
+            voice.extend(components)
+            previous_item = job.q_target.items[-1]
+        return voice
+
     ### PUBLIC PROPERTIES ###
 
     @abc.abstractproperty
@@ -236,6 +763,113 @@ class QTarget(abc.ABC):
         """
         return self._items
 
+    ### PUBLIC METHODS ###
+
+    async def call_async(
+        self,
+        q_event_sequence: _qeventsequence.QEventSequence,
+        grace_handler: _gracehandlers.GraceHandler | None = None,
+        heuristic: _heuristics.Heuristic | None = None,
+        job_handler: _jobhandlers.AsyncJobHandler | None = None,
+        attack_point_optimizer: (
+            _attackpointoptimizers.AttackPointOptimizer | None
+        ) = None,
+        attach_tempos: bool = True,
+        recorder: _recorders.Recorder | None = None,
+    ) -> abjad.Voice:
+        """
+        Calls q-target asynchronously.
+
+        Awaits ``job_handler`` for the ``QuantizationJobs``, and runs every
+        other stage on the default executor of the running event loop, so
+        that the event loop is never blocked.
+        """
+        assert isinstance(q_event_sequence, _qeventsequence.QEventSequence)
+        grace_handler, heuristic, attack_point_optimizer, recorder = self._get_handlers(
+            grace_handler, heuristic, attack_point_optimizer, recorder
+        )
+        if job_handler is None:
+            job_handler = _jobhandlers.AsyncExecutorJobHandler()
+        assert isinstance(job_handler, _jobhandlers.AsyncJobHandler)
+        loop = asyncio.get_running_loop()
+        jobs, duplicate_jobs = await loop.run_in_executor(
+            None, self._make_jobs, q_event_sequence, recorder
+        )
+        start = time.perf_counter()
+        with recorder.stage("handle_jobs", len(jobs)):
+            jobs = await job_handler(jobs)
+        if recorder.records_beats:
+            self._record_jobs(jobs, duplicate_jobs, recorder, start)
+        function = functools.partial(
+            self._notate_jobs,
+            jobs,
+            duplicate_jobs,
+            attach_tempos=attach_tempos,
+            attack_point_optimizer=attack_point_optimizer,
+            grace_handler=grace_handler,
+            heuristic=heuristic,
+            recorder=recorder,
+        )
+        return await loop.run_in_executor(None, function)
+
+    def call_iter(
+        self,
+        q_event_sequence: _qeventsequence.QEventSequence,
+        grace_handler: _gracehandlers.GraceHandler | None = None,
+        heuristic: _heuristics.Heuristic | None = None,
+        job_handler: _jobhandlers.JobHandler | None = None,
+        attack_point_optimizer: (
+            _attackpointoptimizers.AttackPointOptimizer | None
+        ) = None,
+        attach_tempos: bool = True,
+        recorder: _recorders.Recorder | None = None,
+    ) -> typing.Iterator[abjad.Component]:
+        """
+        Calls q-target, notating lazily.
+
+        Returns an iterator which searches, selects and notates item by item,
+        yielding the top-level components of the voice ``__call__`` returns
+        as soon as no later item can change them. ``job_handler`` is called
+        once per item. The q-events and q-grids of each beat are dropped once
+        the components of its item are yielded.
+
+        Heuristics which select the q-grids of all beats jointly, like
+        ``ViterbiHeuristic``, need every beat searched first: with them, every
+        beat is searched and selected immediately.
+        """
+        assert isinstance(q_event_sequence, _qeventsequence.QEventSequence)
+        grace_handler, heuristic, attack_point_optimizer, recorder = self._get_handlers(
+            grace_handler, heuristic, attack_point_optimizer, recorder
+        )
+        if job_handler is None:
+            job_handler = _jobhandlers.SerialJobHandler()
+        assert isinstance(job_handler, _jobhandlers.JobHandler)
+        selection: typing.Iterable[list[_qeventproxy.QEventProxy]]
+        if heuristic._is_beatwise:
+            selection = self._iterate_selection(
+                q_event_sequence, job_handler, heuristic, recorder
+            )
+        else:
+            jobs, duplicate_jobs = self._make_jobs(q_event_sequence, recorder)
+            start = time.perf_counter()
+            with recorder.stage("handle_jobs", len(jobs)):
+                jobs = job_handler(jobs)
+            if recorder.records_beats:
+                self._record_jobs(jobs, duplicate_jobs, recorder, start)
+            orphaned_q_event_proxies = self._select_q_grids(
+                jobs, duplicate_jobs, heuristic, recorder
+            )
+            # only the last item has orphaned q-event proxies
+            selection = [[] for _ in self.items[1:]]
+            selection.append(orphaned_q_event_proxies)
+        return self._iterate_notation(
+            grace_handler,
+            attack_point_optimizer,
+            selection,
+            recorder,
+            attach_tempos=attach_tempos,
+        )
+
 
 class BeatwiseQTarget(QTarget):
     """
@@ -259,41 +893,57 @@ class BeatwiseQTarget(QTarget):
 
     ### PRIVATE METHODS ###
 
-    def _notate(
+    def _is_releasable(self, voice: abjad.Voice, start: int) -> bool:
+        # the attack-point optimizer fuses the leaves of each logical tie:
+        # hold back every leaf of a tie crossing into the new item
+        leaf = abjad.select.leaf(voice[start - 1], -1)
+        return not abjad.get.has_indicator(leaf, abjad.Tie)
+
+    def _notate_item(
         self,
-        grace_handler: _gracehandlers.GraceHandler,
-        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+        item: _qtargetitems.QTargetItem,
+        previous_item: _qtargetitems.QTargetItem | None,
         attach_tempos: bool = True,
-    ) -> abjad.Voice:
-        voice = abjad.Voice()
-        # generate the first
-        beat = self._items[0]
-        assert isinstance(beat, _qtargetitems.QTargetBeat) and beat.q_grid is not None
-        components = beat.q_grid(beat.beatspan)
-        voice.extend(components)
-        if attach_tempos:
+    ) -> typing.Sequence[abjad.Component]:
+        assert isinstance(item, _qtargetitems.QTargetBeat) and item.q_grid is not None
+        assert isinstance(previous_item, _qtargetitems.QTargetBeat | None)
+        components = item.q_grid(item.beatspan)
+        # attach tempo to the first beat, and to beats changing tempo
+        if attach_tempos and (
+            previous_item is None or item.tempo != previous_item.tempo
+        ):
             attachment_target: abjad.Component = components[0]
             leaves = abjad.select.leaves(attachment_target)
             if isinstance(attachment_target, abjad.Container):
                 attachment_target = leaves[0]
-            tempo = copy.deepcopy(beat.tempo)
+            tempo = copy.deepcopy(item.tempo)
             abjad.attach(tempo, attachment_target)
-        # generate the rest pairwise, comparing tempi
-        for beat_one, beat_two in abjad.sequence.nwise(self.items):
-            components = beat_two.q_grid(beat_two.beatspan)
-            voice.extend(components)
-            if (beat_two.tempo != beat_one.tempo) and attach_tempos:
-                attachment_target = components[0]
-                leaves = abjad.select.leaves(attachment_target)
-                if isinstance(attachment_target, abjad.Container):
-                    attachment_target = leaves[0]
-                tempo = copy.deepcopy(beat_two.tempo)
-                abjad.attach(tempo, attachment_target)
-        # apply logical ties, pitches, grace containers
-        self._notate_leaves(grace_handler=grace_handler, voice=voice)
+        return components
+
+    def _optimize(
+        self,
+        voice: abjad.Voice,
+        items: typing.Sequence[_qtargetitems.QTargetItem],
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+    ) -> None:
         # partition logical ties in voice
         attack_point_optimizer(voice)
-        return voice
+
+    def _release_notation(
+        self,
+        voice: abjad.Voice,
+        count: int,
+        items: typing.Sequence[_qtargetitems.QTargetItem],
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+    ) -> list[abjad.Component]:
+        # optimize the components in a voice of their own
+        components = voice[:count]
+        del voice[:count]
+        group = abjad.Voice(components)
+        self._optimize(group, items, attack_point_optimizer)
+        components = group[:]
+        del group[:]
+        return components
 
     ### PUBLIC PROPERTIES ###
 
@@ -323,7 +973,7 @@ class MeasurewiseQTarget(QTarget):
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ()
+    __slots__ = ("_beats",)
 
     ### INITIALIZATION ###
 
@@ -331,64 +981,79 @@ class MeasurewiseQTarget(QTarget):
         self, items: typing.Sequence[_qtargetitems.QTargetMeasure] | None = None
     ):
         super().__init__(items)
+        self._beats = tuple([beat for item in self.items for beat in item.beats])
 
     ### PRIVATE METHODS ###
 
-    def _notate(
+    def _is_releasable(self, voice: abjad.Voice, start: int) -> bool:
+        # the attack-point optimizer acts on each measure alone
+        return True
+
+    def _notate_item(
         self,
-        grace_handler: _gracehandlers.GraceHandler,
-        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+        item: _qtargetitems.QTargetItem,
+        previous_item: _qtargetitems.QTargetItem | None,
         attach_tempos: bool = True,
-    ) -> abjad.Voice:
-        voice = abjad.Voice()
-        # generate the first
-        q_target_measure = self._items[0]
-        assert isinstance(q_target_measure, _qtargetitems.QTargetMeasure)
-        time_signature = q_target_measure.time_signature
+    ) -> typing.Sequence[abjad.Component]:
+        assert isinstance(item, _qtargetitems.QTargetMeasure)
+        assert isinstance(previous_item, _qtargetitems.QTargetMeasure | None)
         measure = abjad.Container()
-        for beat in q_target_measure.beats:
-            components = beat.q_grid(beat.beatspan)
-            measure.extend(components)
-        voice.append(measure)
-        leaf = abjad.get.leaf(measure, 0)
-        abjad.attach(time_signature, leaf)
-        if attach_tempos:
-            tempo = copy.deepcopy(q_target_measure.tempo)
+        for beat in item.beats:
+            measure.extend(beat.q_grid(beat.beatspan))
+        # attach time signature and tempo to the first measure, and to
+        # measures changing time signature or tempo
+        if previous_item is None or item.time_signature != previous_item.time_signature:
+            leaf = abjad.get.leaf(measure, 0)
+            abjad.attach(item.time_signature, leaf)
+        if attach_tempos and (
+            previous_item is None or item.tempo != previous_item.tempo
+        ):
+            tempo = copy.deepcopy(item.tempo)
             leaf = abjad.get.leaf(measure, 0)
             abjad.attach(tempo, leaf)
-        # generate the rest pairwise, comparing tempi
-        pairs = abjad.sequence.nwise(self.items)
-        for q_target_measure_one, q_target_measure_two in pairs:
-            measure = abjad.Container()
-            voice.append(measure)
-            for beat in q_target_measure_two.beats:
-                measure.extend(beat.q_grid(beat.beatspan))
-            if (
-                q_target_measure_two.time_signature
-                != q_target_measure_one.time_signature
-            ):
-                time_signature = q_target_measure_two.time_signature
-                leaf = abjad.get.leaf(measure, 0)
-                abjad.attach(time_signature, leaf)
-            if (
-                q_target_measure_two.tempo != q_target_measure_one.tempo
-            ) and attach_tempos:
-                tempo = copy.deepcopy(q_target_measure_two.tempo)
-                leaf = abjad.get.leaf(measure, 0)
-                abjad.attach(tempo, leaf)
-        # apply logical ties, pitches, grace containers
-        self._notate_leaves(grace_handler=grace_handler, voice=voice)
+        return [measure]
+
+    def _optimize(
+        self,
+        voice: abjad.Voice,
+        items: typing.Sequence[_qtargetitems.QTargetItem],
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+    ) -> None:
         # partition logical ties in each measure
-        for index, measure in enumerate(voice):
-            if isinstance(
-                attack_point_optimizer,
-                _attackpointoptimizers.MeasurewiseAttackPointOptimizer,
-            ):
-                # then we need to pass the time signature of each measure
-                attack_point_optimizer(measure, self.items[index].time_signature)
-            else:
-                attack_point_optimizer(measure)
-        return voice
+        for measure, item in zip(voice, items, strict=True):
+            self._optimize_measure(measure, item, attack_point_optimizer)
+
+    @staticmethod
+    def _optimize_measure(
+        measure: abjad.Component,
+        item: _qtargetitems.QTargetItem,
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+    ) -> None:
+        assert isinstance(measure, abjad.Container)
+        assert isinstance(item, _qtargetitems.QTargetMeasure)
+        if isinstance(
+            attack_point_optimizer,
+            _attackpointoptimizers.MeasurewiseAttackPointOptimizer,
+        ):
+            # then we need to pass the time signature of each measure
+            attack_point_optimizer(measure, item.time_signature)
+        else:
+            attack_point_optimizer(measure)
+
+    def _release_notation(
+        self,
+        voice: abjad.Voice,
+        count: int,
+        items: typing.Sequence[_qtargetitems.QTargetItem],
+        attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer,
+    ) -> list[abjad.Component]:
+        # optimize measures in place, where ties into the following measure
+        # are seen exactly as in the whole voice
+        components = voice[:count]
+        for measure, item in zip(components, items, strict=True):
+            self._optimize_measure(measure, item, attack_point_optimizer)
+        del voice[:count]
+        return components
 
     ### PUBLIC PROPERTIES ###
 
@@ -397,7 +1062,7 @@ class MeasurewiseQTarget(QTarget):
         """
         Gets beats of measurewise q-target.
         """
-        return tuple([beat for item in self.items for beat in item.beats])
+        return self._beats
 
     @property
     def item_class(self) -> type[_qtargetitems.QTargetMeasure]:
@@ -405,3 +1070,101 @@ class MeasurewiseQTarget(QTarget):
         Gets item class of measurewise q-target.
         """
         return _qtargetitems.QTargetMeasure
+
+
+class QuantizationSegmentJob:
+    """
+    Quantization segment job.
+
+    Copiable, picklable class for quantizing a segment of a ``QEventSequence``
+    into a ``QTarget`` made of the items which the segment spans.
+
+    Stores the resulting voice on its ``notation`` attribute, so that segments
+    may be quantized in parallel by a ``JobHandler``. ``QuantizationJobs``
+    within the segment are processed serially.
+
+    Used internally by the ``quantize`` function.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_attach_tempos",
+        "_attack_point_optimizer",
+        "_grace_handler",
+        "_heuristic",
+        "_job_id",
+        "_notation",
+        "_q_event_sequence",
+        "_q_target",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        job_id: int,
+        q_target: QTarget,
+        q_event_sequence: _qeventsequence.QEventSequence,
+        grace_handler: _gracehandlers.GraceHandler | None = None,
+        heuristic: _heuristics.Heuristic | None = None,
+        attack_point_optimizer: (
+            _attackpointoptimizers.AttackPointOptimizer | None
+        ) = None,
+        attach_tempos: bool = True,
+    ) -> None:
+        assert isinstance(q_target, QTarget), repr(q_target)
+        assert isinstance(q_event_sequence, _qeventsequence.QEventSequence)
+        self._attach_tempos = bool(attach_tempos)
+        self._attack_point_optimizer = attack_point_optimizer
+        self._grace_handler = grace_handler
+        self._heuristic = heuristic
+        self._job_id = job_id
+        self._notation: abjad.Voice | None = None
+        self._q_event_sequence = q_event_sequence
+        self._q_target = q_target
+
+    ### SPECIAL METHODS ###
+
+    def __call__(self) -> None:
+        """
+        Calls quantization segment job.
+        """
+        self._notation = self.q_target(
+            self.q_event_sequence,
+            grace_handler=self._grace_handler,
+            heuristic=self._heuristic,
+            job_handler=_jobhandlers.SerialJobHandler(),
+            attack_point_optimizer=self._attack_point_optimizer,
+            attach_tempos=self._attach_tempos,
+        )
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def job_id(self) -> int:
+        """
+        Gets job ID of quantization segment job.
+        """
+        return self._job_id
+
+    @property
+    def notation(self) -> abjad.Voice | None:
+        """
+        Gets notation of quantization segment job, once called.
+        """
+        return self._notation
+
+    @property
+    def q_event_sequence(self) -> _qeventsequence.QEventSequence:
+        """
+        Gets q-event sequence of quantization segment job.
+        """
+        return self._q_event_sequence
+
+    @property
+    def q_target(self) -> QTarget:
+        """
+        Gets q-target of quantization segment job.
+        """
+        return self._q_target
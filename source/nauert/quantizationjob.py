@@ -1,5 +1,8 @@
+import time
 import typing
 
+import abjad
+
 from . import qeventproxy as _qeventproxy
 from . import qgrid as _qgrid
 from . import searchtrees as _searchtrees
@@ -48,7 +51,13 @@ class QuantizationJob:
 
     ### CLASS VARIABLES ###
 
-    __slots__ = ("_job_id", "_q_event_proxies", "_q_grids", "_search_tree")
+    __slots__ = (
+        "_job_id",
+        "_q_event_proxies",
+        "_q_grids",
+        "_search_tree",
+        "_statistics",
+    )
 
     ### INITIALIZER ###
 
@@ -61,8 +70,11 @@ class QuantizationJob:
     ):
         search_tree = search_tree or _searchtrees.UnweightedSearchTree()
         q_event_proxies = q_event_proxies or []
-        assert isinstance(search_tree, _searchtrees.SearchTree)
-        assert all(isinstance(x, _qeventproxy.QEventProxy) for x in q_event_proxies)
+        if not isinstance(search_tree, _searchtrees.SearchTree):
+            raise TypeError(f"must be search tree: {search_tree!r}.")
+        for q_event_proxy in q_event_proxies:
+            if not isinstance(q_event_proxy, _qeventproxy.QEventProxy):
+                raise TypeError(f"must be q-event proxy: {q_event_proxy!r}.")
         self._job_id = job_id
         self._search_tree = search_tree
         self._q_event_proxies = tuple(q_event_proxies)
@@ -70,8 +82,11 @@ class QuantizationJob:
         if q_grids is None:
             self._q_grids = ()
         else:
-            assert all(isinstance(x, _qgrid.QGrid) for x in q_grids)
+            for q_grid in q_grids:
+                if not isinstance(q_grid, _qgrid.QGrid):
+                    raise TypeError(f"must be q-grid: {q_grid!r}.")
             self._q_grids = tuple(q_grids)
+        self._statistics: SearchStatistics | None = None
 
     ### SPECIAL METHODS ###
 
@@ -79,26 +94,29 @@ class QuantizationJob:
         """
         Calls quantization job.
         """
-        # print('XXX')
-        # print(format(self.q_event_proxies[0]))
+        start_time = time.perf_counter()
         q_grid = _qgrid.QGrid()
-        q_grid.fit_q_events(self.q_event_proxies)
-        # print(format(q_grid))
+        q_grid._fit_q_events(self.q_event_proxies)
+        grid_count, max_depth, refit_count = 0, 0, 0
         old_q_grids = []
-        new_q_grids = [q_grid]
+        new_q_grids = [(q_grid, 0)]
         while new_q_grids:
-            q_grid = new_q_grids.pop()
+            q_grid, depth = new_q_grids.pop()
             search_results = self.search_tree(q_grid)
-            # print q_grid.rtm_format
-            # for x in search_results:
-            #    print '\t', x.rtm_format
-            new_q_grids.extend(search_results)
+            grid_count += len(search_results)
+            max_depth = max(max_depth, depth)
+            for search_result in search_results:
+                refit_count += self._count_refitted_proxies(q_grid, search_result)
+            new_q_grids.extend((_, depth + 1) for _ in search_results)
             old_q_grids.append(q_grid)
-        # for q_grid in old_q_grids:
-        #    print('\t', q_grid)
-        # print()
-
         self._q_grids = tuple(old_q_grids)
+        self._statistics = SearchStatistics(
+            candidate_count=len(old_q_grids),
+            elapsed_time=time.perf_counter() - start_time,
+            grid_count=grid_count,
+            max_depth=max_depth,
+            refit_count=refit_count,
+        )
 
     def __eq__(self, argument) -> bool:
         """
@@ -131,6 +149,55 @@ class QuantizationJob:
         string += f" q_event_proxies={self.q_event_proxies!r}, q_grids={self.q_grids})"
         return string
 
+    ### PRIVATE METHODS ###
+
+    @staticmethod
+    def _count_refitted_proxies(q_grid: _qgrid.QGrid, new_q_grid: _qgrid.QGrid) -> int:
+        # counts the proxies refitted when q_grid was subdivided into
+        # new_q_grid: the proxies of each subdivided leaf, and the proxies of
+        # the leaf after it which lie before that leaf; walks both trees
+        # together to find subdivided leaves
+        is_subdivided = []
+        pairs = [(q_grid.root_node, new_q_grid.root_node)]
+        while pairs:
+            node, new_node = pairs.pop()
+            if isinstance(node, _qgrid.QGridLeaf):
+                is_subdivided.append(not isinstance(new_node, _qgrid.QGridLeaf))
+            else:
+                assert isinstance(new_node, _qgrid.QGridContainer)
+                pairs.extend(reversed(list(zip(node.children, new_node.children))))
+        is_subdivided.append(False)
+        leaves, count = q_grid.leaves, 0
+        for i, leaf in enumerate(leaves[:-1]):
+            if not is_subdivided[i]:
+                continue
+            count += len(leaf.q_event_proxies)
+            next_leaf = leaves[i + 1]
+            if is_subdivided[i + 1] or not next_leaf.q_event_proxies:
+                continue
+            offset = abjad.Offset(1)
+            if next_leaf is not q_grid.next_downbeat:
+                offset = next_leaf.start_offset
+            count += sum(1 for _ in next_leaf.q_event_proxies if _.offset < offset)
+        return count
+
+    @classmethod
+    def _from_trusted(
+        class_,
+        job_id: int,
+        search_tree: _searchtrees.SearchTree,
+        q_event_proxies: typing.Iterable[_qeventproxy.QEventProxy],
+    ) -> "QuantizationJob":
+        # makes quantization job of arguments already known to be valid,
+        # without checking them again
+        self = class_.__new__(class_)
+        self._job_id = job_id
+        self._search_tree = search_tree
+        self._q_event_proxies = tuple(q_event_proxies)
+        self._q_grids = ()
+        self._statistics = None
+        return self
+
     ### PUBLIC PROPERTIES ###
 
     @property
@@ -205,3 +272,164 @@ class QuantizationJob:
         Gets search tree ``QuantizationJob`` was instantiated with.
         """
         return self._search_tree
+
+    @property
+    def statistics(self) -> typing.Optional["SearchStatistics"]:
+        r"""
+        Gets statistics of search run when ``QuantizationJob`` was called.
+
+        When ``QTarget`` skips a job equivalent to a job already searched, it
+        gives the skipped job the statistics of the searched job.
+
+        >>> q_event_a = nauert.PitchedQEvent(abjad.Offset(250), [0, 1])
+        >>> q_event_b = nauert.SilentQEvent(abjad.Offset(500))
+        >>> q_event_c = nauert.PitchedQEvent(abjad.Offset(750), [3, 7])
+        >>> proxy_a = nauert.QEventProxy(q_event_a, abjad.Offset(0.25))
+        >>> proxy_b = nauert.QEventProxy(q_event_b, abjad.Offset(0.5))
+        >>> proxy_c = nauert.QEventProxy(q_event_c, abjad.Offset(0.75))
+        >>> definition = {2: {2: None}, 3: None, 5: None}
+        >>> search_tree = nauert.UnweightedSearchTree(definition)
+        >>> job = nauert.QuantizationJob(1, search_tree, [proxy_a, proxy_b, proxy_c])
+        >>> job.statistics is None
+        True
+
+        >>> job()
+        >>> job.statistics
+        SearchStatistics(candidate_count=5, elapsed_time=..., grid_count=4, job_count=1, max_depth=2, refit_count=12)
+
+        """
+        return self._statistics
+
+
+class SearchStatistics:
+    """
+    Search statistics.
+
+    Describes the search for ``QGrids`` run by one or more
+    ``QuantizationJobs``:
+
+        * ``candidate_count``: number of ``QGrids`` kept as candidates;
+
+        * ``elapsed_time``: seconds spent searching;
+
+        * ``grid_count``: number of ``QGrids`` generated by the search tree;
+
+        * ``job_count``: number of jobs described;
+
+        * ``max_depth``: greatest number of successive subdivisions;
+
+        * ``refit_count``: number of ``QEventProxies`` refitted onto
+          subdivided leaves.
+
+    ..  container:: example
+
+        Statistics add up, keeping the greatest depth:
+
+        >>> one = nauert.SearchStatistics(candidate_count=5, grid_count=4, max_depth=2)
+        >>> two = nauert.SearchStatistics(candidate_count=1, max_depth=0)
+        >>> one + two
+        SearchStatistics(candidate_count=6, elapsed_time=0.0, grid_count=4, job_count=2, max_depth=2, refit_count=0)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_candidate_count",
+        "_elapsed_time",
+        "_grid_count",
+        "_job_count",
+        "_max_depth",
+        "_refit_count",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        candidate_count: int = 0,
+        elapsed_time: float = 0.0,
+        grid_count: int = 0,
+        job_count: int = 1,
+        max_depth: int = 0,
+        refit_count: int = 0,
+    ) -> None:
+        self._candidate_count = candidate_count
+        self._elapsed_time = elapsed_time
+        self._grid_count = grid_count
+        self._job_count = job_count
+        self._max_depth = max_depth
+        self._refit_count = refit_count
+
+    ### SPECIAL METHODS ###
+
+    def __add__(self, argument) -> "SearchStatistics":
+        """
+        Adds search statistics.
+        """
+        if not isinstance(argument, SearchStatistics):
+            return NotImplemented
+        return type(self)(
+            candidate_count=self.candidate_count + argument.candidate_count,
+            elapsed_time=self.elapsed_time + argument.elapsed_time,
+            grid_count=self.grid_count + argument.grid_count,
+            job_count=self.job_count + argument.job_count,
+            max_depth=max(self.max_depth, argument.max_depth),
+            refit_count=self.refit_count + argument.refit_count,
+        )
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        string = f"{type(self).__name__}(candidate_count={self.candidate_count!r},"
+        string += f" elapsed_time={self.elapsed_time!r},"
+        string += f" grid_count={self.grid_count!r},"
+        string += f" job_count={self.job_count!r},"
+        string += f" max_depth={self.max_depth!r},"
+        string += f" refit_count={self.refit_count!r})"
+        return string
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def candidate_count(self) -> int:
+        """
+        Gets number of ``QGrids`` kept as candidates.
+        """
+        return self._candidate_count
+
+    @property
+    def elapsed_time(self) -> float:
+        """
+        Gets seconds spent searching.
+        """
+        return self._elapsed_time
+
+    @property
+    def grid_count(self) -> int:
+        """
+        Gets number of ``QGrids`` generated by the search tree.
+        """
+        return self._grid_count
+
+    @property
+    def job_count(self) -> int:
+        """
+        Gets number of jobs described.
+        """
+        return self._job_count
+
+    @property
+    def max_depth(self) -> int:
+        """
+        Gets greatest number of successive subdivisions.
+        """
+        return self._max_depth
+
+    @property
+    def refit_count(self) -> int:
+        """
+        Gets number of ``QEventProxies`` refitted onto subdivided leaves.
+        """
+        return self._refit_count
@@ -1,3 +1,5 @@
+import typing
+
 import abjad
 
 from . import attackpointoptimizers as _attackpointoptimizers
@@ -6,6 +8,7 @@ from . import heuristics as _heuristics
 from . import jobhandlers as _jobhandlers
 from . import qeventsequence as _qeventsequence
 from . import qschemas as _qschemas
+from . import recorders as _recorders
 
 
 def quantize(
@@ -16,6 +19,8 @@ def quantize(
     job_handler: _jobhandlers.JobHandler | None = None,
     attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer | None = None,
     attach_tempos: bool = True,
+    recorder: _recorders.Recorder | None = None,
+    segment_duration_in_ms: int | None = None,
 ) -> abjad.Voice:
     r"""
     Quantizer function.
@@ -259,29 +264,57 @@ def quantize(
 
         * ``heuristic``: a ``Heuristic`` instance controls how output rhythms
           are selected from a pool of candidates.  Options currently include
-          the ``DistanceHeuristic`` class.
+          the ``DistanceHeuristic`` and ``ViterbiHeuristic`` classes.
 
         * ``job_handler``: a ``JobHandler`` instance controls whether or not
           parallel processing is used during the quantization process.
-          Options include the ``SerialJobHandler`` and ``ParallelJobHandler``
-          classes.
+          Options include the ``SerialJobHandler``, ``ParallelJobHandler``,
+          ``SocketJobHandler`` and ``ThreadPoolJobHandler`` classes.
 
         * ``attack_point_optimizer``: an ``AttackPointOptimizer`` instance
           controls whether and how logical ties are re-notated.
           Options currently include ``MeasurewiseAttackPointOptimizer``,
           ``NaiveAttackPointOptimizer`` and ``NullAttackPointOptimizer``.
 
+        * ``recorder``: a ``Recorder`` instance receives timings of each
+          stage of the quantization process.  Options currently include
+          ``ExplainRecorder``, ``MemoryRecorder``, ``NullRecorder`` and
+          ``TimingRecorder``.
+
+        * ``segment_duration_in_ms``: when set, the ``QEventSequence`` is split
+          into segments of at least this duration, at measure boundaries (or
+          beat boundaries, with a ``BeatwiseQSchema``) which no ``QEvent``
+          crosses. Each segment is quantized as a whole by a
+          ``QuantizationSegmentJob``, processed by ``job_handler``, and the
+          resulting voices are joined, keeping tempos and time signatures only
+          where they change. The result is the same as without segments,
+          unless the ``heuristic`` selects ``QGrids`` jointly across beats, as
+          ``ViterbiHeuristic`` does, selecting within each segment instead.
+          Per-beat records are not made while segmenting.
+
     Refer to the reference pages for ``BeatwiseQSchema`` and
     ``MeasurewiseQSchema`` for more information on controlling the ``quantize``
     function's output, and to the reference on ``SearchTree`` for information
     on controlling the rhythmic complexity of that same output.
     """
     # TODO: assert isinstance(q_event_sequence, QEventSequence)
-    q_event_sequence = _qeventsequence.QEventSequence(q_event_sequence)
+    if not isinstance(q_event_sequence, _qeventsequence.QEventSequence):
+        q_event_sequence = _qeventsequence.QEventSequence(q_event_sequence)
     if q_schema is None:
         q_schema = _qschemas.MeasurewiseQSchema()
     assert isinstance(q_schema, _qschemas.QSchema)
     q_target = q_schema(q_event_sequence.duration_in_ms)
+    if segment_duration_in_ms is not None:
+        return q_target._call_segmentwise(
+            q_event_sequence,
+            segment_duration_in_ms,
+            grace_handler=grace_handler,
+            heuristic=heuristic,
+            job_handler=job_handler,
+            attack_point_optimizer=attack_point_optimizer,
+            attach_tempos=attach_tempos,
+            recorder=recorder,
+        )
     notation = q_target(
         q_event_sequence,
         grace_handler=grace_handler,
@@ -289,5 +322,160 @@ def quantize(
         job_handler=job_handler,
         attack_point_optimizer=attack_point_optimizer,
         attach_tempos=attach_tempos,
+        recorder=recorder,
+    )
+    return notation
+
+
+async def quantize_async(
+    q_event_sequence: _qeventsequence.QEventSequence,
+    q_schema: _qschemas.QSchema | None = None,
+    grace_handler: _gracehandlers.GraceHandler | None = None,
+    heuristic: _heuristics.Heuristic | None = None,
+    job_handler: _jobhandlers.AsyncJobHandler | None = None,
+    attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer | None = None,
+    attach_tempos: bool = True,
+    recorder: _recorders.Recorder | None = None,
+) -> abjad.Voice:
+    r"""
+    Asynchronous quantizer function.
+
+    Quantizes like ``quantize``, without blocking the running event loop.
+
+    ..  container:: example
+
+        >>> import asyncio
+        >>> durations = [1000] * 8
+        >>> pitches = range(8)
+        >>> pairs = tuple(zip(durations, pitches, strict=True))
+        >>> method = nauert.QEventSequence.from_millisecond_pitch_pairs
+        >>> q_event_sequence = method(pairs)
+        >>> job_handler = nauert.AsyncExecutorJobHandler(max_concurrency=2)
+        >>> coroutine = nauert.quantize_async(q_event_sequence, job_handler=job_handler)
+        >>> result = asyncio.run(coroutine)
+        >>> staff = abjad.Staff([result])
+        >>> score = abjad.Score([staff])
+        >>> abjad.show(score) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> string = abjad.lilypond(score)
+            >>> print(string)
+            \new Score
+            <<
+                \new Staff
+                {
+                    \new Voice
+                    {
+                        {
+                            \tempo 4=60
+                            \time 4/4
+                            c'4
+                            cs'4
+                            d'4
+                            ef'4
+                        }
+                        {
+                            e'4
+                            f'4
+                            fs'4
+                            g'4
+                        }
+                    }
+                }
+            >>
+
+    ``job_handler`` must be an ``AsyncJobHandler``, and defaults to an
+    ``AsyncExecutorJobHandler``. Jobs are awaited on its executor with bounded
+    concurrency. Every other stage runs on the default executor of the
+    running event loop.
+
+    Cancelling the awaiting task stops quantization: no further jobs are
+    started, and no notation is returned.
+    """
+    if not isinstance(q_event_sequence, _qeventsequence.QEventSequence):
+        q_event_sequence = _qeventsequence.QEventSequence(q_event_sequence)
+    if q_schema is None:
+        q_schema = _qschemas.MeasurewiseQSchema()
+    assert isinstance(q_schema, _qschemas.QSchema)
+    q_target = q_schema(q_event_sequence.duration_in_ms)
+    notation = await q_target.call_async(
+        q_event_sequence,
+        grace_handler=grace_handler,
+        heuristic=heuristic,
+        job_handler=job_handler,
+        attack_point_optimizer=attack_point_optimizer,
+        attach_tempos=attach_tempos,
+        recorder=recorder,
     )
     return notation
+
+
+def quantize_iter(
+    q_event_sequence: _qeventsequence.QEventSequence,
+    q_schema: _qschemas.QSchema | None = None,
+    grace_handler: _gracehandlers.GraceHandler | None = None,
+    heuristic: _heuristics.Heuristic | None = None,
+    job_handler: _jobhandlers.JobHandler | None = None,
+    attack_point_optimizer: _attackpointoptimizers.AttackPointOptimizer | None = None,
+    attach_tempos: bool = True,
+    recorder: _recorders.Recorder | None = None,
+) -> typing.Iterator[abjad.Component]:
+    r"""
+    Iterating quantizer function.
+
+    Quantizes like ``quantize``, but yields the top-level components of the
+    resulting voice one at a time, fully notated and optimized, instead of
+    returning the voice.
+
+    ..  container:: example
+
+        >>> durations = [1000] * 8
+        >>> pitches = range(8)
+        >>> pairs = tuple(zip(durations, pitches, strict=True))
+        >>> method = nauert.QEventSequence.from_millisecond_pitch_pairs
+        >>> q_event_sequence = method(pairs)
+        >>> for measure in nauert.quantize_iter(q_event_sequence):
+        ...     print(abjad.lilypond(measure))
+        ...
+        {
+            %%% \time 4/4 %%%
+            \tempo 4=60
+            c'4
+            cs'4
+            d'4
+            ef'4
+        }
+        {
+            e'4
+            f'4
+            fs'4
+            g'4
+        }
+
+    Searching, selecting and notating are deferred until iteration, and go
+    item by item: each measure is yielded once the following measure has
+    been notated; with a ``BeatwiseQSchema``, beats are yielded
+    in groups which no tie crosses, so that the attack-point optimizer sees
+    every leaf of each logical tie. Extending a voice with every component
+    yielded gives the same notation as ``quantize``. Components are detached
+    from one another, and beats drop their q-events and q-grids once yielded,
+    so that the iterator keeps in memory only the items not yet yielded.
+    With a heuristic selecting every beat jointly, like ``ViterbiHeuristic``,
+    every beat is searched when ``quantize_iter`` is called.
+    """
+    if not isinstance(q_event_sequence, _qeventsequence.QEventSequence):
+        q_event_sequence = _qeventsequence.QEventSequence(q_event_sequence)
+    if q_schema is None:
+        q_schema = _qschemas.MeasurewiseQSchema()
+    assert isinstance(q_schema, _qschemas.QSchema)
+    q_target = q_schema(q_event_sequence.duration_in_ms)
+    return q_target.call_iter(
+        q_event_sequence,
+        grace_handler=grace_handler,
+        heuristic=heuristic,
+        job_handler=job_handler,
+        attack_point_optimizer=attack_point_optimizer,
+        attach_tempos=attach_tempos,
+        recorder=recorder,
+    )
@@ -0,0 +1,719 @@
+import abc
+import contextlib
+import csv
+import json
+import os
+import random
+import time
+import tracemalloc
+import typing
+
+from . import qtargetitems as _qtargetitems
+from . import quantizationjob as _quantizationjob
+
+
+class Recorder(abc.ABC):
+    """
+    Abstract recorder.
+
+    Recorders receive timings and item counts for the stages of the
+    quantization process, as run by ``QTarget``, and for the individual beats
+    processed by those stages.
+
+    Stages are recorded in order, under the following names:
+
+        * ``"assign_q_events"``: parcel ``QEvents`` out to each beat, counting
+          ``QEvents``;
+
+        * ``"make_jobs"``: generate one ``QuantizationJob`` per group of
+          equivalent beats, counting beats;
+
+        * ``"handle_jobs"``: process jobs with the job handler, counting jobs;
+
+        * ``"heuristic"``: select a ``QGrid`` for each beat, counting beats;
+
+        * ``"rebind_duplicates"``: copy selected ``QGrids`` onto equivalent
+          beats, counting copies;
+
+        * ``"shift_downbeats"``: shift ``QEvents`` from each ``QGrid``'s next
+          downbeat onto the next ``QGrid``, counting beats;
+
+        * ``"regroup"``: regroup unnecessary divisions, counting beats;
+
+        * ``"notate"``: convert ``QGrids`` into notation, and optimize attack
+          points, counting beats;
+
+        * ``"handle_orphans"``: hand orphaned ``QEventProxies`` to the grace
+          handler, counting proxies.
+
+    When ``quantize`` is given ``segment_duration_in_ms``, stages are
+    recorded instead under the following names:
+
+        * ``"make_segments"``: split items into independent segments, and
+          generate one ``QuantizationSegmentJob`` per segment, counting
+          ``QEvents``;
+
+        * ``"handle_jobs"``: quantize segments with the job handler, counting
+          segment jobs;
+
+        * ``"stitch"``: join the notation of every segment into one voice,
+          counting segment jobs.
+
+    A stage which raises is recorded all the same, up to the exception.
+
+    Beats are recorded during ``"make_jobs"``, counting the ``QEvents`` of
+    each beat. After ``"handle_jobs"``, every processed job is recorded with
+    its ``SearchStatistics``, and every beat of a job is recorded under
+    ``"handle_jobs"``, counting the ``QEventProxies`` of the beat: because
+    jobs may run in other processes, each searched beat is timed by the
+    elapsed time of its search, from the start of the stage, and beats whose
+    equivalent job was searched instead take no time. Beats are recorded
+    under ``"heuristic"``, counting the ``QGrids`` of each beat, with the
+    timing of the whole stage, because heuristics may select ``QGrids`` for
+    all beats at once. Every beat is recorded again once its ``QGrid`` is
+    selected, after ``"rebind_duplicates"``, together with the job which
+    searched its ``QGrids``. Beats are recorded under ``"notate"`` as their
+    item is converted into leaves, counting the ``QEvents`` of each beat;
+    the beats of a measure share the timing of their measure.
+
+    Start and stop times are taken from ``time.perf_counter()``, which is
+    monotonic.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ()
+
+    ### INITIALIZER ###
+
+    def __init__(self):
+        pass
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def records_beats(self) -> bool:
+        """
+        Is true when recorder receives beat timings, jobs and selections.
+        """
+        return True
+
+    ### PUBLIC METHODS ###
+
+    def record_beat(
+        self, stage: str, index: int, start: float, stop: float, count: int
+    ) -> None:
+        """
+        Records timing and item count of beat ``index`` during ``stage``.
+        """
+        pass
+
+    def record_job(self, job: _quantizationjob.QuantizationJob) -> None:
+        """
+        Records processed ``job``.
+        """
+        pass
+
+    def record_selection(
+        self,
+        index: int,
+        q_target_beat: _qtargetitems.QTargetBeat,
+        job: _quantizationjob.QuantizationJob | None,
+    ) -> None:
+        """
+        Records ``QGrid`` selected for beat ``index``, and ``job`` which
+        searched its ``QGrids``, if any.
+        """
+        pass
+
+    @abc.abstractmethod
+    def record_stage(self, stage: str, start: float, stop: float, count: int) -> None:
+        """
+        Records timing and item count of ``stage``.
+        """
+        raise NotImplementedError
+
+    @contextlib.contextmanager
+    def stage(self, stage: str, count: int = 0) -> typing.Iterator[None]:
+        """
+        Times the body of a ``with`` statement as ``stage``.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(stage, start, time.perf_counter(), count)
+
+
+class ExplainRecorder(Recorder):
+    r"""
+    Explain recorder.
+
+    Writes one row per beat to ``sink``, as JSON Lines or as CSV, as soon as
+    the ``QGrid`` of every beat has been selected:
+
+        * ``beat``: index of beat;
+
+        * ``offset_in_ms``: offset of beat in milliseconds;
+
+        * ``q_event_offsets``: offsets in milliseconds of the ``QEvents``
+          assigned to beat;
+
+        * ``candidate_count``: number of candidate ``QGrids``;
+
+        * ``job_id``: ID of job which searched the candidates, which differs
+          from ``beat`` when beat is equivalent to an earlier beat;
+
+        * ``rtm_format`` and ``distance``: selected ``QGrid``;
+
+        * ``runner_up_rtm_format`` and ``runner_up_distance``: best other
+          candidate, ranked as by ``DistanceHeuristic``;
+
+        * ``search_time``: seconds spent searching candidates.
+
+    In CSV, offsets are separated by spaces, and missing values are empty.
+
+    Each recorder is sampled once, when initialized, with probability
+    ``fraction``. A recorder which is not sampled records nothing, at the
+    cost of a ``NullRecorder``.
+
+    ..  container:: example
+
+        >>> import io
+        >>> durations = [1000, 500, 500, 1000, 1000]
+        >>> q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> sink = io.StringIO()
+        >>> recorder = nauert.ExplainRecorder(sink, format="csv")
+        >>> q_schema = nauert.MeasurewiseQSchema(time_signature=(2, 4))
+        >>> voice = nauert.quantize(q_event_sequence, q_schema=q_schema, recorder=recorder)
+        >>> print(sink.getvalue())
+        beat,offset_in_ms,q_event_offsets,candidate_count,job_id,rtm_format,distance,runner_up_rtm_format,runner_up_distance,search_time
+        0,0.0,0.0,1,0,1,0.0,,,...
+        1,1000.0,1000.0 1500.0,13,1,(1 (1 1)),0.0,(1 (1 (1 (1 1)) 1)),0.0,...
+        2,2000.0,2000.0,1,0,1,0.0,,,...
+        3,3000.0,3000.0 4000.0,1,3,1,0.0,,,...
+        <BLANKLINE>
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_csv_writer", "_format", "_fraction", "_is_sampled", "_sink")
+
+    _fieldnames = (
+        "beat",
+        "offset_in_ms",
+        "q_event_offsets",
+        "candidate_count",
+        "job_id",
+        "rtm_format",
+        "distance",
+        "runner_up_rtm_format",
+        "runner_up_distance",
+        "search_time",
+    )
+
+    _null_context = contextlib.nullcontext()
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self, sink: typing.TextIO, format: str = "jsonl", fraction: float = 1.0
+    ) -> None:
+        assert callable(getattr(sink, "write", None)), repr(sink)
+        assert format in ("csv", "jsonl"), repr(format)
+        assert 0 <= fraction <= 1, repr(fraction)
+        self._csv_writer: typing.Any = None
+        self._format = format
+        self._fraction = fraction
+        self._is_sampled = random.random() < fraction
+        self._sink = sink
+
+    ### PRIVATE METHODS ###
+
+    def _write_row(self, row: dict) -> None:
+        if self.format == "jsonl":
+            self.sink.write(json.dumps(row) + "\n")
+            return
+        if self._csv_writer is None:
+            self._csv_writer = csv.DictWriter(self.sink, self._fieldnames)
+            self._csv_writer.writeheader()
+        row["q_event_offsets"] = " ".join(str(_) for _ in row["q_event_offsets"])
+        self._csv_writer.writerow(row)
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def format(self) -> str:
+        """
+        Gets format of rows: ``"csv"`` or ``"jsonl"``.
+        """
+        return self._format
+
+    @property
+    def fraction(self) -> float:
+        """
+        Gets probability with which recorder is sampled.
+        """
+        return self._fraction
+
+    @property
+    def is_sampled(self) -> bool:
+        """
+        Is true when recorder records.
+        """
+        return self._is_sampled
+
+    @property
+    def records_beats(self) -> bool:
+        """
+        Is true when recorder is sampled.
+        """
+        return self._is_sampled
+
+    @property
+    def sink(self) -> typing.TextIO:
+        """
+        Gets file-like object rows are written to.
+        """
+        return self._sink
+
+    ### PUBLIC METHODS ###
+
+    def record_selection(
+        self,
+        index: int,
+        q_target_beat: _qtargetitems.QTargetBeat,
+        job: _quantizationjob.QuantizationJob | None,
+    ) -> None:
+        """
+        Writes row describing ``QGrid`` selected for beat ``index``.
+        """
+        q_grid = q_target_beat.q_grid
+        assert q_grid is not None
+        rtm_format = q_grid.rtm_format
+        distance, _ = q_grid._get_distance_and_leaf_count()
+        runner_up_rtm_format, runner_up_distance = None, None
+        ranked = []
+        for candidate in q_target_beat.q_grids:
+            candidate_distance, leaf_count = candidate._get_distance_and_leaf_count()
+            key = (candidate_distance or 0, leaf_count)
+            ranked.append((key, candidate_distance, candidate))
+        ranked.sort(key=lambda x: x[0])
+        for key, candidate_distance, candidate in ranked:
+            if candidate.rtm_format != rtm_format:
+                runner_up_rtm_format = candidate.rtm_format
+                if candidate_distance is not None:
+                    runner_up_distance = float(candidate_distance)
+                break
+        search_time = None
+        if job is not None and job.statistics is not None:
+            search_time = job.statistics.elapsed_time
+        row = {
+            "beat": index,
+            "offset_in_ms": float(q_target_beat.offset_in_ms),
+            "q_event_offsets": [float(_.offset) for _ in q_target_beat.q_events],
+            "candidate_count": len(q_target_beat.q_grids),
+            "job_id": None if job is None else job.job_id,
+            "rtm_format": rtm_format,
+            "distance": None if distance is None else float(distance),
+            "runner_up_rtm_format": runner_up_rtm_format,
+            "runner_up_distance": runner_up_distance,
+            "search_time": search_time,
+        }
+        self._write_row(row)
+
+    def record_stage(self, stage: str, start: float, stop: float, count: int) -> None:
+        """
+        Records nothing.
+        """
+        pass
+
+    def stage(self, stage: str, count: int = 0) -> typing.Any:
+        """
+        Gets reusable context manager which does nothing.
+        """
+        return self._null_context
+
+
+class MemoryRecorder(Recorder):
+    """
+    Memory recorder.
+
+    Records, for each stage, the peak number of bytes allocated above the
+    number allocated when the stage started, the number of bytes still
+    allocated when the stage stopped, and the ``limit`` allocation sites
+    inside nauert whose allocations grew or shrank the most.
+
+    Allocations are traced with ``tracemalloc``, and attributed to the most
+    recent nauert frame of their traceback, so that allocations made by
+    ``copy.deepcopy()`` or abjad on behalf of nauert are attributed to the
+    line of nauert which caused them.
+
+    Used as a context manager, recorder traces allocations from entering to
+    exiting, so that memory retained by each stage is measured against
+    everything allocated since. Otherwise, recorder traces allocations stage
+    by stage.
+
+    Allocation sites are compared between stage boundaries, so allocations
+    made between two stages count toward the later stage's sites.
+
+    Tracing slows quantization down by an order of magnitude.
+
+    ..  container:: example
+
+        >>> durations = [1000, 500, 500]
+        >>> q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> with nauert.MemoryRecorder(limit=3) as recorder:
+        ...     voice = nauert.quantize(q_event_sequence, recorder=recorder)
+        ...
+        >>> for stage, peak, retained, count in recorder.stage_records:
+        ...     print(stage, 0 <= peak)
+        ...
+        assign_q_events True
+        make_jobs True
+        handle_jobs True
+        heuristic True
+        rebind_duplicates True
+        shift_downbeats True
+        regroup True
+        notate True
+        handle_orphans True
+
+        >>> for stage, filename, lineno, size in recorder.allocation_records:
+        ...     if stage == "handle_jobs":
+        ...         print(filename)
+        ...
+        nauert/...py
+        nauert/...py
+        nauert/...py
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_allocation_records",
+        "_frame_count",
+        "_is_tracing",
+        "_limit",
+        "_site_sizes",
+        "_stage_records",
+    )
+
+    _directory = os.path.dirname(os.path.abspath(__file__))
+
+    ### INITIALIZER ###
+
+    def __init__(self, limit: int = 10, frame_count: int = 10) -> None:
+        assert isinstance(limit, int) and 0 <= limit, repr(limit)
+        assert isinstance(frame_count, int) and 0 < frame_count, repr(frame_count)
+        self._allocation_records: list[tuple[str, str, int, int]] = []
+        self._frame_count = frame_count
+        self._is_tracing = False
+        self._limit = limit
+        self._site_sizes: dict[tuple[str, int], int] | None = None
+        self._stage_records: list[tuple[str, int, int, int]] = []
+
+    ### SPECIAL METHODS ###
+
+    def __enter__(self) -> "MemoryRecorder":
+        """
+        Starts tracing allocations, unless already tracing.
+        """
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frame_count)
+            self._is_tracing = True
+        self._site_sizes = None
+        return self
+
+    def __exit__(self, *arguments) -> None:
+        """
+        Stops tracing allocations, if started on entering.
+        """
+        if self._is_tracing:
+            tracemalloc.stop()
+            self._is_tracing = False
+        self._site_sizes = None
+
+    ### PRIVATE METHODS ###
+
+    def _get_site_sizes(self) -> dict[tuple[str, int], int]:
+        # skips allocations made by recorder itself
+        directory = self._directory
+        parent = os.path.dirname(directory)
+        sizes: dict[tuple[str, int], int] = {}
+        # traces share tracebacks; attributes each traceback once
+        keys: dict[tracemalloc.Traceback, tuple[str, int] | None] = {}
+        for trace in tracemalloc.take_snapshot().traces:
+            traceback = trace.traceback
+            if traceback not in keys:
+                keys[traceback] = None
+                for frame in reversed(traceback):
+                    if frame.filename == __file__:
+                        break
+                    if frame.filename.startswith(directory):
+                        filename = os.path.relpath(frame.filename, parent)
+                        keys[traceback] = (filename.replace(os.sep, "/"), frame.lineno)
+                        break
+            key = keys[traceback]
+            if key is not None:
+                sizes[key] = sizes.get(key, 0) + trace.size
+        return sizes
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def allocation_records(self) -> tuple[tuple[str, str, int, int], ...]:
+        """
+        Gets (stage, filename, line number, bytes) records of the allocation
+        sites whose allocations changed most during each stage.
+        """
+        return tuple(self._allocation_records)
+
+    @property
+    def frame_count(self) -> int:
+        """
+        Gets number of frames stored per traceback.
+        """
+        return self._frame_count
+
+    @property
+    def limit(self) -> int:
+        """
+        Gets number of allocation sites recorded per stage.
+        """
+        return self._limit
+
+    @property
+    def records_beats(self) -> bool:
+        """
+        Is false.
+        """
+        return False
+
+    @property
+    def stage_records(self) -> tuple[tuple[str, int, int, int], ...]:
+        """
+        Gets (stage, peak bytes, retained bytes, count) records of stages.
+        """
+        return tuple(self._stage_records)
+
+    ### PUBLIC METHODS ###
+
+    def record_stage(self, stage: str, start: float, stop: float, count: int) -> None:
+        """
+        Records nothing: memory is recorded by ``stage()``.
+        """
+        pass
+
+    @contextlib.contextmanager
+    def stage(self, stage: str, count: int = 0) -> typing.Iterator[None]:
+        """
+        Records memory allocated by the body of a ``with`` statement as
+        ``stage``.
+        """
+        is_tracing = tracemalloc.is_tracing()
+        if not is_tracing:
+            tracemalloc.start(self.frame_count)
+            self._site_sizes = None
+        try:
+            before_sizes = {}
+            if self.limit:
+                # reuses sizes taken when previous stage stopped
+                before_sizes = self._site_sizes or self._get_site_sizes()
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            try:
+                yield
+            finally:
+                after, peak = tracemalloc.get_traced_memory()
+                self._stage_records.append(
+                    (stage, peak - before, after - before, count)
+                )
+                if self.limit:
+                    after_sizes = self._get_site_sizes()
+                    self._site_sizes = after_sizes
+                    differences = []
+                    for key in set(before_sizes) | set(after_sizes):
+                        size = after_sizes.get(key, 0) - before_sizes.get(key, 0)
+                        if size:
+                            differences.append((key, size))
+                    differences.sort(key=lambda x: (-abs(x[1]), x[0]))
+                    for (filename, lineno), size in differences[: self.limit]:
+                        self._allocation_records.append((stage, filename, lineno, size))
+        finally:
+            if not is_tracing:
+                tracemalloc.stop()
+                self._site_sizes = None
+
+
+class NullRecorder(Recorder):
+    """
+    Null recorder.
+
+    Records nothing, at close to no cost.
+
+    ..  container:: example
+
+        >>> recorder = nauert.NullRecorder()
+        >>> with recorder.stage("heuristic", 8):
+        ...     pass
+        ...
+
+    Used by default by the ``quantize`` function.
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ()
+
+    _null_context = contextlib.nullcontext()
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def records_beats(self) -> bool:
+        """
+        Is false.
+        """
+        return False
+
+    ### PUBLIC METHODS ###
+
+    def record_stage(self, stage: str, start: float, stop: float, count: int) -> None:
+        """
+        Records nothing.
+        """
+        pass
+
+    def stage(self, stage: str, count: int = 0) -> typing.Any:
+        """
+        Gets reusable context manager which does nothing.
+        """
+        return self._null_context
+
+
+class TimingRecorder(Recorder):
+    """
+    Timing recorder.
+
+    Keeps every stage and beat record it receives, and the search statistics
+    of every job.
+
+    ..  container:: example
+
+        >>> durations = [1000] * 8
+        >>> q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> recorder = nauert.TimingRecorder()
+        >>> voice = nauert.quantize(q_event_sequence, recorder=recorder)
+        >>> for stage, start, stop, count in recorder.stage_records:
+        ...     print(stage, count)
+        ...
+        assign_q_events 9
+        make_jobs 8
+        handle_jobs 2
+        heuristic 8
+        rebind_duplicates 6
+        shift_downbeats 8
+        regroup 8
+        notate 8
+        handle_orphans 0
+
+        >>> for stage, index, start, stop, count in recorder.beat_records[:3]:
+        ...     print(stage, index, count)
+        ...
+        make_jobs 0 1
+        make_jobs 1 1
+        make_jobs 2 1
+
+        >>> sorted(recorder.get_durations())
+        ['assign_q_events', 'handle_jobs', 'handle_orphans', 'heuristic', 'make_jobs', 'notate', 'rebind_duplicates', 'regroup', 'shift_downbeats']
+
+        >>> for job_id, statistics in recorder.job_statistics:
+        ...     print(job_id, statistics.candidate_count, statistics.max_depth)
+        ...
+        0 1 0
+        7 1 0
+
+        >>> recorder.get_search_statistics()
+        SearchStatistics(candidate_count=2, elapsed_time=..., grid_count=0, job_count=2, max_depth=0, refit_count=0)
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = ("_beat_records", "_job_statistics", "_stage_records")
+
+    ### INITIALIZER ###
+
+    def __init__(self) -> None:
+        self._beat_records: list[tuple[str, int, float, float, int]] = []
+        self._job_statistics: list[tuple[int, _quantizationjob.SearchStatistics]] = []
+        self._stage_records: list[tuple[str, float, float, int]] = []
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def beat_records(self) -> tuple[tuple[str, int, float, float, int], ...]:
+        """
+        Gets (stage, index, start, stop, count) records of beats.
+        """
+        return tuple(self._beat_records)
+
+    @property
+    def job_statistics(
+        self,
+    ) -> tuple[tuple[int, _quantizationjob.SearchStatistics], ...]:
+        """
+        Gets (job ID, search statistics) records of jobs.
+        """
+        return tuple(self._job_statistics)
+
+    @property
+    def stage_records(self) -> tuple[tuple[str, float, float, int], ...]:
+        """
+        Gets (stage, start, stop, count) records of stages.
+        """
+        return tuple(self._stage_records)
+
+    ### PUBLIC METHODS ###
+
+    def get_durations(self) -> dict[str, float]:
+        """
+        Gets total seconds spent in each stage.
+        """
+        durations: dict[str, float] = {}
+        for stage, start, stop, count in self._stage_records:
+            durations[stage] = durations.get(stage, 0.0) + stop - start
+        return durations
+
+    def get_search_statistics(self) -> _quantizationjob.SearchStatistics:
+        """
+        Gets search statistics aggregated across every job.
+        """
+        statistics = _quantizationjob.SearchStatistics(job_count=0)
+        for job_id, statistics_ in self._job_statistics:
+            statistics += statistics_
+        return statistics
+
+    def record_beat(
+        self, stage: str, index: int, start: float, stop: float, count: int
+    ) -> None:
+        """
+        Records timing and item count of beat ``index`` during ``stage``.
+        """
+        self._beat_records.append((stage, index, start, stop, count))
+
+    def record_job(self, job: _quantizationjob.QuantizationJob) -> None:
+        """
+        Records search statistics of processed ``job``.
+        """
+        if job.statistics is not None:
+            self._job_statistics.append((job.job_id, job.statistics))
+
+    def record_stage(self, stage: str, start: float, stop: float, count: int) -> None:
+        """
+        Records timing and item count of ``stage``.
+        """
+        self._stage_records.append((stage, start, stop, count))
@@ -44,7 +44,7 @@ class SearchTree(abc.ABC):
         for command in commands:
             new_q_grid = copy.deepcopy(q_grid)
             q_events = new_q_grid.subdivide_leaves(command)
-            new_q_grid.fit_q_events(q_events)
+            new_q_grid._fit_q_events(q_events)
             new_q_grids.append(new_q_grid)
         return new_q_grids
 
@@ -0,0 +1,412 @@
+import typing
+
+import abjad
+
+from . import attackpointoptimizers as _attackpointoptimizers
+from . import gracehandlers as _gracehandlers
+from . import heuristics as _heuristics
+from . import jobhandlers as _jobhandlers
+from . import qevents as _qevents
+from . import qschemas as _qschemas
+from . import qtargetitems as _qtargetitems
+
+
+class StreamingQuantizer:
+    r"""
+    Streaming quantizer.
+
+    Quantizes ``QEvents`` fed in chunks, without knowing the total duration
+    in advance, and returns the notation of each measure (or, with a
+    ``BeatwiseQSchema``, of each beat) as soon as no further ``QEvent`` can
+    affect it.
+
+    A beat is searched once a ``QEvent`` at or after its end has been fed; it
+    is notated once the following beat has been searched too, because
+    ``QEvents`` quantized to the next downbeat of a beat are shifted onto the
+    first leaf of the following beat. With a ``MeasurewiseQSchema`` each
+    measure is returned once the following measure has been notated; with a
+    ``BeatwiseQSchema`` beats are returned in groups which no tie crosses, so
+    that the attack-point optimizer sees every leaf of each logical tie,
+    exactly as it does when quantizing the whole sequence.
+
+    Extending a voice with everything returned by ``feed()`` and ``close()``
+    gives the same notation as ``quantize()`` gives for the same
+    ``QEvents``, when the heuristic selects ``QGrids`` beat by beat. Global
+    heuristics, such as ``ViterbiHeuristic``, only select jointly among the
+    beats searched by each call.
+
+    Only the beats and measures not yet returned are kept in memory.
+
+    ..  container:: example
+
+        >>> durations = [1000, 500, 500, 333, 333, 334, 1500, 500, 2000]
+        >>> durations += [1000, 1000, 1000]
+        >>> q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+        >>> quantizer = nauert.StreamingQuantizer()
+        >>> voice = abjad.Voice()
+        >>> for i in range(0, len(q_event_sequence), 3):
+        ...     components = quantizer.feed(q_event_sequence[i : i + 3])
+        ...     print(len(components))
+        ...     voice.extend(components)
+        ...
+        0
+        0
+        0
+        1
+        0
+        >>> components = quantizer.close()
+        >>> len(components)
+        2
+        >>> voice.extend(components)
+        >>> abjad.lilypond(voice) == abjad.lilypond(nauert.quantize(q_event_sequence))
+        True
+
+        >>> staff = abjad.Staff([voice])
+        >>> score = abjad.Score([staff])
+        >>> abjad.show(score) # doctest: +SKIP
+
+        ..  docs::
+
+            >>> string = abjad.lilypond(voice)
+            >>> print(string)
+            \new Voice
+            {
+                {
+                    \tempo 4=60
+                    \time 4/4
+                    c'4
+                    c'8
+                    c'8
+                    \tuplet 3/2
+                    {
+                        c'8
+                        c'8
+                        c'8
+                    }
+                    c'4
+                    ~
+                }
+                {
+                    c'8
+                    c'8
+                    c'2
+                    c'4
+                }
+                {
+                    c'4
+                    c'4
+                    r4
+                    r4
+                }
+            }
+
+    """
+
+    ### CLASS VARIABLES ###
+
+    __slots__ = (
+        "_attach_tempos",
+        "_attack_point_optimizer",
+        "_beat_index",
+        "_grace_handler",
+        "_group",
+        "_heuristic",
+        "_is_closed",
+        "_item_index",
+        "_items",
+        "_job_handler",
+        "_last_q_event",
+        "_offset",
+        "_open_beats",
+        "_previous_item",
+        "_q_schema",
+        "_q_target",
+        "_ready_beat_count",
+        "_selected_beat",
+        "_voice",
+    )
+
+    ### INITIALIZER ###
+
+    def __init__(
+        self,
+        q_schema: _qschemas.QSchema | None = None,
+        grace_handler: _gracehandlers.GraceHandler | None = None,
+        heuristic: _heuristics.Heuristic | None = None,
+        job_handler: _jobhandlers.JobHandler | None = None,
+        attack_point_optimizer: (
+            _attackpointoptimizers.AttackPointOptimizer | None
+        ) = None,
+        attach_tempos: bool = True,
+    ) -> None:
+        if q_schema is None:
+            q_schema = _qschemas.MeasurewiseQSchema()
+        assert isinstance(q_schema, _qschemas.QSchema)
+        q_target = q_schema.target_class()
+        grace_handler, heuristic, attack_point_optimizer, _ = q_target._get_handlers(
+            grace_handler, heuristic, attack_point_optimizer, None
+        )
+        if job_handler is None:
+            job_handler = _jobhandlers.SerialJobHandler()
+        assert isinstance(job_handler, _jobhandlers.JobHandler)
+        self._attach_tempos = bool(attach_tempos)
+        self._attack_point_optimizer = attack_point_optimizer
+        # job ID of first open beat
+        self._beat_index = 0
+        self._grace_handler = grace_handler
+        # notated items not yet returned
+        self._group: list[_qtargetitems.QTargetItem] = []
+        self._heuristic = heuristic
+        self._is_closed = False
+        self._item_index = 0
+        # items not yet notated
+        self._items: list[_qtargetitems.QTargetItem] = []
+        self._job_handler = job_handler
+        self._last_q_event: _qevents.QEvent | None = None
+        # offset in milliseconds of the end of the last item
+        self._offset = abjad.Offset(0)
+        # beats which may still receive QEvents
+        self._open_beats: list[_qtargetitems.QTargetBeat] = []
+        self._previous_item: _qtargetitems.QTargetItem | None = None
+        self._q_schema = q_schema
+        self._q_target = q_target
+        # number of beats of unnotated items ready to be notated
+        self._ready_beat_count = 0
+        # last searched beat, waiting for its QEvents to be shifted onto the
+        # next searched beat
+        self._selected_beat: _qtargetitems.QTargetBeat | None = None
+        self._voice = abjad.Voice()
+
+    ### SPECIAL METHODS ###
+
+    def __repr__(self) -> str:
+        """
+        Gets repr.
+        """
+        return "{}(q_schema={!r})".format(type(self).__name__, self.q_schema)
+
+    ### PRIVATE METHODS ###
+
+    def _assign_q_event(
+        self, q_event: _qevents.QEvent
+    ) -> list[tuple[int, _qtargetitems.QTargetBeat]]:
+        if self._last_q_event is None:
+            assert 0 <= q_event.offset, repr(q_event)
+        else:
+            assert not isinstance(self._last_q_event, _qevents.TerminalQEvent)
+            assert self._last_q_event.offset <= q_event.offset, repr(q_event)
+        if isinstance(q_event, _qevents.TerminalQEvent):
+            # a TerminalQEvent at the end of a beat belongs to that beat
+            assert self._last_q_event is not None
+            while self._offset < q_event.offset:
+                self._make_item()
+        else:
+            assert isinstance(q_event, _qevents.PitchedQEvent | _qevents.SilentQEvent)
+            while self._offset <= q_event.offset:
+                self._make_item()
+        self._last_q_event = q_event
+        # beats before the last beat starting at or before the QEvent's offset
+        # can receive no more QEvents
+        index = len(self._open_beats) - 1
+        while q_event.offset < self._open_beats[index].offset_in_ms:
+            index -= 1
+        complete_beats = list(enumerate(self._open_beats[:index], self._beat_index))
+        del self._open_beats[:index]
+        self._beat_index += index
+        self._open_beats[0].q_events.append(q_event)
+        return complete_beats
+
+    @staticmethod
+    def _get_beats(
+        item: _qtargetitems.QTargetItem,
+    ) -> tuple[_qtargetitems.QTargetBeat, ...]:
+        if isinstance(item, _qtargetitems.QTargetBeat):
+            return (item,)
+        assert isinstance(item, _qtargetitems.QTargetMeasure)
+        return item.beats
+
+    def _make_item(self) -> None:
+        lookup = self.q_schema[self._item_index]
+        lookup["offset_in_ms"] = self._offset
+        item = self.q_schema.target_item_class(**lookup)
+        self._items.append(item)
+        self._open_beats.extend(self._get_beats(item))
+        self._item_index += 1
+        self._offset += item.duration_in_ms
+
+    def _notate(self) -> list[abjad.Component]:
+        components: list[abjad.Component] = []
+        while self._items:
+            item = self._items[0]
+            beat_count = len(self._get_beats(item))
+            if self._ready_beat_count < beat_count:
+                break
+            del self._items[0]
+            self._ready_beat_count -= beat_count
+            start = len(self._voice)
+            self._voice.extend(
+                self._q_target._notate_item(
+                    item, self._previous_item, self._attach_tempos
+                )
+            )
+            self._q_target._notate_leaves(self._grace_handler, self._voice[start:])
+            if start and self._q_target._is_releasable(self._voice, start):
+                components.extend(
+                    self._q_target._release_notation(
+                        self._voice, start, self._group, self._attack_point_optimizer
+                    )
+                )
+                self._group = []
+            self._group.append(item)
+            self._previous_item = item
+        return components
+
+    def _search(
+        self, complete_beats: typing.Sequence[tuple[int, _qtargetitems.QTargetBeat]]
+    ) -> None:
+        if not complete_beats:
+            return
+        beats = dict(complete_beats)
+        jobs = [beat(job_id) for job_id, beat in complete_beats]
+        jobs, duplicate_jobs = self._q_target._group_equivalent_jobs(
+            [_ for _ in jobs if _ is not None]
+        )
+        for job in self._job_handler(jobs):
+            beats[job.job_id]._q_grids = job.q_grids
+            for duplicate_job in duplicate_jobs.get(job.job_id, ()):
+                beats[duplicate_job.job_id]._q_grids = job.q_grids
+        self._heuristic(tuple(beats.values()))
+        for duplicate_jobs_ in duplicate_jobs.values():
+            for duplicate_job in duplicate_jobs_:
+                beat = beats[duplicate_job.job_id]
+                assert beat.q_grid is not None
+                proxies = duplicate_job.q_event_proxies
+                beat._q_grid = beat.q_grid._rebind_q_event_proxies(proxies)
+        for beat in beats.values():
+            if self._selected_beat is not None:
+                self._shift(self._selected_beat, beat)
+            self._selected_beat = beat
+
+    def _shift(
+        self,
+        one: _qtargetitems.QTargetBeat,
+        two: _qtargetitems.QTargetBeat | None,
+    ) -> list:
+        assert one.q_grid is not None
+        one_q_events = one.q_grid.next_downbeat.q_event_proxies
+        orphaned_q_event_proxies = []
+        if two is None:
+            orphaned_q_event_proxies = [
+                proxy
+                for proxy in one_q_events
+                if not isinstance(proxy.q_event, _qevents.TerminalQEvent)
+            ]
+        else:
+            assert two.q_grid is not None
+            two_q_events = two.q_grid.leaves[0].q_event_proxies
+            while one_q_events:
+                two_q_events.insert(0, one_q_events.pop())
+        one.q_grid.regroup_leaves_with_unencessary_divisions()
+        self._ready_beat_count += 1
+        return orphaned_q_event_proxies
+
+    ### PUBLIC PROPERTIES ###
+
+    @property
+    def attach_tempos(self) -> bool:
+        """
+        Is true when tempos are attached to notation.
+        """
+        return self._attach_tempos
+
+    @property
+    def attack_point_optimizer(self) -> _attackpointoptimizers.AttackPointOptimizer:
+        """
+        Gets attack-point optimizer.
+        """
+        return self._attack_point_optimizer
+
+    @property
+    def grace_handler(self) -> _gracehandlers.GraceHandler:
+        """
+        Gets grace handler.
+        """
+        return self._grace_handler
+
+    @property
+    def heuristic(self) -> _heuristics.Heuristic:
+        """
+        Gets heuristic.
+        """
+        return self._heuristic
+
+    @property
+    def is_closed(self) -> bool:
+        """
+        Is true when streaming quantizer is closed.
+        """
+        return self._is_closed
+
+    @property
+    def job_handler(self) -> _jobhandlers.JobHandler:
+        """
+        Gets job handler.
+        """
+        return self._job_handler
+
+    @property
+    def q_schema(self) -> _qschemas.QSchema:
+        """
+        Gets q-schema.
+        """
+        return self._q_schema
+
+    ### PUBLIC METHODS ###
+
+    def close(self) -> list[abjad.Component]:
+        """
+        Closes streaming quantizer.
+
+        The last ``QEvent`` fed must be a ``TerminalQEvent``.
+
+        Returns the remaining notation.
+        """
+        assert not self.is_closed
+        assert isinstance(self._last_q_event, _qevents.TerminalQEvent), repr(
+            self._last_q_event
+        )
+        self._search(list(enumerate(self._open_beats, self._beat_index)))
+        self._open_beats = []
+        assert self._selected_beat is not None
+        orphaned_q_event_proxies = self._shift(self._selected_beat, None)
+        self._selected_beat = None
+        components = self._notate()
+        assert not self._items
+        # the last items are final
+        last_components = self._q_target._release_notation(
+            self._voice, len(self._voice), self._group, self._attack_point_optimizer
+        )
+        self._group = []
+        handle_orphaned_q_events = getattr(
+            self.grace_handler, "handle_orphaned_q_event_proxies", None
+        )
+        if callable(handle_orphaned_q_events) and orphaned_q_event_proxies:
+            last_leaf = abjad.select.leaf(last_components, -1)
+            handle_orphaned_q_events(last_leaf, orphaned_q_event_proxies)
+        components.extend(last_components)
+        self._is_closed = True
+        return components
+
+    def feed(self, q_events: typing.Iterable[_qevents.QEvent]) -> list[abjad.Component]:
+        """
+        Feeds ``q_events``, in order of offset, to streaming quantizer.
+
+        Returns the notation which no further ``QEvent`` can affect, as a list
+        of the top-level components of a voice.
+        """
+        assert not self.is_closed
+        complete_beats = []
+        for q_event in q_events:
+            complete_beats.extend(self._assign_q_event(q_event))
+        self._search(complete_beats)
+        return self._notate()
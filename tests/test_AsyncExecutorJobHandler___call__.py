@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import time
+
+import abjad
+import pytest
+
+import nauert
+
+
+class Job(nauert.QuantizationJob):
+
+    __slots__ = ("_state",)
+
+    def __init__(self, job_id, state):
+        nauert.QuantizationJob.__init__(self, job_id)
+        self._state = state
+
+    def __call__(self):
+        with self._state["lock"]:
+            self._state["running"] += 1
+            self._state["peak"] = max(self._state["peak"], self._state["running"])
+        time.sleep(0.02)
+        with self._state["lock"]:
+            self._state["running"] -= 1
+            self._state["finished"].append(self.job_id)
+
+
+def _make_state():
+    return {"finished": [], "lock": threading.Lock(), "peak": 0, "running": 0}
+
+
+def test_AsyncExecutorJobHandler___call___01():
+    """
+    Processes jobs like the serial job handler and returns them in order.
+    """
+    definition = {2: {2: None}, 3: None, 5: None}
+    search_tree = nauert.UnweightedSearchTree(definition)
+    jobs, serial_jobs = [], []
+    for job_id, count in enumerate([1, 3, 2], start=1):
+        q_event_proxies = [
+            nauert.QEventProxy(
+                nauert.SilentQEvent(abjad.Offset(i, count + 1), index=i),
+                abjad.Offset(0),
+                abjad.Offset(1),
+            )
+            for i in range(count)
+        ]
+        jobs.append(nauert.QuantizationJob(job_id, search_tree, q_event_proxies))
+        serial_jobs.append(nauert.QuantizationJob(job_id, search_tree, q_event_proxies))
+    nauert.SerialJobHandler()(serial_jobs)
+    job_handler = nauert.AsyncExecutorJobHandler(max_concurrency=2)
+    result = asyncio.run(job_handler(jobs))
+
+    assert [_.job_id for _ in result] == [1, 2, 3]
+    for job, serial_job in zip(result, serial_jobs):
+        rtms = [_.rtm_format for _ in job.q_grids]
+        assert rtms == [_.rtm_format for _ in serial_job.q_grids]
+
+
+def test_AsyncExecutorJobHandler___call___02():
+    """
+    Submits at most ``max_concurrency`` jobs at once.
+    """
+    state = _make_state()
+    jobs = [Job(i, state) for i in range(8)]
+    job_handler = nauert.AsyncExecutorJobHandler(max_concurrency=2)
+    asyncio.run(job_handler(jobs))
+
+    assert sorted(state["finished"]) == list(range(8))
+    assert state["peak"] <= 2
+
+
+def test_AsyncExecutorJobHandler___call___03():
+    """
+    Cancelling the awaiting task starts no further jobs.
+    """
+    state = _make_state()
+    jobs = [Job(i, state) for i in range(50)]
+    job_handler = nauert.AsyncExecutorJobHandler(max_concurrency=1)
+
+    async def main():
+        task = asyncio.create_task(job_handler(jobs))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+    assert 0 < len(state["finished"]) < 50
+    assert state["running"] == 0
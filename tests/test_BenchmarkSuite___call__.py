@@ -0,0 +1,42 @@
+import json
+
+import benchmarks
+import nauert
+
+
+def test_BenchmarkSuite___call___01():
+    """
+    Times matching benchmarks repeat times each.
+    """
+    suite = benchmarks.BenchmarkSuite(beat_count=1, repeat=2)
+    results = suite("attack_point_optimizer/*")
+    assert list(results["benchmarks"]) == [
+        "attack_point_optimizer/measurewise",
+        "attack_point_optimizer/naive",
+    ]
+    for result in results["benchmarks"].values():
+        assert len(result["times"]) == 2
+        assert result["minimum"] == min(result["times"])
+        assert 0 < result["count"]
+    metadata = results["metadata"]
+    assert (metadata["seed"], metadata["beat_count"], metadata["repeat"]) == (0, 1, 2)
+    assert metadata["nauert"] == nauert.__version__
+
+
+def test_BenchmarkSuite___call___02(tmp_path, capsys):
+    """
+    Writes results as JSON, and compares them against a baseline.
+    """
+    baseline_path = tmp_path / "baseline.json"
+    arguments = ["--beat-count", "1", "--repeat", "1", "-k", "search_tree/*binary"]
+    benchmarks.BenchmarkSuite.main(arguments + ["--output", str(baseline_path)])
+    baseline = json.loads(baseline_path.read_text())
+    assert list(baseline["benchmarks"]) == ["search_tree/unweighted_binary"]
+    capsys.readouterr()
+
+    benchmarks.BenchmarkSuite.main(arguments + ["--compare", str(baseline_path)])
+    captured = capsys.readouterr()
+    results = json.loads(captured.out)
+    comparisons = benchmarks.BenchmarkSuite.compare(baseline, results)
+    assert [_[0] for _ in comparisons] == ["search_tree/unweighted_binary"]
+    assert "x" in captured.err.splitlines()[-1]
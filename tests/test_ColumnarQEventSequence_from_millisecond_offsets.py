@@ -0,0 +1,110 @@
+import array
+import pickle
+
+import abjad
+import pytest
+
+import nauert
+
+
+def test_ColumnarQEventSequence_from_millisecond_offsets_01():
+    """
+    Makes the same q-events as the constructors of QEventSequence.
+    """
+    durations = [100, 200, 100, 300, 350, 400, 600]
+    pitches = [0, None, None, [1, 4], None, 5, 7]
+    pairs = tuple(zip(durations, pitches))
+    sequence = nauert.ColumnarQEventSequence.from_millisecond_pitch_pairs(pairs)
+    expected = nauert.QEventSequence.from_millisecond_pitch_pairs(pairs)
+    assert sequence.sequence == expected.sequence
+    assert sequence[1:3] == expected[1:3]
+    assert sequence[-2] == expected[-2]
+    assert sequence.duration_in_ms == expected.duration_in_ms
+    assert nauert.SilentQEvent(abjad.Offset(100)) in sequence
+
+    durations = [-250, 500, -1000, -1000, 1250]
+    method = nauert.ColumnarQEventSequence.from_millisecond_durations
+    sequence = method(durations, fuse_silences=True)
+    expected = nauert.QEventSequence.from_millisecond_durations(
+        durations, fuse_silences=True
+    )
+    assert sequence.sequence == expected.sequence
+
+
+def test_ColumnarQEventSequence_from_millisecond_offsets_02():
+    """
+    Stores an array of offsets as an array, and quantizes like a q-event
+    sequence.
+    """
+    offsets = array.array("d", [0, 250, 750, 1000, 1750, 3000, 4000])
+    pitches = array.array("l", [0, 2, 4, 5, 7, 9])
+    method = nauert.ColumnarQEventSequence.from_millisecond_offsets
+    sequence = method(offsets, pitches)
+    assert isinstance(sequence._offsets, array.array)
+    assert sequence._offsets is not offsets
+    q_event_sequence = nauert.QEventSequence(sequence.sequence)
+    assert abjad.lilypond(nauert.quantize(sequence)) == abjad.lilypond(
+        nauert.quantize(q_event_sequence)
+    )
+    sequence = pickle.loads(pickle.dumps(sequence))
+    assert sequence.sequence == q_event_sequence.sequence
+
+
+def test_ColumnarQEventSequence_from_millisecond_offsets_03():
+    """
+    Converts q-events, keeping their indices, and rejects decreasing offsets
+    and mismatched columns.
+    """
+    q_events = [
+        nauert.PitchedQEvent(abjad.Offset(0), [0], ["foo"], index=1),
+        nauert.SilentQEvent(abjad.Offset(500), index=2),
+        nauert.TerminalQEvent(abjad.Offset(1000)),
+    ]
+    sequence = nauert.ColumnarQEventSequence(q_events)
+    assert sequence.sequence == tuple(q_events)
+    method = nauert.ColumnarQEventSequence.from_millisecond_offsets
+    with pytest.raises(ValueError):
+        method([0, 500, 250])
+    with pytest.raises(ValueError):
+        method([0, 500, 1000], [0])
+
+
+def test_ColumnarQEventSequence_from_millisecond_offsets_04():
+    """
+    Keeps float arrays compact, snapping their offsets as q-events are made,
+    and reports the largest change made like lists of floats.
+    """
+    numbers = [0, 100.1, 133.4, 200.0001, 450.25]
+    method = nauert.ColumnarQEventSequence.from_millisecond_offsets
+    sequence = method(array.array("d", numbers))
+    assert isinstance(sequence._offsets, array.array)
+    assert [_.offset for _ in sequence] == [
+        abjad.Offset(_, 1000) for _ in (0, 100100, 133400, 200000, 450250)
+    ]
+    error = method(numbers).rounding_error_in_ms
+    assert abjad.Duration(99, 10**6) < error < abjad.Duration(101, 10**6)
+    assert abs(sequence.rounding_error_in_ms - error) < abjad.Duration(1, 10**12)
+    sequence = method(array.array("d", numbers), resolution=None)
+    assert sequence.rounding_error_in_ms == 0
+    assert 10**12 < sequence[1].offset.denominator
+
+
+def test_ColumnarQEventSequence_from_millisecond_offsets_05():
+    """
+    Makes each q-event once while it is referenced elsewhere, so that q-events
+    match by identity, and pickles without the q-events made.
+    """
+    method = nauert.ColumnarQEventSequence.from_millisecond_offsets
+    sequence = method([0, 250, 750, 1000], [0, None, 1])
+    q_events = list(sequence)
+    assert all(a is b for a, b in zip(q_events, sequence))
+    assert sequence[1] is q_events[1]
+    assert sequence[1:3] == tuple(q_events[1:3])
+    assert q_events[2] in sequence
+    copy = pickle.loads(pickle.dumps(sequence))
+    assert copy.sequence == sequence.sequence
+    assert copy[0] is copy[0]
+    with pytest.raises(ValueError):
+        nauert.ColumnarQEventSequence.from_millisecond_pitch_attachment_tuples(
+            [(100, None, ("foo",))]
+        )
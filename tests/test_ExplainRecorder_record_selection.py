@@ -0,0 +1,80 @@
+import io
+import json
+
+import nauert
+
+
+def make_q_event_sequence():
+    durations = [1000, 500, 500, 333, 333, 334, 1000, 250, 750]
+    return nauert.QEventSequence.from_millisecond_durations(durations)
+
+
+def test_ExplainRecorder_record_selection_01():
+    """
+    Writes one JSON line per beat, describing the selected QGrid.
+    """
+    q_event_sequence = make_q_event_sequence()
+    sink = io.StringIO()
+    recorder = nauert.ExplainRecorder(sink)
+    job_handler = nauert.SerialJobHandler()
+    nauert.quantize(q_event_sequence, job_handler=job_handler, recorder=recorder)
+
+    rows = [json.loads(_) for _ in sink.getvalue().splitlines()]
+    assert [_["beat"] for _ in rows] == list(range(8))
+    assert sum(len(_["q_event_offsets"]) for _ in rows) == len(q_event_sequence)
+    assert [_["rtm_format"] for _ in rows[:5]] == [
+        "1",
+        "(1 (1 1))",
+        "(1 (1 1 1))",
+        "1",
+        "(1 ((1 (1 1)) 1))",
+    ]
+    for row in rows[:6]:
+        if 1 < row["candidate_count"]:
+            assert row["runner_up_rtm_format"] != row["rtm_format"]
+            assert row["distance"] <= row["runner_up_distance"]
+        else:
+            assert row["runner_up_rtm_format"] is None
+        assert 0 <= row["search_time"]
+    # empty beats have no job, no distance and no search time
+    for row in rows[6:]:
+        assert row["q_event_offsets"] == []
+        assert row["job_id"] is row["distance"] is row["search_time"] is None
+    # equivalent empty beats report the job which searched their QGrids
+    assert rows[3]["job_id"] == rows[0]["job_id"] == 0
+
+
+def test_ExplainRecorder_record_selection_02():
+    """
+    Reports the best other candidate when the heuristic selects another.
+    """
+    durations = [900, 100, 1000, 1000, 1000]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    definition = {5: None}
+    q_schema = nauert.MeasurewiseQSchema(
+        search_tree=nauert.UnweightedSearchTree(definition)
+    )
+    sink = io.StringIO()
+    recorder = nauert.ExplainRecorder(sink)
+    heuristic = nauert.ViterbiHeuristic()
+    nauert.quantize(
+        q_event_sequence, heuristic=heuristic, q_schema=q_schema, recorder=recorder
+    )
+
+    row = json.loads(sink.getvalue().splitlines()[0])
+    assert row["rtm_format"] == "(1 (1 1 1 1 1))"
+    assert row["runner_up_rtm_format"] == "1"
+    assert row["runner_up_distance"] == row["distance"]
+
+
+def test_ExplainRecorder_record_selection_03():
+    """
+    Records nothing when not sampled.
+    """
+    sink = io.StringIO()
+    recorder = nauert.ExplainRecorder(sink, format="csv", fraction=0)
+    nauert.quantize(make_q_event_sequence(), recorder=recorder)
+
+    assert not recorder.is_sampled
+    assert not recorder.records_beats
+    assert sink.getvalue() == ""
@@ -0,0 +1,37 @@
+import benchmarks
+import nauert
+
+
+def test_JitterGenerator___call___01():
+    """
+    Generates equal performances from equal seeds.
+    """
+    generator = benchmarks.JitterGenerator(seed=3)
+    assert generator.make_pairs(8, 3) == generator.make_pairs(8, 3)
+    assert generator.make_pairs(8, 3) == benchmarks.JitterGenerator(3).make_pairs(8, 3)
+    assert generator.make_pairs(8, 3) != benchmarks.JitterGenerator(4).make_pairs(8, 3)
+
+
+def test_JitterGenerator___call___02():
+    """
+    Generates about density attacks per beat, spanning about beat_count
+    beats.
+    """
+    generator = benchmarks.JitterGenerator(seed=0, drift=0.0)
+    pairs = generator.make_pairs(32, 4)
+    assert all(0 < duration for duration, pitch in pairs)
+    assert 32 * 3 < len(pairs) < 32 * 5
+    assert 31 * 1000 < sum(duration for duration, pitch in pairs) <= 32 * 1000
+
+
+def test_JitterGenerator___call___03():
+    """
+    Generates rests with rest_probability.
+    """
+    pairs = benchmarks.JitterGenerator(rest_probability=0.0).make_pairs(16)
+    assert all(pitch is not None for duration, pitch in pairs)
+    pairs = benchmarks.JitterGenerator(rest_probability=0.5).make_pairs(16)
+    assert any(pitch is None for duration, pitch in pairs)
+    q_event_sequence = benchmarks.JitterGenerator()(16)
+    assert isinstance(q_event_sequence, nauert.QEventSequence)
+    assert isinstance(q_event_sequence[-1], nauert.TerminalQEvent)
@@ -0,0 +1,139 @@
+import abjad
+import pytest
+
+import nauert
+
+
+def write_midi_file(path, tracks, format_=1, division=96):
+    with open(path, "wb") as file:
+        file.write(b"MThd" + (6).to_bytes(4, "big"))
+        for number in (format_, len(tracks), division):
+            file.write(number.to_bytes(2, "big"))
+        for events in tracks:
+            data = bytearray()
+            for delta, event in events + [(0, "FF 2F 00")]:
+                bytes_ = [delta & 0x7F]
+                while delta > 0x7F:
+                    delta >>= 7
+                    bytes_.insert(0, 0x80 | (delta & 0x7F))
+                data += bytes(bytes_) + bytes.fromhex(event)
+            file.write(b"MTrk" + len(data).to_bytes(4, "big") + bytes(data))
+    return path
+
+
+def test_MIDIFile_q_event_sequence_01(tmp_path):
+    """
+    Changes ticks to milliseconds by the tempo map of the first track, and
+    merges the other tracks into chords.
+    """
+    tempo_track = [(0, "FF 51 03 07A120"), (192, "FF 51 03 0F4240")]
+    upper = [(0, "90 48 64"), (96, "80 48 00"), (96, "90 4A 64"), (192, "80 4A 00")]
+    lower = [(0, "91 3C 64"), (192, "81 3C 00"), (0, "91 3E 64"), (96, "81 3E 00")]
+    path = write_midi_file(tmp_path / "tracks.mid", [tempo_track, upper, lower])
+    with nauert.MIDIFile(path) as midi_file:
+        assert midi_file.track_count == 3
+        sequence = midi_file.q_event_sequence()
+    expected = nauert.ColumnarQEventSequence.from_millisecond_offsets(
+        [0, 1000, 3000], [(0, 12), (2, 14)]
+    )
+    assert list(sequence) == list(expected)
+    assert abjad.lilypond(nauert.quantize(sequence)) == abjad.lilypond(
+        nauert.quantize(expected)
+    )
+
+
+def test_MIDIFile_q_event_sequence_02(tmp_path):
+    """
+    Filters tracks and channels, follows running status, and skips other
+    events; leading silences start at 0.
+    """
+    track = [
+        (0, "F0 03 7E 09 01"),
+        (0, "C0 05"),
+        (48, "90 3C 64"),
+        (0, "40 64"),
+        (0, "91 43 64"),
+        (0, "B0 07 64"),
+        (48, "80 3C 00"),
+        (0, "90 40 00"),
+        (48, "FF 01 03 616263"),
+        (0, "81 43 00"),
+    ]
+    path = write_midi_file(tmp_path / "channels.mid", [track], format_=0)
+    with nauert.MIDIFile(path) as midi_file:
+        sequence = midi_file.q_event_sequence(channels=[0])
+        assert [_.offset for _ in sequence] == [0, 250, 500]
+        assert isinstance(sequence[0], nauert.SilentQEvent)
+        assert sequence[1].pitches == (
+            abjad.NamedPitch("c'"),
+            abjad.NamedPitch("e'"),
+        )
+        sequence = midi_file.q_event_sequence(track=0)
+        assert [_.offset for _ in sequence] == [0, 250, 750]
+        assert len(sequence[1].pitches) == 3
+
+
+def test_MIDIFile_q_event_sequence_03(tmp_path, monkeypatch):
+    """
+    Reads tracks block by block.
+    """
+    monkeypatch.setattr(nauert.midifiles._TrackReader, "_block_size", 7)
+    durations = [96, 48, 48, 288, 24, 204] * 20
+    track, pitch = [], 60
+    for duration in durations:
+        track.append((0, "90 {:02X} 64".format(pitch)))
+        track.append((duration, "80 {:02X} 00".format(pitch)))
+        pitch = 60 + (pitch - 59) % 12
+    path = write_midi_file(tmp_path / "blocks.mid", [track], format_=0, division=48)
+    with nauert.MIDIFile(path) as midi_file:
+        sequence = midi_file.q_event_sequence()
+    offsets = [0]
+    for duration in durations:
+        offsets.append(offsets[-1] + duration * 500 // 48)
+    assert [_.offset for _ in sequence] == offsets
+
+
+def test_MIDIFile_q_event_sequence_04(tmp_path):
+    """
+    Reads SMPTE divisions, and raises on files of format 2 without a track,
+    and on tracks without notes.
+    """
+    track = [(0, "90 3C 64"), (50, "80 3C 00")]
+    division = ((256 - 25) << 8) | 40
+    path = write_midi_file(tmp_path / "smpte.mid", [track], division=division)
+    with nauert.MIDIFile(path) as midi_file:
+        assert [_.offset for _ in midi_file.q_event_sequence()] == [0, 50]
+    path = write_midi_file(tmp_path / "format2.mid", [track, []], format_=2)
+    with nauert.MIDIFile(path) as midi_file:
+        with pytest.raises(ValueError):
+            midi_file.q_event_sequence()
+        with pytest.raises(ValueError):
+            midi_file.q_event_sequence(track=1)
+
+
+def test_MIDIFile_q_event_sequence_05(tmp_path):
+    """
+    Raises on malformed and truncated files, closing them.
+    """
+    track = [(0, "90 3C 64"), (96, "80 3C 00")]
+    path = write_midi_file(tmp_path / "whole.mid", [track])
+    data = path.read_bytes()
+    path = tmp_path / "truncated.mid"
+    path.write_bytes(data[:-3])
+    with pytest.raises(ValueError):
+        nauert.MIDIFile(path)
+    path = tmp_path / "magic.mid"
+    path.write_bytes(b"RIFF" + data[4:])
+    with pytest.raises(ValueError):
+        nauert.MIDIFile(path)
+    path = tmp_path / "header.mid"
+    path.write_bytes(data[:10])
+    with pytest.raises(ValueError):
+        nauert.MIDIFile(path)
+    for events in ("00 3C 64", "FF FF FF FF 7F 90 3C 64"):
+        path = tmp_path / "events.mid"
+        event = bytes.fromhex(events)
+        path.write_bytes(data[:14] + b"MTrk" + len(event).to_bytes(4, "big") + event)
+        with nauert.MIDIFile(path) as midi_file:
+            with pytest.raises(ValueError):
+                midi_file.q_event_sequence()
@@ -6,3 +6,34 @@ import nauert
 def test_MeasurewiseQSchema___call___01():
     schema = nauert.MeasurewiseQSchema()
     schema(abjad.Duration(5000))
+
+
+def test_MeasurewiseQSchema___call___02():
+    """
+    Makes runs of measures sharing settings equal to measures made one by
+    one, and looks up measures by index or offset in milliseconds.
+    """
+    schema = nauert.MeasurewiseQSchema(
+        {
+            2: {"tempo": abjad.MetronomeMark(abjad.Duration(1, 4), 56)},
+            3: {"time_signature": abjad.TimeSignature((5, 8))},
+            6: {"use_full_measure": True},
+        }
+    )
+    target = schema(abjad.Duration(30000))
+    offset = abjad.Offset(0)
+    for i, measure in enumerate(target.items):
+        expected = nauert.QTargetMeasure(offset_in_ms=offset, **schema[i])
+        assert measure.offset_in_ms == offset
+        assert measure.time_signature == expected.time_signature
+        assert measure.tempo == expected.tempo
+        assert [(_.offset_in_ms, _.beatspan) for _ in measure.beats] == [
+            (_.offset_in_ms, _.beatspan) for _ in expected.beats
+        ]
+        assert all(not _.q_events for _ in measure.beats)
+        assert schema.get_item_offset_in_ms(i) == offset
+        assert schema.get_item_index(offset) == i
+        assert schema.get_item_index(offset + measure.duration_in_ms / 2) == i
+        offset += measure.duration_in_ms
+    assert offset - target.items[-1].duration_in_ms < 30000 <= offset
+    assert target.items[-1].use_full_measure
@@ -0,0 +1,77 @@
+import tracemalloc
+
+import nauert
+
+
+def make_q_event_sequence():
+    durations = [1000, 500, 500]
+    return nauert.QEventSequence.from_millisecond_durations(durations)
+
+
+def test_MemoryRecorder_stage_01():
+    """
+    Records peak and retained bytes of every stage, and the allocation sites
+    inside nauert which retained the most.
+    """
+    q_event_sequence = make_q_event_sequence()
+    job_handler = nauert.SerialJobHandler()
+    with nauert.MemoryRecorder(limit=2) as recorder:
+        nauert.quantize(q_event_sequence, job_handler=job_handler, recorder=recorder)
+    assert not tracemalloc.is_tracing()
+
+    stages = [_[0] for _ in recorder.stage_records]
+    assert stages == [
+        "assign_q_events",
+        "make_jobs",
+        "handle_jobs",
+        "heuristic",
+        "rebind_duplicates",
+        "shift_downbeats",
+        "regroup",
+        "notate",
+        "handle_orphans",
+    ]
+    for stage, peak, retained, count in recorder.stage_records:
+        assert retained <= peak
+    handle_jobs = dict((_[0], _[1:]) for _ in recorder.stage_records)["handle_jobs"]
+    assert 0 < handle_jobs[1]
+
+    assert recorder.allocation_records
+    for stage, filename, lineno, size in recorder.allocation_records:
+        assert filename.startswith("nauert/")
+        assert filename != "nauert/recorders.py"
+        assert size != 0
+    for stage in stages:
+        records = [_ for _ in recorder.allocation_records if _[0] == stage]
+        assert len(records) <= 2
+
+
+def test_MemoryRecorder_stage_02():
+    """
+    Traces allocations stage by stage when not used as a context manager,
+    and records no allocation sites when limit is zero.
+    """
+    q_event_sequence = make_q_event_sequence()
+    recorder = nauert.MemoryRecorder(limit=0)
+    nauert.quantize(q_event_sequence, recorder=recorder)
+    assert not tracemalloc.is_tracing()
+    assert len(recorder.stage_records) == 9
+    assert recorder.allocation_records == ()
+
+
+def test_MemoryRecorder_stage_03():
+    """
+    Leaves tracing started by the caller running.
+    """
+    tracemalloc.start()
+    try:
+        with nauert.MemoryRecorder(limit=0) as recorder:
+            with recorder.stage("list", 1):
+                items = [object() for _ in range(1000)]
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    stage, peak, retained, count = recorder.stage_records[0]
+    assert (stage, count) == ("list", 1)
+    assert 1000 * 16 <= retained <= peak
+    assert len(items) == 1000
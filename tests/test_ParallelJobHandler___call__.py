@@ -54,3 +54,37 @@ def test_ParallelJobHandler___call___02():
     assert sorted(a_jobs[0].q_grids, key=lambda x: x.root_node.rtm_format) == sorted(
         b_jobs[0].q_grids, key=lambda x: x.root_node.rtm_format
     )
+
+
+def test_ParallelJobHandler___call___03():
+    """
+    Returns jobs in given order and records predicted and actual costs.
+    """
+    definition = {2: {2: None}, 3: None, 5: None}
+    search_tree = nauert.UnweightedSearchTree(definition)
+    jobs = []
+    for job_id, count in enumerate([1, 4, 2], start=1):
+        q_event_proxies = [
+            nauert.QEventProxy(
+                nauert.SilentQEvent(abjad.Offset(i, count), index=i),
+                abjad.Offset(0),
+                abjad.Offset(1),
+            )
+            for i in range(count)
+        ]
+        job = nauert.QuantizationJob(job_id, search_tree, q_event_proxies)
+        jobs.append(job)
+    job_handler = nauert.ParallelJobHandler()
+    finished_jobs = job_handler(jobs)
+
+    assert [_.job_id for _ in finished_jobs] == [1, 2, 3]
+    for job, finished_job in zip(jobs, finished_jobs):
+        job()
+        rtms = [_.rtm_format for _ in job.q_grids]
+        assert rtms == [_.rtm_format for _ in finished_job.q_grids]
+    records = sorted(job_handler.cost_records)
+    assert [_[:2] for _ in records] == [(1, 8), (2, 20), (3, 12)]
+    assert all(0 <= _[2] for _ in records)
+
+    job_handler(jobs[:1])
+    assert [_[:2] for _ in job_handler.cost_records] == [(1, 8)]
@@ -0,0 +1,95 @@
+import pickle
+
+import abjad
+import pytest
+
+import benchmarks
+import nauert
+
+
+def make_q_grids(q_event_sequence):
+    q_schema = nauert.BeatwiseQSchema(
+        search_tree=nauert.UnweightedSearchTree({2: {2: None}, 3: None})
+    )
+    q_target = q_schema(q_event_sequence.duration_in_ms)
+    q_target(q_event_sequence)
+    return [_.q_grid for _ in q_target.beats]
+
+
+def describe(q_grid, beatspan=abjad.Duration(1, 4)):
+    return (
+        q_grid.rtm_format,
+        [
+            [(_.q_event, _.offset) for _ in leaf.q_event_proxies]
+            for leaf in q_grid.leaves
+        ],
+        [_.is_divisible for _ in q_grid.leaves],
+        abjad.lilypond(abjad.Voice(q_grid(beatspan))),
+    )
+
+
+def test_QCheckpoint_load_01(tmp_path):
+    """
+    Loads the q-event sequence and selected q-grids of a quantization.
+    """
+    q_event_sequence = benchmarks.JitterGenerator(seed=4, rest_probability=0.2)(16, 4)
+    q_grids = make_q_grids(q_event_sequence)
+    path = tmp_path / "session.qck"
+    nauert.QCheckpoint.dump(path, q_event_sequence, q_grids)
+    sequence, q_grids_ = nauert.QCheckpoint.load(path)
+    assert list(sequence) == list(q_event_sequence)
+    assert [describe(_) for _ in q_grids_] == [describe(_) for _ in q_grids]
+    assert pickle.loads(pickle.dumps(sequence)).sequence == sequence.sequence
+
+
+def test_QCheckpoint_load_02(tmp_path):
+    """
+    Keeps pitch spellings, chords, attachments, indices and rational offsets.
+    """
+    q_events = [
+        nauert.PitchedQEvent(abjad.Offset(0), ["cs'", "df'"], ["foo"], index=0),
+        nauert.SilentQEvent(abjad.Offset(1000, 3), [["unhashable"]], index=1),
+        nauert.PitchedQEvent(abjad.Offset(500), [0.5], ["foo"], index=2),
+        nauert.TerminalQEvent(abjad.Offset(1500)),
+    ]
+    q_event_sequence = nauert.QEventSequence(q_events)
+    path = tmp_path / "session.qck"
+    nauert.QCheckpoint.dump(path, q_event_sequence)
+    sequence, q_grids = nauert.QCheckpoint.load(path)
+    assert q_grids == []
+    assert list(sequence) == q_events
+    assert [_.name for _ in sequence[0].pitches] == ["cs'", "df'"]
+
+
+def test_QCheckpoint_load_03(tmp_path):
+    """
+    Reads q-events and q-grids lazily, by index.
+    """
+    q_event_sequence = benchmarks.JitterGenerator(seed=5)(12, 3)
+    q_grids = make_q_grids(q_event_sequence)
+    path = tmp_path / "session.qck"
+    nauert.QCheckpoint.dump(path, q_event_sequence, q_grids)
+    with nauert.QCheckpoint(path) as checkpoint:
+        assert checkpoint.q_event_count == len(q_event_sequence)
+        assert checkpoint.q_grid_count == len(q_grids)
+        sequence = checkpoint.q_event_sequence()
+        assert sequence[5] == q_event_sequence[5]
+        assert describe(checkpoint.q_grid(-1)) == describe(q_grids[-1])
+        with pytest.raises(IndexError):
+            checkpoint.q_grid(len(q_grids))
+        data = pickle.dumps(sequence)
+    assert list(pickle.loads(data)) == list(q_event_sequence)
+
+
+def test_QCheckpoint_load_04(tmp_path):
+    """
+    Asserts on other files, other versions and truncated checkpoints.
+    """
+    path = tmp_path / "session.qck"
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations([1000])
+    nauert.QCheckpoint.dump(path, q_event_sequence)
+    data = path.read_bytes()
+    for data_ in (b"XXXX" + data[4:], data[:4] + b"\x02" + data[5:], data[:-1]):
+        path.write_bytes(data_)
+        with pytest.raises(AssertionError):
+            nauert.QCheckpoint(path)
@@ -0,0 +1,102 @@
+import pickle
+
+import abjad
+import pytest
+
+import nauert
+
+
+def write_log(tmp_path, records):
+    path = tmp_path / "session.log"
+    nauert.QEventLog.write(path, records)
+    return path
+
+
+def test_QEventLog_q_event_sequence_01(tmp_path):
+    """
+    Reads the whole log as the q-event sequence of its onsets and pitches.
+    """
+    offsets = [0, 1000, 1500, 2000, 4000]
+    pitches = [0, 2, None, 4]
+    records = [(o, p or 0, 1 if p is None else 0) for o, p in zip(offsets, pitches)]
+    records.append((offsets[-1], 0, 2))
+    path = write_log(tmp_path, records)
+    expected = nauert.ColumnarQEventSequence.from_millisecond_offsets(offsets, pitches)
+    with nauert.QEventLog(path) as log:
+        sequence = log.q_event_sequence()
+        assert list(sequence) == list(expected)
+        assert abjad.lilypond(nauert.quantize(sequence)) == abjad.lilypond(
+            nauert.quantize(expected)
+        )
+
+
+def test_QEventLog_q_event_sequence_02(tmp_path):
+    """
+    Without an end record, the log ends at the onset of its last record.
+    """
+    records = [(0, 0, 0), (1000, 2, 0), (3000, 0, 0)]
+    path = write_log(tmp_path, records)
+    with nauert.QEventLog(path) as log:
+        sequence = log.q_event_sequence()
+        assert len(sequence) == 3
+        assert isinstance(sequence[-1], nauert.TerminalQEvent)
+        assert sequence[-1].offset == 3000
+        sequence = log.q_event_sequence(1000, 2000)
+        assert [_.offset for _ in sequence] == [0, 1000]
+        assert sequence[0].pitches == (abjad.NamedPitch("d'"),)
+
+
+def test_QEventLog_q_event_sequence_03(tmp_path):
+    """
+    Records of the same onset make one chord; windows start with the chord
+    sounding at their start, and survive pickling once the log is closed.
+    """
+    records = [(0, 0, 0), (500, 4, 0), (500, 2, 0), (2000, 5, 0), (3000, 0, 2)]
+    path = write_log(tmp_path, records)
+    with nauert.QEventLog(path) as log:
+        sequence = log.q_event_sequence(1000, 2500)
+        data = pickle.dumps(sequence)
+    sequence = pickle.loads(data)
+    assert [_.offset for _ in sequence] == [0, 1000, 1500]
+    assert sequence[0].pitches == (abjad.NamedPitch("d'"), abjad.NamedPitch("e'"))
+
+
+def test_QEventLog_q_event_sequence_04(tmp_path):
+    """
+    Raises on truncated and empty logs, and on empty windows.
+    """
+    path = tmp_path / "session.log"
+    path.write_bytes(bytes(12))
+    with pytest.raises(ValueError):
+        nauert.QEventLog(path)
+    path.write_bytes(b"")
+    with pytest.raises(ValueError):
+        nauert.QEventLog(path)
+    path = write_log(tmp_path, [(1000, 0, 0), (2000, 0, 2)])
+    with nauert.QEventLog(path) as log:
+        with pytest.raises(ValueError):
+            log.q_event_sequence(3000, 4000)
+        with pytest.raises(ValueError):
+            log.q_event_sequence(1000, 1000)
+
+
+def test_QEventLog_q_event_sequence_05(tmp_path):
+    """
+    Logs starting after 0 start with a silence, and quantize.
+    """
+    records = [(1000, 0, 0), (1000, 0, 1), (1500, 2, 0), (2000, 0, 1)]
+    records.append((4000, 0, 2))
+    path = write_log(tmp_path, records)
+    with nauert.QEventLog(path) as log:
+        sequence = log.q_event_sequence()
+        assert [_.offset for _ in sequence] == [0, 1000, 1500, 2000, 4000]
+        assert isinstance(sequence[0], nauert.SilentQEvent)
+        assert sequence[1].pitches == (abjad.NamedPitch("c'"),)
+        assert isinstance(sequence[3], nauert.SilentQEvent)
+        voice = nauert.quantize(sequence)
+        assert isinstance(abjad.select.leaf(voice, 0), abjad.Rest)
+        sequence = log.q_event_sequence(0, 500)
+        assert [type(_) for _ in sequence] == [
+            nauert.SilentQEvent,
+            nauert.TerminalQEvent,
+        ]
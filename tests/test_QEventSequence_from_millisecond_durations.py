@@ -152,3 +152,28 @@ def test_QEventSequence_from_millisecond_durations_03():
             nauert.TerminalQEvent(abjad.Offset(600)),
         )
     )
+
+
+def test_QEventSequence_from_millisecond_durations_04():
+    """
+    Snaps offsets summing float durations to a resolution, and reports the
+    largest change made.
+    """
+    durations = [100.1, -33.3, 66.6, 0.1, 250]
+    q_events = nauert.QEventSequence.from_millisecond_durations(durations)
+    assert [_.offset for _ in q_events] == [
+        abjad.Offset(_, 10) for _ in (0, 1001, 1334, 2000, 2001, 4501)
+    ]
+    assert 0 < q_events.rounding_error_in_ms < abjad.Duration(1, 10**12)
+    q_events = nauert.QEventSequence.from_millisecond_durations(durations, resolution=1)
+    assert [_.offset for _ in q_events] == [0, 100, 133, 200, 200, 450]
+    assert (
+        abjad.Duration(39, 100)
+        < q_events.rounding_error_in_ms
+        < abjad.Duration(41, 100)
+    )
+    q_events = nauert.QEventSequence.from_millisecond_durations(
+        durations, resolution=None
+    )
+    assert 10**12 < q_events[1].offset.denominator
+    assert q_events.rounding_error_in_ms == 0
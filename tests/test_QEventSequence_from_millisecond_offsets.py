@@ -0,0 +1,24 @@
+import abjad
+import pytest
+
+import nauert
+
+
+def test_QEventSequence_from_millisecond_offsets_01():
+    """
+    Makes middle-C q-events at each offset but the last.
+    """
+    offsets = [abjad.Offset(_) for _ in (0, 250, 1000)]
+    sequence = nauert.QEventSequence.from_millisecond_offsets(offsets)
+    assert [_.offset for _ in sequence] == offsets
+    assert isinstance(sequence[0], nauert.PitchedQEvent)
+    assert sequence[0].pitches == (abjad.NamedPitch("c'"),)
+    assert isinstance(sequence[-1], nauert.TerminalQEvent)
+
+
+def test_QEventSequence_from_millisecond_offsets_02():
+    """
+    Raises on offsets which are not offsets.
+    """
+    with pytest.raises(TypeError):
+        nauert.QEventSequence.from_millisecond_offsets([0, 250, 1000])
@@ -1,4 +1,5 @@
 import abjad
+import pytest
 
 import nauert
 
@@ -28,3 +29,57 @@ def test_QEventSequence_from_millisecond_pitch_attachment_tuples_01():
             nauert.TerminalQEvent(abjad.Offset(2050, 1)),
         )
     ), repr(q_events)
+
+
+def test_QEventSequence_from_millisecond_pitch_attachment_tuples_02():
+    """
+    Q-events made without checking them again equal q-events made one by one.
+    """
+    durations = [100, 200, 100, 300, 350]
+    pitches = [0.5, [0.5, 4], None, 4, [0]]
+    attachments = [("foo",), [6], (), (), ["bar"]]
+    tuples = tuple(zip(durations, pitches, attachments))
+    q_events = nauert.QEventSequence.from_millisecond_pitch_attachment_tuples(tuples)
+    assert q_events == nauert.QEventSequence(
+        (
+            nauert.PitchedQEvent(abjad.Offset(0), [0.5], ["foo"]),
+            nauert.PitchedQEvent(abjad.Offset(100), [0.5, 4], [6]),
+            nauert.SilentQEvent(abjad.Offset(300)),
+            nauert.PitchedQEvent(abjad.Offset(400), [4]),
+            nauert.PitchedQEvent(abjad.Offset(700), [0], ["bar"]),
+            nauert.TerminalQEvent(abjad.Offset(1050)),
+        )
+    ), repr(q_events)
+    assert q_events[0].pitches[0] is q_events[1].pitches[0]
+    assert all(isinstance(_.attachments, tuple) for _ in q_events)
+
+
+def test_QEventSequence_from_millisecond_pitch_attachment_tuples_03():
+    """
+    Rejects malformed tuples, and malformed q-event sequences, with type and
+    value errors, whether or not assertions are enabled.
+    """
+    method = nauert.QEventSequence.from_millisecond_pitch_attachment_tuples
+    with pytest.raises(ValueError):
+        method([(100, 0)])
+    with pytest.raises(ValueError):
+        method([(0, 0, ())])
+    with pytest.raises(TypeError):
+        method([(100, "c'", ())])
+    with pytest.raises(ValueError):
+        method([(100, [], ())])
+    with pytest.raises(ValueError):
+        method([(100, None, ("foo",))])
+    with pytest.raises(ValueError):
+        nauert.QEventSequence([nauert.TerminalQEvent(abjad.Offset(0))])
+    with pytest.raises(TypeError):
+        nauert.QEventSequence(
+            [nauert.SilentQEvent(abjad.Offset(0)), nauert.SilentQEvent(abjad.Offset(1))]
+        )
+    with pytest.raises(ValueError):
+        nauert.QEventSequence(
+            [
+                nauert.SilentQEvent(abjad.Offset(1)),
+                nauert.TerminalQEvent(abjad.Offset(0)),
+            ]
+        )
@@ -1,4 +1,5 @@
 import abjad
+import pytest
 
 import nauert
 
@@ -22,3 +23,24 @@ def test_QEventSequence_from_millisecond_pitch_pairs_01():
             nauert.TerminalQEvent(abjad.Offset(2050, 1)),
         )
     )
+
+
+def test_QEventSequence_from_millisecond_pitch_pairs_02():
+    """
+    Raises on bad pairs, whether or not Python runs with -O.
+    """
+    method = nauert.QEventSequence.from_millisecond_pitch_pairs
+    with pytest.raises(TypeError):
+        method(None)
+    with pytest.raises(TypeError):
+        method([100])
+    with pytest.raises(ValueError):
+        method([(100, 0, 1)])
+    with pytest.raises(ValueError):
+        method([(0, 0)])
+    with pytest.raises(TypeError):
+        method([(100, "c'")])
+    with pytest.raises(ValueError):
+        method([(100, [])])
+    with pytest.raises(ValueError):
+        method([(100, 0)], resolution=0)
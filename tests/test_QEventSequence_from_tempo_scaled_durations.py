@@ -1,4 +1,5 @@
 import abjad
+import pytest
 
 import nauert
 
@@ -43,3 +44,15 @@ def test_QEventSequence_from_tempo_scaled_durations_02():
             nauert.TerminalQEvent(abjad.Offset(60000, 11)),
         )
     )
+
+
+def test_QEventSequence_from_tempo_scaled_durations_03():
+    """
+    Raises on durations which are not durations, and on bad tempi.
+    """
+    method = nauert.QEventSequence.from_tempo_scaled_durations
+    tempo = abjad.MetronomeMark(abjad.Duration(1, 4), 55)
+    with pytest.raises(TypeError):
+        method([(1, 4)], tempo)
+    with pytest.raises(TypeError):
+        method([abjad.Duration(1, 4)], 55)
@@ -1,4 +1,5 @@
 import abjad
+import pytest
 
 import nauert
 
@@ -88,3 +89,15 @@ def test_QEventSequence_from_tempo_scaled_leaves_02():
             nauert.TerminalQEvent(abjad.Offset(18210000, 2233)),
         )
     )
+
+
+def test_QEventSequence_from_tempo_scaled_leaves_03():
+    """
+    Raises on no leaves, and on leaves without tempo.
+    """
+    method = nauert.QEventSequence.from_tempo_scaled_leaves
+    with pytest.raises(ValueError):
+        method([])
+    staff = abjad.Staff("c'4 d'4")
+    with pytest.raises(ValueError):
+        method(abjad.select.leaves(staff))
@@ -0,0 +1,54 @@
+import abjad
+import pytest
+
+import nauert
+
+
+def test_QEventSequence_index_window_01():
+    """
+    Views a range of q-events, keeping their pitches, attachments and
+    indices, and ending at the offset of the q-event after the range.
+    """
+    q_events = [
+        nauert.PitchedQEvent(abjad.Offset(0), [0], ["foo"], index=0),
+        nauert.SilentQEvent(abjad.Offset(250), index=1),
+        nauert.PitchedQEvent(abjad.Offset(500), [2, 4], index=2),
+        nauert.PitchedQEvent(abjad.Offset(1250), [5], ["bar"], index=3),
+        nauert.TerminalQEvent(abjad.Offset(2000)),
+    ]
+    for sequence in (
+        nauert.QEventSequence(q_events),
+        nauert.ColumnarQEventSequence(q_events),
+    ):
+        view = sequence.index_window(2)
+        assert view.sequence == (
+            nauert.PitchedQEvent(abjad.Offset(0), [2, 4], index=2),
+            nauert.PitchedQEvent(abjad.Offset(750), [5], ["bar"], index=3),
+            nauert.TerminalQEvent(abjad.Offset(1500)),
+        )
+        view = sequence.index_window(-5, -3)
+        assert view.sequence == (
+            nauert.PitchedQEvent(abjad.Offset(0), [0], ["foo"], index=0),
+            nauert.SilentQEvent(abjad.Offset(250), index=1),
+            nauert.TerminalQEvent(abjad.Offset(500)),
+        )
+        assert view.index_window(1).sequence == (
+            nauert.SilentQEvent(abjad.Offset(0), index=1),
+            nauert.TerminalQEvent(abjad.Offset(250)),
+        )
+
+
+def test_QEventSequence_index_window_02():
+    """
+    Rejects empty and reversed ranges, and ranges of q-events taking no time.
+    """
+    durations = [1000, 0.0, 1000]
+    sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    with pytest.raises(ValueError):
+        sequence.index_window(2, 2)
+    with pytest.raises(ValueError):
+        sequence.index_window(1, 2)
+    with pytest.raises(ValueError):
+        sequence.index_window(0, 4)
+    with pytest.raises(ValueError):
+        sequence.index_window(2, 1)
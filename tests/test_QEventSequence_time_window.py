@@ -0,0 +1,102 @@
+import array
+import copy
+import pickle
+
+import abjad
+import pytest
+
+import benchmarks
+import nauert
+
+
+def make_expected(q_event_sequence, start, stop):
+    q_events = q_event_sequence[:-1]
+    sounding = max([_.offset for _ in q_events if _.offset <= start], default=None)
+    window = []
+    for q_event in q_events:
+        if stop <= q_event.offset:
+            break
+        if q_event.offset < start and q_event.offset != sounding:
+            continue
+        q_event = copy.copy(q_event)
+        q_event._offset = abjad.Offset(max(q_event.offset - start, 0))
+        window.append(q_event)
+    stop = min(stop, q_event_sequence[-1].offset)
+    window.append(nauert.TerminalQEvent(abjad.Offset(stop - start)))
+    return nauert.QEventSequence(window)
+
+
+@pytest.mark.parametrize(
+    "window", [(0, 10000), (1200, 3000), (1000, 2000), (3500, 3600), (4000, 9999)]
+)
+def test_QEventSequence_time_window_01(window):
+    """
+    Views q-events of q-event sequences and columnar q-event sequences,
+    continuing the q-event sounding at the start of the window.
+    """
+    durations = [1000, -500, 1250, -500, 750, 600, 400]
+    sequences = [
+        nauert.QEventSequence.from_millisecond_durations(durations),
+        nauert.ColumnarQEventSequence.from_millisecond_durations(durations),
+        nauert.ColumnarQEventSequence.from_millisecond_offsets(
+            array.array("d", [0, 1000, 1500, 2750, 3250, 4000, 4600, 5000]),
+            [0, None, 0, None, 0, 0, 0],
+        ),
+    ]
+    expected = make_expected(sequences[0], *window)
+    for sequence in sequences:
+        view = sequence.time_window(*window)
+        assert view.sequence == expected.sequence
+        assert abjad.lilypond(nauert.quantize(view)) == abjad.lilypond(
+            nauert.quantize(expected)
+        )
+
+
+def test_QEventSequence_time_window_02():
+    """
+    Shares the storage of the q-event sequence, views views, and pickles.
+    """
+    q_event_sequence = benchmarks.JitterGenerator(seed=4)(64, 2)
+    view = q_event_sequence.time_window(2000, 20000)
+    assert not isinstance(view._offsets, tuple)
+    assert len(view) < len(q_event_sequence)
+    nested = view.time_window(3000, 8000)
+    assert nested.sequence == q_event_sequence.time_window(5000, 10000).sequence
+    assert pickle.loads(pickle.dumps(nested)).sequence == nested.sequence
+
+
+def test_QEventSequence_time_window_03():
+    """
+    Rejects empty and reversed windows.
+    """
+    sequence = nauert.QEventSequence.from_millisecond_durations([-1000, 1000])
+    with pytest.raises(ValueError):
+        sequence.time_window(2000, 3000)
+    with pytest.raises(ValueError):
+        sequence.time_window(500, 500)
+    with pytest.raises(ValueError):
+        sequence.time_window(1500, 500)
+    with pytest.raises(ValueError):
+        sequence.time_window(-500, 500)
+
+
+def test_QEventSequence_time_window_04():
+    """
+    Snaps float bounds like float offsets, for q-event sequences and float
+    arrays of columnar q-event sequences.
+    """
+    pairs = [(1000, 0), (500, None), (1250, 2), (750, 4)]
+    sequence = nauert.QEventSequence.from_millisecond_pitch_pairs(pairs)
+    offsets = [_.offset for _ in sequence.time_window(1200.1, 3000)]
+    assert offsets == [
+        0,
+        abjad.Offset(2999, 10),
+        abjad.Offset(15499, 10),
+        abjad.Offset(17999, 10),
+    ]
+    offsets = array.array("d", [0, 0.5, 1.25, 2.5])
+    sequence = nauert.ColumnarQEventSequence.from_millisecond_offsets(
+        offsets, [0, None, 1]
+    )
+    offsets = [_.offset for _ in sequence.time_window(0.2, 2.0)]
+    assert offsets == [0, abjad.Offset(3, 10), abjad.Offset(21, 20), abjad.Offset(9, 5)]
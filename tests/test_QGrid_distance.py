@@ -49,3 +49,31 @@ def test_QGrid_distance_01():
     q_grid.fit_q_events(q_events)
 
     assert q_grid.distance == abjad.Offset(1, 35)
+
+
+def test_QGrid_distance_02():
+    """
+    Distance agrees with leaf offsets under unequal, nested subdivisions.
+    """
+
+    q_grid = nauert.QGrid()
+    proxies = [
+        nauert.QEventProxy(
+            nauert.SilentQEvent(abjad.Offset(_), [i]), abjad.Offset(0), abjad.Offset(1)
+        )
+        for i, _ in enumerate([0, abjad.Offset(1, 7), abjad.Offset(2, 3)])
+    ]
+    q_grid.fit_q_events(proxies)
+    q_events = q_grid.subdivide_leaves([(0, (2, 3))])
+    q_grid.fit_q_events(q_events)
+    q_events = q_grid.subdivide_leaves([(0, (1, 2))])
+    q_grid.fit_q_events(q_events)
+    assert q_grid.rtm_format == "(1 ((2 (1 2)) 3))"
+    assert q_grid.offsets == (
+        abjad.Offset(0),
+        abjad.Offset(2, 15),
+        abjad.Offset(2, 5),
+        abjad.Offset(1),
+    )
+    assert q_grid.distance == abjad.Duration(29, 315)
+    assert len(q_grid.leaves) == 4
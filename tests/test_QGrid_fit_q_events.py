@@ -1,4 +1,5 @@
 import abjad
+import pytest
 
 import nauert
 
@@ -31,3 +32,12 @@ def test_QGrid_fit_q_events_01():
     assert q_grid.leaves[0].q_event_proxies == [a, b]
     assert q_grid.leaves[1].q_event_proxies == [c, d, e]
     assert q_grid.leaves[2].q_event_proxies == [g, f]
+
+
+def test_QGrid_fit_q_events_02():
+    """
+    Raises on q-events which are not q-event proxies.
+    """
+    q_grid = nauert.QGrid()
+    with pytest.raises(TypeError):
+        q_grid.fit_q_events([nauert.SilentQEvent(abjad.Offset(0))])
@@ -0,0 +1,214 @@
+import abjad
+
+import nauert
+
+
+class CountingJobHandler(nauert.SerialJobHandler):
+
+    __slots__ = ("jobs",)
+
+    def __call__(self, jobs):
+        self.jobs = list(jobs)
+        return super().__call__(jobs)
+
+
+def make_q_event_sequence():
+    pairs = []
+    for i in range(3):
+        pairs.extend(
+            [
+                (500, [i]),
+                (500, [i + 1]),
+                (333, [i + 2]),
+                (333, None),
+                (334, [i + 3]),
+                (1000, [i + 4]),
+                (1000, [i + 5]),
+            ]
+        )
+    return nauert.QEventSequence.from_millisecond_pitch_pairs(pairs)
+
+
+def test_QTarget___call___01():
+    """
+    Equivalent beats are quantized once.
+    """
+
+    q_event_sequence = make_q_event_sequence()
+    job_handler = CountingJobHandler()
+    result = nauert.quantize(q_event_sequence, job_handler=job_handler)
+    assert len(job_handler.jobs) == 4
+    staff = abjad.Staff([result])
+    score = abjad.Score([staff])
+    assert abjad.lilypond(score) == abjad.string.normalize(r"""
+        \new Score
+        <<
+            \new Staff
+            {
+                \new Voice
+                {
+                    {
+                        \tempo 4=60
+                        \time 4/4
+                        c'8
+                        cs'8
+                        \tuplet 3/2
+                        {
+                            d'8
+                            r8
+                            ef'8
+                        }
+                        e'4
+                        f'4
+                    }
+                    {
+                        cs'8
+                        d'8
+                        \tuplet 3/2
+                        {
+                            ef'8
+                            r8
+                            e'8
+                        }
+                        f'4
+                        fs'4
+                    }
+                    {
+                        d'8
+                        ef'8
+                        \tuplet 3/2
+                        {
+                            e'8
+                            r8
+                            f'8
+                        }
+                        fs'4
+                        g'4
+                    }
+                }
+            }
+        >>
+        """), print(abjad.lilypond(score))
+
+
+def test_QTarget___call___02():
+    """
+    Each beat's selected QGrid is its own, and holds that beat's QEvents.
+    """
+
+    q_event_sequence = make_q_event_sequence()
+    q_target = nauert.MeasurewiseQSchema()(q_event_sequence.duration_in_ms)
+    q_target(q_event_sequence)
+    q_grids = [beat.q_grid for beat in q_target.beats]
+    assert len(set(id(_) for _ in q_grids)) == len(q_grids)
+    for beat in q_target.beats:
+        q_events = [
+            proxy.q_event
+            for leaf in beat.q_grid.leaves
+            for proxy in leaf.q_event_proxies
+        ]
+        assert all(_ in beat.q_events for _ in q_events)
+
+
+def test_QTarget___call___03():
+    """
+    Records timings and item counts of each stage and beat.
+    """
+    q_event_sequence = make_q_event_sequence()
+    recorder = nauert.TimingRecorder()
+    job_handler = CountingJobHandler()
+    nauert.quantize(q_event_sequence, job_handler=job_handler, recorder=recorder)
+
+    stages = [_[0] for _ in recorder.stage_records]
+    assert stages == [
+        "assign_q_events",
+        "make_jobs",
+        "handle_jobs",
+        "heuristic",
+        "rebind_duplicates",
+        "shift_downbeats",
+        "regroup",
+        "notate",
+        "handle_orphans",
+    ]
+    counts = {_[0]: _[3] for _ in recorder.stage_records}
+    assert counts["assign_q_events"] == len(q_event_sequence)
+    assert counts["make_jobs"] == 12
+    assert counts["handle_jobs"] == len(job_handler.jobs)
+    assert counts["rebind_duplicates"] == 12 - len(job_handler.jobs)
+    previous_stop = 0.0
+    for stage, start, stop, count in recorder.stage_records:
+        assert previous_stop <= start <= stop
+        previous_stop = stop
+    beat_records = [_ for _ in recorder.beat_records if _[0] == "make_jobs"]
+    assert [_[1] for _ in beat_records] == list(range(12))
+    assert sum(_[4] for _ in beat_records) == len(q_event_sequence)
+
+
+def test_QTarget___call___04():
+    """
+    Records search statistics of each dispatched job.
+    """
+    q_event_sequence = make_q_event_sequence()
+    recorder = nauert.TimingRecorder()
+    job_handler = CountingJobHandler()
+    nauert.quantize(q_event_sequence, job_handler=job_handler, recorder=recorder)
+
+    job_ids = [_[0] for _ in recorder.job_statistics]
+    assert job_ids == [_.job_id for _ in job_handler.jobs]
+    statistics = recorder.get_search_statistics()
+    assert statistics.job_count == len(job_handler.jobs)
+    assert statistics.candidate_count == sum(len(_.q_grids) for _ in job_handler.jobs)
+    assert statistics.max_depth == max(_[1].max_depth for _ in recorder.job_statistics)
+
+
+def test_QTarget___call___05():
+    """
+    Assigns q-events to beats in one pass, making q-event proxies equal to
+    those made one by one; q-events on beat boundaries start the next beat.
+    """
+    durations = [1000, 3750 / 7, 250, -500, 1000, 1234, 766, 500]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(
+        durations, resolution=None
+    )
+    tempo = abjad.MetronomeMark(abjad.Duration(1, 4), 56)
+    q_schema = nauert.MeasurewiseQSchema(tempo=tempo)
+    q_target = q_schema(q_event_sequence.duration_in_ms)
+    beats = q_target.beats
+    assert beats is q_target.beats
+    jobs, _ = q_target._make_jobs(q_event_sequence, nauert.NullRecorder())
+    assert sum(len(_.q_events) for _ in beats) == len(q_event_sequence)
+    for i, beat in enumerate(beats):
+        start = beat.offset_in_ms
+        stop = start + beat.tempo.duration_to_milliseconds(beat.beatspan)
+        for q_event in beat.q_events:
+            assert start <= q_event.offset < stop or q_event is q_event_sequence[-1]
+        job = beat(i)
+        if job is None:
+            continue
+        proxies = [nauert.QEventProxy(_, start, stop) for _ in beat.q_events]
+        assert job.q_event_proxies == tuple(proxies)
+
+
+def test_QTarget___call___06():
+    """
+    Gives jobs skipped as duplicates the statistics of the equivalent job
+    searched instead.
+    """
+    q_event_sequence = make_q_event_sequence()
+    q_target = nauert.MeasurewiseQSchema()(q_event_sequence.duration_in_ms)
+    recorder = nauert.NullRecorder()
+    jobs, duplicate_jobs = q_target._make_jobs(q_event_sequence, recorder)
+    assert duplicate_jobs
+    jobs = nauert.SerialJobHandler()(jobs)
+    q_target._notate_jobs(
+        jobs,
+        duplicate_jobs,
+        grace_handler=nauert.ConcatenatingGraceHandler(),
+        heuristic=nauert.DistanceHeuristic(),
+        attack_point_optimizer=nauert.NaiveAttackPointOptimizer(),
+        recorder=recorder,
+    )
+    for job in jobs:
+        for duplicate_job in duplicate_jobs.get(job.job_id, ()):
+            assert duplicate_job.statistics is job.statistics
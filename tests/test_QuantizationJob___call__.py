@@ -82,3 +82,62 @@ def test_QuantizationJob___call___01():
         "(1 ((1 ((1 (1 1)) (1 (1 1)))) (1 (1 1 1))))",
         "(1 ((1 ((1 (1 1)) (1 (1 1)))) (1 ((1 (1 1)) (1 (1 1))))))",
     ], rtm_formats
+
+
+def test_QuantizationJob___call___02():
+    """
+    Records search statistics.
+    """
+    definition = {2: {2: {2: None}, 3: None}, 5: None}
+    search_tree = nauert.UnweightedSearchTree(definition)
+    q_event_proxies = [
+        nauert.QEventProxy(
+            nauert.SilentQEvent(abjad.Offset(offset), index=i),
+            abjad.Offset(0),
+            abjad.Offset(1),
+        )
+        for i, offset in enumerate([0, abjad.Offset(1, 8), abjad.Offset(3, 5), 1])
+    ]
+    job = nauert.QuantizationJob(1, search_tree, q_event_proxies)
+    assert job.statistics is None
+
+    job()
+    statistics = job.statistics
+    depths = []
+    for q_grid in job.q_grids:
+        depth, nesting = 0, 0
+        for character in q_grid.rtm_format:
+            nesting += {"(": 1, ")": -1}.get(character, 0)
+            depth = max(depth, nesting)
+        depths.append(depth // 2)
+    assert statistics.candidate_count == len(job.q_grids)
+    assert statistics.grid_count == len(job.q_grids) - 1
+    assert statistics.job_count == 1
+    assert statistics.max_depth == max(depths) == 3
+    assert statistics.refit_count == 24
+    assert 0 < statistics.elapsed_time
+
+
+def test_QuantizationJob___call___03():
+    """
+    Searches through the public call of the search tree, so that search trees
+    overriding it are honored.
+    """
+
+    class FlatSearchTree(nauert.UnweightedSearchTree):
+
+        __slots__ = ()
+
+        def __call__(self, q_grid):
+            if isinstance(q_grid.root_node, nauert.QGridContainer):
+                return []
+            return super().__call__(q_grid)
+
+    search_tree = FlatSearchTree({2: {2: None}, 3: None})
+    q_event = nauert.PitchedQEvent(abjad.Offset(250), [0])
+    q_event_proxies = [nauert.QEventProxy(q_event, abjad.Offset(1, 4))]
+    job = nauert.QuantizationJob(1, search_tree, q_event_proxies)
+    job()
+    assert [_.rtm_format for _ in job.q_grids] == ["1", "(1 (1 1 1))", "(1 (1 1))"]
+    assert job.statistics.grid_count == 2
+    assert job.statistics.refit_count == 2
@@ -1,4 +1,5 @@
 import abjad
+import pytest
 
 import nauert
 
@@ -68,3 +69,20 @@ def test_QuantizationJob___init___01():
     assert job.job_id == job_id
     assert job.search_tree == search_tree
     assert job.q_event_proxies == tuple(q_event_proxies)
+
+
+def test_QuantizationJob___init___02():
+    """
+    Rejects search trees, q-event proxies and q-grids of the wrong type with
+    type errors, whether or not assertions are enabled.
+    """
+    with pytest.raises(TypeError):
+        nauert.QuantizationJob(1, {2: None})
+    with pytest.raises(TypeError):
+        nauert.QuantizationJob(1, None, [nauert.SilentQEvent(abjad.Offset(0))])
+    with pytest.raises(TypeError):
+        nauert.QuantizationJob(1, None, [], [nauert.QGridLeaf()])
+    with pytest.raises(TypeError):
+        nauert.QGridLeaf(1)
+    with pytest.raises(TypeError):
+        nauert.QGridLeaf(abjad.Duration(1), [nauert.SilentQEvent(abjad.Offset(0))])
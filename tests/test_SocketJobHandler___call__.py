@@ -0,0 +1,195 @@
+import socket
+import subprocess
+import sys
+import threading
+
+import abjad
+import pytest
+
+import nauert
+
+
+class Job(nauert.QuantizationJob):
+
+    __slots__ = ()
+
+    def __call__(self):
+        raise ValueError("no")
+
+
+def _make_jobs():
+    definition = {2: {2: None}, 3: None, 5: None}
+    search_tree = nauert.UnweightedSearchTree(definition)
+    jobs = []
+    for job_id, count in enumerate([1, 3, 2, 4], start=1):
+        q_event_proxies = [
+            nauert.QEventProxy(
+                nauert.SilentQEvent(abjad.Offset(i, count + 1), index=i),
+                abjad.Offset(0),
+                abjad.Offset(1),
+            )
+            for i in range(count)
+        ]
+        jobs.append(nauert.QuantizationJob(job_id, search_tree, q_event_proxies))
+    return jobs
+
+
+def _get_rtms(jobs):
+    return [[_.rtm_format for _ in job.q_grids] for job in jobs]
+
+
+def _start_worker(**keywords):
+    worker = nauert.SocketJobHandlerWorker(**keywords)
+    thread = threading.Thread(target=worker.serve_forever, daemon=True)
+    thread.start()
+    return worker
+
+
+def _stop_worker(worker):
+    worker.shutdown()
+    worker.server_close()
+
+
+def _start_bad_server(respond):
+    """
+    Accepts connections and either closes them or never responds.
+    """
+    server = socket.create_server(("127.0.0.1", 0))
+    connections = []
+
+    def serve():
+        while True:
+            try:
+                connection, _ = server.accept()
+            except OSError:
+                return
+            if respond == "close":
+                connection.recv(1)
+                connection.close()
+            else:
+                connections.append(connection)
+
+    threading.Thread(target=serve, daemon=True).start()
+    return server
+
+
+def test_SocketJobHandler___call___01():
+    """
+    Processes jobs like the serial job handler, ordered by job ID.
+    """
+    workers = [_start_worker(), _start_worker()]
+    job_handler = nauert.SocketJobHandler([_.address for _ in workers])
+    try:
+        result = job_handler(list(reversed(_make_jobs())))
+    finally:
+        for worker in workers:
+            _stop_worker(worker)
+    expected = nauert.SerialJobHandler()(_make_jobs())
+
+    assert [_.job_id for _ in result] == [1, 2, 3, 4]
+    assert _get_rtms(result) == _get_rtms(expected)
+
+
+def test_SocketJobHandler___call___02():
+    """
+    Retries jobs lost to disconnecting and silent workers.
+    """
+    closing_server = _start_bad_server("close")
+    silent_server = _start_bad_server("silent")
+    worker = _start_worker(heartbeat_interval=0.05)
+    addresses = [
+        closing_server.getsockname(),
+        silent_server.getsockname(),
+        worker.address,
+    ]
+    job_handler = nauert.SocketJobHandler(addresses, heartbeat_timeout=0.5)
+    try:
+        result = job_handler(_make_jobs())
+    finally:
+        _stop_worker(worker)
+        closing_server.close()
+        silent_server.close()
+    expected = nauert.SerialJobHandler()(_make_jobs())
+
+    assert _get_rtms(result) == _get_rtms(expected)
+
+
+def test_SocketJobHandler___call___03():
+    """
+    Raises when no workers are left, or a job fails on a worker.
+    """
+    closing_server = _start_bad_server("close")
+    job_handler = nauert.SocketJobHandler([closing_server.getsockname()])
+    try:
+        with pytest.raises(ConnectionError):
+            job_handler(_make_jobs())
+    finally:
+        closing_server.close()
+
+    worker = _start_worker()
+    job_handler = nauert.SocketJobHandler([worker.address])
+    try:
+        with pytest.raises(RuntimeError):
+            job_handler([Job(1)])
+    finally:
+        _stop_worker(worker)
+
+
+def test_SocketJobHandler___call___04():
+    """
+    Dispatches jobs to a worker started with the worker entry point.
+    """
+    code = "import nauert; nauert.SocketJobHandlerWorker.main()"
+    process = subprocess.Popen(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, text=True
+    )
+    try:
+        host, port = process.stdout.readline().strip().rsplit(":", 1)
+        job_handler = nauert.SocketJobHandler([(host, int(port))])
+        result = job_handler(_make_jobs())
+    finally:
+        process.terminate()
+        process.wait()
+        process.stdout.close()
+    expected = nauert.SerialJobHandler()(_make_jobs())
+
+    assert _get_rtms(result) == _get_rtms(expected)
+
+
+def test_SocketJobHandler___call___05():
+    """
+    Workers refuse non-loopback addresses without allow_remote and a secret.
+    """
+    with pytest.raises(ValueError):
+        nauert.SocketJobHandlerWorker(("0.0.0.0", 0))
+    with pytest.raises(ValueError):
+        nauert.SocketJobHandlerWorker(("0.0.0.0", 0), allow_remote=True)
+    with pytest.raises(ValueError):
+        nauert.SocketJobHandlerWorker(("0.0.0.0", 0), secret=b"key")
+    worker = nauert.SocketJobHandlerWorker(
+        ("0.0.0.0", 0), secret=b"key", allow_remote=True
+    )
+    worker.server_close()
+    with pytest.raises(SystemExit):
+        nauert.SocketJobHandlerWorker.main(["--host", "0.0.0.0"])
+
+
+def test_SocketJobHandler___call___06():
+    """
+    Workers with a secret only run jobs sent with the same secret.
+    """
+    worker = _start_worker(secret=b"key")
+    try:
+        job_handler = nauert.SocketJobHandler([worker.address], secret=b"key")
+        result = job_handler(_make_jobs())
+        for secret in (None, b"other"):
+            job_handler = nauert.SocketJobHandler(
+                [worker.address], heartbeat_timeout=0.5, secret=secret
+            )
+            with pytest.raises(ConnectionError):
+                job_handler(_make_jobs())
+    finally:
+        _stop_worker(worker)
+    expected = nauert.SerialJobHandler()(_make_jobs())
+
+    assert _get_rtms(result) == _get_rtms(expected)
@@ -0,0 +1,92 @@
+import abjad
+import pytest
+
+import benchmarks
+import nauert
+
+search_tree = nauert.UnweightedSearchTree({2: {2: {2: None}}, 3: {2: None}})
+
+
+def stream(q_event_sequence, chunk_size, **keywords):
+    quantizer = nauert.StreamingQuantizer(**keywords)
+    voice = abjad.Voice()
+    counts = []
+    for i in range(0, len(q_event_sequence), chunk_size):
+        components = quantizer.feed(q_event_sequence[i : i + chunk_size])
+        counts.append(len(components))
+        voice.extend(components)
+    components = quantizer.close()
+    voice.extend(components)
+    assert quantizer.is_closed
+    return voice, counts
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+@pytest.mark.parametrize(
+    "keywords",
+    [
+        {},
+        {"attack_point_optimizer": nauert.MeasurewiseAttackPointOptimizer()},
+        {"grace_handler": nauert.CollapsingGraceHandler()},
+    ],
+)
+def test_StreamingQuantizer_feed_01(chunk_size, keywords):
+    """
+    Streams measurewise notation equal to batch notation.
+    """
+    durations = [1000, -500, 1250, -500, 750, 5000, 300, -4000, 990, 10]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    q_schema = nauert.MeasurewiseQSchema(search_tree=search_tree)
+    voice, counts = stream(q_event_sequence, chunk_size, q_schema=q_schema, **keywords)
+    q_schema = nauert.MeasurewiseQSchema(search_tree=search_tree)
+    result = nauert.quantize(q_event_sequence, q_schema=q_schema, **keywords)
+    assert abjad.lilypond(voice) == abjad.lilypond(result)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 100])
+def test_StreamingQuantizer_feed_02(chunk_size):
+    """
+    Streams beatwise notation equal to batch notation, tie-free groups at a
+    time.
+    """
+    q_event_sequence = benchmarks.JitterGenerator(seed=2, rest_probability=0.2)(16, 2)
+    q_schema = nauert.BeatwiseQSchema(search_tree=search_tree)
+    voice, counts = stream(q_event_sequence, chunk_size, q_schema=q_schema)
+    q_schema = nauert.BeatwiseQSchema(search_tree=search_tree)
+    result = nauert.quantize(q_event_sequence, q_schema=q_schema)
+    assert abjad.lilypond(voice) == abjad.lilypond(result)
+    if chunk_size == 1:
+        assert any(counts)
+
+
+def test_StreamingQuantizer_feed_03():
+    """
+    Returns each measure once the following measure has been notated, which
+    requires a QEvent after the first beat of the following measure.
+    """
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations([1000] * 12)
+    quantizer = nauert.StreamingQuantizer()
+    assert quantizer.feed(q_event_sequence[:9]) == []
+    components = quantizer.feed(q_event_sequence[9:10])
+    assert len(components) == 1
+    assert abjad.get.duration(components[0]) == 1
+    quantizer.feed(q_event_sequence[10:])
+    assert len(quantizer.close()) == 2
+
+
+def test_StreamingQuantizer_feed_04():
+    """
+    Rejects QEvents out of order, closing without a TerminalQEvent and feeding
+    after closing.
+    """
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations([1000, 1000])
+    quantizer = nauert.StreamingQuantizer()
+    quantizer.feed(q_event_sequence[:2])
+    with pytest.raises(AssertionError):
+        quantizer.feed(q_event_sequence[:1])
+    with pytest.raises(AssertionError):
+        quantizer.close()
+    quantizer.feed(q_event_sequence[2:])
+    assert len(quantizer.close()) == 1
+    with pytest.raises(AssertionError):
+        quantizer.feed(q_event_sequence[2:])
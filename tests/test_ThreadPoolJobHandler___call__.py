@@ -0,0 +1,68 @@
+import abjad
+
+import nauert
+
+
+def _make_jobs():
+    definition = {2: {2: {2: None}, 3: None}, 5: None}
+    search_tree = nauert.UnweightedSearchTree(definition)
+    jobs = []
+    for job_id, count in enumerate([1, 3, 5, 2], start=1):
+        q_event_proxies = [
+            nauert.QEventProxy(
+                nauert.SilentQEvent(abjad.Offset(i, count + 1), index=i),
+                abjad.Offset(0),
+                abjad.Offset(1),
+            )
+            for i in range(count)
+        ]
+        job = nauert.QuantizationJob(job_id, search_tree, q_event_proxies)
+        jobs.append(job)
+    return jobs
+
+
+def _get_rtms(jobs):
+    return [[_.rtm_format for _ in job.q_grids] for job in jobs]
+
+
+def test_ThreadPoolJobHandler___call___01():
+    """
+    Processes jobs in place, in the order given.
+    """
+    serial_jobs = nauert.SerialJobHandler()(_make_jobs())
+    jobs = _make_jobs()
+    result = nauert.ThreadPoolJobHandler(max_workers=2)(jobs)
+
+    assert result is jobs
+    assert _get_rtms(result) == _get_rtms(serial_jobs)
+
+
+def test_ThreadPoolJobHandler___call___02(monkeypatch):
+    """
+    Runs jobs on threads when the global interpreter lock is disabled.
+    """
+    monkeypatch.setattr(
+        nauert.ThreadPoolJobHandler, "_is_gil_enabled", staticmethod(lambda: False)
+    )
+    serial_jobs = nauert.SerialJobHandler()(_make_jobs())
+    jobs = _make_jobs()
+    result = nauert.ThreadPoolJobHandler(max_workers=3)(jobs)
+
+    assert result is jobs
+    assert _get_rtms(result) == _get_rtms(serial_jobs)
+
+
+def test_ThreadPoolJobHandler___call___03(monkeypatch):
+    """
+    Quantizes identically to the serial job handler.
+    """
+    monkeypatch.setattr(
+        nauert.ThreadPoolJobHandler, "_is_gil_enabled", staticmethod(lambda: False)
+    )
+    durations = [170, 250, 330, 500, 120, 90, 1000, 540]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    job_handler = nauert.ThreadPoolJobHandler()
+    result = nauert.quantize(q_event_sequence, job_handler=job_handler)
+    expected = nauert.quantize(q_event_sequence)
+
+    assert abjad.lilypond(result) == abjad.lilypond(expected)
@@ -0,0 +1,34 @@
+import pytest
+
+import nauert
+
+
+def test_TimingRecorder_stage_01():
+    """
+    Records a stage which raises, up to the exception.
+    """
+    recorder = nauert.TimingRecorder()
+    with pytest.raises(ValueError):
+        with recorder.stage("heuristic", 3):
+            raise ValueError
+    assert [(_[0], _[3]) for _ in recorder.stage_records] == [("heuristic", 3)]
+
+
+def test_TimingRecorder_stage_02():
+    """
+    Records every beat during search, heuristic selection and notation, as
+    well as during job making.
+    """
+    durations = [1000, 500, 500, 250, 250, 250, 250, 1000]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    recorder = nauert.TimingRecorder()
+    nauert.quantize(q_event_sequence, recorder=recorder)
+
+    beats = {}
+    for stage, index, start, stop, count in recorder.beat_records:
+        assert start <= stop
+        beats.setdefault(stage, []).append(index)
+    assert list(beats) == ["make_jobs", "handle_jobs", "heuristic", "notate"]
+    for stage in ("make_jobs", "heuristic", "notate"):
+        assert beats[stage] == list(range(4))
+    assert sorted(beats["handle_jobs"]) == list(range(4))
@@ -0,0 +1,105 @@
+import abjad
+
+import nauert
+
+
+def _make_q_target_beats(definition):
+    search_tree = nauert.UnweightedSearchTree(definition)
+    q_event_a = nauert.PitchedQEvent(abjad.Offset(0), [0])
+    q_event_b = nauert.PitchedQEvent(abjad.Offset(900), [1])
+    q_event_c = nauert.PitchedQEvent(abjad.Offset(1000), [2])
+    q_target_beat_one = nauert.QTargetBeat(
+        beatspan=abjad.Duration(1, 4),
+        offset_in_ms=abjad.Offset(0),
+        search_tree=search_tree,
+    )
+    q_target_beat_one.q_events.extend([q_event_a, q_event_b])
+    q_target_beat_two = nauert.QTargetBeat(
+        beatspan=abjad.Duration(1, 4),
+        offset_in_ms=abjad.Offset(1000),
+        search_tree=search_tree,
+    )
+    q_target_beat_two.q_events.append(q_event_c)
+    q_target_beats = (q_target_beat_one, q_target_beat_two)
+    for i, q_target_beat in enumerate(q_target_beats):
+        job = q_target_beat(i)
+        job()
+        q_target_beat._q_grids = job.q_grids
+    return q_target_beats
+
+
+def test_ViterbiHeuristic___call___01():
+    heuristic = nauert.ViterbiHeuristic()
+    q_event_a = nauert.PitchedQEvent(abjad.Offset(250), [0, 1])
+    q_event_b = nauert.SilentQEvent(abjad.Offset(500))
+    q_event_c = nauert.PitchedQEvent(abjad.Offset(750), [3, 7])
+    proxy_a = nauert.QEventProxy(q_event_a, abjad.Offset(0.25))
+    proxy_b = nauert.QEventProxy(q_event_b, abjad.Offset(0.5))
+    proxy_c = nauert.QEventProxy(q_event_c, abjad.Offset(0.75))
+    definition = {2: {2: None}, 3: None, 5: None}
+    search_tree = nauert.UnweightedSearchTree(definition)
+    job = nauert.QuantizationJob(1, search_tree, [proxy_a, proxy_b, proxy_c])
+    job()
+    q_target_beat = nauert.QTargetBeat()
+    q_target_beat._q_grids = job.q_grids
+    q_target_beats = heuristic((q_target_beat,))
+    q_target_beat = q_target_beats[0]
+    q_grid = q_target_beat.q_grid
+    assert q_grid.distance == 0
+    rtm = q_grid.rtm_format
+    assert rtm == "(1 ((1 (1 1)) (1 (1 1))))"
+
+
+def test_ViterbiHeuristic___call___02():
+    """
+    Distance heuristic snaps the late event of the first beat onto the
+    attacked downbeat of the second beat.
+    """
+
+    q_target_beats = _make_q_target_beats({5: None})
+    q_target_beats = nauert.DistanceHeuristic()(q_target_beats)
+    assert q_target_beats[0].q_grid.rtm_format == "1"
+    assert q_target_beats[1].q_grid.rtm_format == "1"
+
+
+def test_ViterbiHeuristic___call___03():
+    """
+    Viterbi heuristic avoids the collision on the second beat's downbeat.
+    """
+
+    q_target_beats = _make_q_target_beats({5: None})
+    q_target_beats = nauert.ViterbiHeuristic()(q_target_beats)
+    assert q_target_beats[0].q_grid.rtm_format == "(1 (1 1 1 1 1))"
+    assert q_target_beats[1].q_grid.rtm_format == "1"
+
+
+def test_ViterbiHeuristic___call___04():
+    """
+    Without a collision penalty, Viterbi heuristic prefers fewer leaves.
+    """
+
+    heuristic = nauert.ViterbiHeuristic(collision_weight=0)
+    q_target_beats = _make_q_target_beats({5: None})
+    q_target_beats = heuristic(q_target_beats)
+    assert q_target_beats[0].q_grid.rtm_format == "1"
+    assert q_target_beats[1].q_grid.rtm_format == "1"
+
+
+def test_ViterbiHeuristic___call___05():
+    """
+    Beats without q-grids receive an empty q-grid.
+    """
+
+    q_target_beats = (nauert.QTargetBeat(), nauert.QTargetBeat())
+    q_target_beats = nauert.ViterbiHeuristic()(q_target_beats)
+    assert all(_.q_grid.rtm_format == "1" for _ in q_target_beats)
+    assert all(_.q_grid.distance is None for _ in q_target_beats)
+
+
+def test_ViterbiHeuristic___call___06():
+    """
+    Viterbi heuristic returns no beats unchanged, like other heuristics.
+    """
+
+    assert nauert.ViterbiHeuristic()._process(()) == ()
+    assert nauert.DistanceHeuristic()._process(()) == ()
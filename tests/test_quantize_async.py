@@ -0,0 +1,57 @@
+import asyncio
+
+import abjad
+
+import nauert
+
+
+def test_quantize_async_01():
+    """
+    Quantizes identically to ``quantize``.
+    """
+    durations = [170, 250, 330, 500, 120, 90, 1000, 540]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    coroutine = nauert.quantize_async(q_event_sequence)
+    result = asyncio.run(coroutine)
+    expected = nauert.quantize(q_event_sequence)
+
+    assert abjad.lilypond(result) == abjad.lilypond(expected)
+
+
+def test_quantize_async_02():
+    """
+    Keeps the event loop free while quantizing.
+    """
+    durations = [170, 250, 330, 500, 120, 90, 1000, 540]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    ticks = []
+
+    async def tick():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.create_task(tick())
+        result = await nauert.quantize_async(q_event_sequence)
+        task.cancel()
+        return result
+
+    result = asyncio.run(main())
+    assert isinstance(result, abjad.Voice)
+    assert 1 < len(ticks)
+
+
+def test_quantize_async_03():
+    """
+    Records the same stages as ``quantize``.
+    """
+    durations = [170, 250, 330, 500, 120, 90, 1000, 540]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    recorder = nauert.TimingRecorder()
+    asyncio.run(nauert.quantize_async(q_event_sequence, recorder=recorder))
+    expected = nauert.TimingRecorder()
+    nauert.quantize(q_event_sequence, recorder=expected)
+
+    stages = [(_[0], _[3]) for _ in recorder.stage_records]
+    assert stages == [(_[0], _[3]) for _ in expected.stage_records]
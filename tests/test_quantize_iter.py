@@ -0,0 +1,118 @@
+import gc
+
+import abjad
+import pytest
+
+import benchmarks
+import nauert
+
+search_tree = nauert.UnweightedSearchTree({2: {2: {2: None}}, 3: {2: None}})
+
+
+def make_q_event_sequence():
+    durations = [1000, -500, 1250, -500, 750, 5000, 300, -4000, 990, 10]
+    return nauert.QEventSequence.from_millisecond_durations(durations)
+
+
+@pytest.mark.parametrize(
+    "keywords",
+    [
+        {},
+        {"attack_point_optimizer": nauert.MeasurewiseAttackPointOptimizer()},
+        {"grace_handler": nauert.CollapsingGraceHandler()},
+    ],
+)
+def test_quantize_iter_01(keywords):
+    """
+    Yields detached measures which together equal the result of quantize().
+    """
+    q_event_sequence = make_q_event_sequence()
+    q_schema = nauert.MeasurewiseQSchema(search_tree=search_tree)
+    components = list(
+        nauert.quantize_iter(q_event_sequence, q_schema=q_schema, **keywords)
+    )
+    for component in components:
+        assert type(component) is abjad.Container
+        assert abjad.get.parentage(component).parent is None
+    voice = abjad.Voice(components)
+    q_schema = nauert.MeasurewiseQSchema(search_tree=search_tree)
+    result = nauert.quantize(q_event_sequence, q_schema=q_schema, **keywords)
+    assert abjad.lilypond(voice) == abjad.lilypond(result)
+
+
+def test_quantize_iter_02():
+    """
+    Yields beatwise notation equal to the result of quantize().
+    """
+    q_event_sequence = benchmarks.JitterGenerator(seed=2, rest_probability=0.2)(16, 2)
+    q_schema = nauert.BeatwiseQSchema(search_tree=search_tree)
+    voice = abjad.Voice(list(nauert.quantize_iter(q_event_sequence, q_schema=q_schema)))
+    q_schema = nauert.BeatwiseQSchema(search_tree=search_tree)
+    result = nauert.quantize(q_event_sequence, q_schema=q_schema)
+    assert abjad.lilypond(voice) == abjad.lilypond(result)
+
+
+def test_quantize_iter_03():
+    """
+    Searches nothing when called, and searches, selects and notates measure
+    by measure while iterating.
+    """
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations([1000] * 12)
+    recorder = nauert.TimingRecorder()
+    iterator = nauert.quantize_iter(q_event_sequence, recorder=recorder)
+    assert recorder.stage_records == ()
+    next(iterator)
+    stages = [_[0] for _ in recorder.stage_records]
+    assert stages.count("handle_jobs") == 2
+    assert stages.count("regroup") == 2
+    assert stages.count("notate") == 2
+    assert len(list(iterator)) == 2
+    stages = [_[0] for _ in recorder.stage_records]
+    assert stages.count("handle_jobs") == 3
+    assert stages[-1] == "handle_orphans"
+
+
+def test_quantize_iter_04():
+    """
+    Keeps the q-events and q-grids of a bounded number of beats while
+    iterating, making each q-event of a columnar sequence only when its item
+    is searched.
+    """
+    durations = [250, -250, 500, 125, 375, -500] * 40
+    q_event_sequence = nauert.ColumnarQEventSequence.from_millisecond_durations(
+        durations
+    )
+    q_schema = nauert.MeasurewiseQSchema(search_tree=search_tree)
+    q_target = q_schema(q_event_sequence.duration_in_ms)
+    assert 64 < len(q_target.beats)
+    count = 0
+    for component in q_target.call_iter(q_event_sequence):
+        count += 1
+        # the leaves of components refer to their q-events, and q-grids to
+        # their parents: collect them once dropped
+        del component
+        gc.collect()
+        assert len(q_event_sequence._q_events) <= 24
+        beats = [_ for _ in q_target.beats if _.q_grids or _.q_events]
+        assert len(beats) <= 8
+    assert count == len(q_target.items)
+    assert not any(_.q_grids or _.q_events or _.q_grid for _ in q_target.beats)
+
+
+def test_quantize_iter_05():
+    """
+    Searches every beat when called with a heuristic selecting beats jointly.
+    """
+    q_event_sequence = benchmarks.JitterGenerator(seed=3, rest_probability=0.2)(8, 2)
+    q_schema = nauert.MeasurewiseQSchema(search_tree=search_tree)
+    heuristic = nauert.ViterbiHeuristic()
+    recorder = nauert.TimingRecorder()
+    iterator = nauert.quantize_iter(
+        q_event_sequence, q_schema=q_schema, heuristic=heuristic, recorder=recorder
+    )
+    stages = [_[0] for _ in recorder.stage_records]
+    assert "regroup" in stages and "notate" not in stages
+    voice = abjad.Voice(list(iterator))
+    q_schema = nauert.MeasurewiseQSchema(search_tree=search_tree)
+    result = nauert.quantize(q_event_sequence, q_schema=q_schema, heuristic=heuristic)
+    assert abjad.lilypond(voice) == abjad.lilypond(result)
@@ -0,0 +1,67 @@
+import time
+import tracemalloc
+
+import abjad
+import pytest
+
+import benchmarks
+import nauert
+
+search_tree = nauert.UnweightedSearchTree({2: {2: {2: None}}, 3: {2: None}})
+
+
+def get_counters(voice, recorder):
+    statistics = [_ for job_id, _ in recorder.job_statistics]
+    return {
+        "candidate_counts": [_.candidate_count for _ in statistics],
+        "grid_count": sum(_.grid_count for _ in statistics),
+        "job_count": len(statistics),
+        "leaf_count": len(abjad.select.leaves(voice)),
+        "refit_count": sum(_.refit_count for _ in statistics),
+    }
+
+
+def measure(q_event_sequence, trace_memory=False, **keywords):
+    # tracing memory slows quantization down: times of traced and untraced
+    # runs compare only with baselines measured the same way
+    recorder = nauert.TimingRecorder()
+    megabytes = None
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        voice = nauert.quantize(q_event_sequence, recorder=recorder, **keywords)
+        seconds = time.perf_counter() - start
+        if trace_memory:
+            megabytes = tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return voice, recorder, seconds, megabytes
+
+
+@pytest.mark.perf
+def test_quantize_performance_01(perf_baseline):
+    """
+    Quantizes 16 beats of a dense, seeded, human-like performance beatwise,
+    tracing memory.
+    """
+    q_event_sequence = benchmarks.JitterGenerator(seed=1)(beat_count=16, density=3)
+    q_schema = nauert.BeatwiseQSchema(search_tree=search_tree)
+    voice, recorder, seconds, megabytes = measure(
+        q_event_sequence, trace_memory=True, q_schema=q_schema
+    )
+    counters = get_counters(voice, recorder)
+    perf_baseline("quantize_jitter_16_beats_beatwise", counters, seconds, megabytes)
+
+
+@pytest.mark.perf
+def test_quantize_performance_02(perf_baseline):
+    """
+    Quantizes 32 beats of a seeded, human-like performance.
+    """
+    q_event_sequence = benchmarks.JitterGenerator(seed=0)(beat_count=32, density=2)
+    q_schema = nauert.MeasurewiseQSchema(search_tree=search_tree)
+    voice, recorder, seconds, _ = measure(q_event_sequence, q_schema=q_schema)
+    counters = get_counters(voice, recorder)
+    perf_baseline("quantize_jitter_32_beats", counters, seconds)
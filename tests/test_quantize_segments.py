@@ -0,0 +1,117 @@
+import pickle
+
+import abjad
+
+import nauert
+
+search_tree = nauert.UnweightedSearchTree({2: {2: {2: None}}, 3: {2: None}})
+
+
+def make_q_schema():
+    return nauert.MeasurewiseQSchema(
+        {
+            2: {"tempo": abjad.MetronomeMark(abjad.Duration(1, 4), 90)},
+            3: {"time_signature": abjad.TimeSignature((3, 4))},
+            5: {
+                "tempo": abjad.MetronomeMark(abjad.Duration(1, 4), 60),
+                "time_signature": abjad.TimeSignature((4, 4)),
+            },
+        },
+        search_tree=search_tree,
+    )
+
+
+def make_q_event_sequence():
+    durations = [1000, -500, 1250, -500, 750, 5000, 300, -4000, 990, 10] * 3
+    return nauert.QEventSequence.from_millisecond_durations(durations)
+
+
+def test_quantize_segments_01():
+    """
+    Quantizes segment by segment, splitting where a QEvent starts or a rest
+    sounds across a measure boundary, and stitches tempos and time signatures
+    only where they change.
+    """
+    q_event_sequence = make_q_event_sequence()
+    recorder = nauert.TimingRecorder()
+    result = nauert.quantize(
+        q_event_sequence,
+        q_schema=make_q_schema(),
+        recorder=recorder,
+        segment_duration_in_ms=1,
+    )
+    stages = [_[0] for _ in recorder.stage_records]
+    assert stages == ["make_segments", "handle_jobs", "stitch"]
+    records = dict((_[0], _[-1]) for _ in recorder.stage_records)
+    assert 1 < records["stitch"]
+    expected = nauert.quantize(q_event_sequence, q_schema=make_q_schema())
+    assert abjad.lilypond(result) == abjad.lilypond(expected)
+
+
+def test_quantize_segments_02():
+    """
+    Quantizes beatwise segments in parallel.
+    """
+    q_event_sequence = make_q_event_sequence()
+    q_schema = nauert.BeatwiseQSchema(search_tree=search_tree)
+    result = nauert.quantize(
+        q_event_sequence,
+        q_schema=q_schema,
+        job_handler=nauert.ParallelJobHandler(),
+        grace_handler=nauert.CollapsingGraceHandler(),
+        segment_duration_in_ms=4000,
+    )
+    q_schema = nauert.BeatwiseQSchema(search_tree=search_tree)
+    expected = nauert.quantize(
+        q_event_sequence,
+        q_schema=q_schema,
+        grace_handler=nauert.CollapsingGraceHandler(),
+    )
+    assert abjad.lilypond(result) == abjad.lilypond(expected)
+
+
+def test_quantize_segments_03():
+    """
+    Splits at boundaries where a QEvent starts, unless a QEvent lies in the
+    second half of the preceding beat.
+    """
+    durations = [1000, 3000, 1500, 2500, 1000]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    q_schema = nauert.MeasurewiseQSchema()
+    q_target = q_schema(q_event_sequence.duration_in_ms)
+    jobs = q_target._make_segment_jobs(
+        q_event_sequence,
+        1,
+        grace_handler=nauert.ConcatenatingGraceHandler(),
+        heuristic=nauert.DistanceHeuristic(),
+        attack_point_optimizer=nauert.NaiveAttackPointOptimizer(),
+    )
+    assert len(jobs) == 3
+    assert jobs[1].q_event_sequence[0].offset == 4000
+    assert jobs[2].q_event_sequence[0].offset == 8000
+    durations = [1000, 2800, 1200, 4000]
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations(durations)
+    q_target = q_schema(q_event_sequence.duration_in_ms)
+    jobs = q_target._make_segment_jobs(
+        q_event_sequence,
+        1,
+        grace_handler=nauert.ConcatenatingGraceHandler(),
+        heuristic=nauert.DistanceHeuristic(),
+        attack_point_optimizer=nauert.NaiveAttackPointOptimizer(),
+    )
+    assert len(jobs) == 1
+
+
+def test_quantize_segments_04():
+    """
+    Quantization segment jobs keep their notation when pickled.
+    """
+    q_event_sequence = nauert.QEventSequence.from_millisecond_durations([1000] * 4)
+    q_target = nauert.MeasurewiseQSchema()(q_event_sequence.duration_in_ms)
+    job = nauert.QuantizationSegmentJob(0, q_target, q_event_sequence)
+    assert job.notation is None
+    job()
+    job = pickle.loads(pickle.dumps(job))
+    assert abjad.lilypond(job.notation) == abjad.lilypond(
+        nauert.quantize(q_event_sequence)
+    )